@@ -0,0 +1,71 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:49
+
+from itertools import islice
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Max, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_author_stats(apps, schema_editor):
+    """
+    Give every existing author a stats row; new authors get one from a
+    signal. Same numbers as `blogs.stats.rebuild_author_stats`, computed
+    with the historical models.
+    """
+    AuthorProfile = apps.get_model("accounts", "AuthorProfile")
+    AuthorStats = apps.get_model("accounts", "AuthorStats")
+    Post = apps.get_model("blogs", "Post")
+    Comment = apps.get_model("blogs", "Comment")
+
+    published = Q(status="published")
+    posts = Post.objects.filter(author=OuterRef("pk")).order_by().values("author")
+    comments = Comment.objects.filter(post__author=OuterRef("pk")).order_by().values("post__author")
+    authors = AuthorProfile.objects.order_by("pk").annotate(
+        published_posts=Coalesce(Subquery(posts.annotate(n=Count("pk", filter=published)).values("n")), 0),
+        total_views=Coalesce(Subquery(posts.annotate(n=Sum("views_count")).values("n")), 0),
+        last_published_at=Subquery(posts.annotate(n=Max("published_at", filter=published)).values("n")),
+        total_comments=Coalesce(Subquery(comments.annotate(n=Count("pk")).values("n")), 0),
+    ).values_list("pk", "published_posts", "total_views", "total_comments", "last_published_at")
+
+    rows = authors.iterator(chunk_size=1000)
+    while batch := list(islice(rows, 1000)):
+        AuthorStats.objects.bulk_create([
+            AuthorStats(
+                author_id=pk,
+                published_posts=published_posts,
+                total_views=total_views,
+                total_comments=total_comments,
+                last_published_at=last_published_at,
+            )
+            for pk, published_posts, total_views, total_comments, last_published_at in batch
+        ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0010_remove_readerprofile_favorite_posts'),
+        # The backfill counts posts and comments.
+        ('blogs', '0007_post_published_partial_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuthorStats',
+            fields=[
+                ('author', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='accounts.authorprofile')),
+                ('published_posts', models.PositiveIntegerField(default=0)),
+                ('total_views', models.PositiveBigIntegerField(default=0, help_text="Views across all of the author's posts.")),
+                ('total_comments', models.PositiveIntegerField(default=0, help_text="Comments on the author's posts.")),
+                ('last_published_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Author stats',
+                'indexes': [models.Index(fields=['-total_views'], name='author_stats_views_idx'), models.Index(fields=['-last_published_at'], name='author_stats_last_pub_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_author_stats, migrations.RunPython.noop),
+    ]
@@ -102,8 +102,40 @@ class AuthorProfile(models.Model):
 
     def __str__(self):
         return f"Author: {self.user.username}"
-    
-    
+
+
+class AuthorStats(models.Model):
+    """
+    Per-author rollup of post and comment activity.
+    Maintained incrementally by the signals in `blogs.signals` and fully
+    rebuilt by the `reconcile_author_stats` command, so author listings can
+    show and sort by these numbers without aggregating posts and comments.
+    """
+
+    author = models.OneToOneField(
+        AuthorProfile,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="stats"
+    )
+    published_posts = models.PositiveIntegerField(default=0)
+    total_views = models.PositiveBigIntegerField(default=0, help_text="Views across all of the author's posts.")
+    total_comments = models.PositiveIntegerField(default=0, help_text="Comments on the author's posts.")
+    last_published_at = models.DateTimeField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "Author stats"
+        indexes = [
+            # Author directory sorted by popularity
+            models.Index(fields=["-total_views"], name="author_stats_views_idx"),
+            models.Index(fields=["-last_published_at"], name="author_stats_last_pub_idx"),
+        ]
+
+    def __str__(self):
+        return f"Stats: {self.author}"
+
+
 class ReaderProfile(models.Model):
     """
     Profile for normal readers.
@@ -0,0 +1,20 @@
+from django.apps import apps
+from django.conf import settings
+
+from jobs.queue import job
+from utils.images import downscale
+
+
+@job("accounts.optimize_profile_image")
+def optimize_profile_image(model, pk):
+    """
+    Shrink an uploaded profile image of an author or reader profile
+    (`model` is e.g. "accounts.AuthorProfile") to the size pages display.
+    """
+    profile = apps.get_model(model).objects.filter(pk=pk).first()
+    if profile is None or not profile.profile_image:
+        return
+
+    name = downscale(profile.profile_image, settings.PROFILE_IMAGE_MAX_SIZE)
+    if name and name != profile.profile_image.name:
+        type(profile).objects.filter(pk=pk).update(profile_image=name)
@@ -9,6 +9,8 @@ from django.shortcuts import render, redirect
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views import View
 from django.http import Http404
+from jobs.queue import enqueue
+from .tasks import optimize_profile_image
 
 
 class UserLoginView(LoginView):
@@ -162,6 +164,8 @@ class UserProfileView(LoginRequiredMixin, View):
                 author_profile.profile_image = request.FILES["profile_image"]
 
             author_profile.save()
+            if "profile_image" in request.FILES:
+                enqueue(optimize_profile_image, "accounts.AuthorProfile", author_profile.pk)
 
         elif hasattr(user, "readerprofile"):
             reader_profile = user.readerprofile
@@ -172,6 +176,8 @@ class UserProfileView(LoginRequiredMixin, View):
                 reader_profile.profile_image = request.FILES["profile_image"]
 
             reader_profile.save()
+            if "profile_image" in request.FILES:
+                enqueue(optimize_profile_image, "accounts.ReaderProfile", reader_profile.pk)
 
         return redirect("profile")
 
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('blogs', '0010_trending'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyViews',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('hours', models.BinaryField(blank=True, default=bytes)),
+                ('post', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='daily_views', to='blogs.post')),
+            ],
+            options={
+                'verbose_name_plural': 'Daily views',
+                'indexes': [models.Index(fields=['day'], name='daily_views_day_idx')],
+                'constraints': [models.UniqueConstraint(fields=('post', 'day'), name='daily_views_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ViewMinute',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('minute', models.DateTimeField(db_index=True)),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('post', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='blogs.post')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('post', 'minute'), name='view_minute_unique')],
+            },
+        ),
+    ]
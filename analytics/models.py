@@ -0,0 +1,58 @@
+from django.db import models
+
+
+class ViewMinute(models.Model):
+    """
+    Views of a post in one minute, waiting to be compacted into the post's
+    `DailyViews` row by `analytics.series.compact`.
+    """
+
+    post = models.ForeignKey(
+        "blogs.Post",
+        on_delete=models.CASCADE,
+        related_name="+",
+        db_index=False,  # covered by the (post, minute) constraint below
+    )
+    minute = models.DateTimeField(db_index=True)
+    views = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["post", "minute"], name="view_minute_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.post_id} @ {self.minute:%Y-%m-%d %H:%M}"
+
+
+class DailyViews(models.Model):
+    """
+    Views of a post on one day (UTC): the day's total, and its 24 hourly
+    counts packed into 96 bytes (see `analytics.series.pack`). The hourly
+    counts are dropped after ANALYTICS_HOURLY_RETENTION_DAYS and the row
+    after ANALYTICS_RETENTION_DAYS.
+    """
+
+    post = models.ForeignKey(
+        "blogs.Post",
+        on_delete=models.CASCADE,
+        related_name="daily_views",
+        db_index=False,  # covered by the (post, day) constraint below
+    )
+    day = models.DateField()
+    total = models.PositiveIntegerField(default=0)
+    hours = models.BinaryField(default=bytes, blank=True)
+
+    class Meta:
+        verbose_name_plural = "Daily views"
+        constraints = [
+            # Also the index of every range read
+            models.UniqueConstraint(fields=["post", "day"], name="daily_views_unique"),
+        ]
+        indexes = [
+            # Retention
+            models.Index(fields=["day"], name="daily_views_day_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.post_id} @ {self.day}"
@@ -0,0 +1,164 @@
+import struct
+from collections import defaultdict
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from jobs.queue import enqueue, job
+from .models import DailyViews, ViewMinute
+
+
+HOURS = struct.Struct("<24I")
+DELETE_BATCH = 500
+
+
+def pack(counts):
+    """Pack 24 hourly counts as little-endian unsigned 32-bit integers."""
+    return HOURS.pack(*counts)
+
+
+def unpack(data):
+    """The 24 hourly counts of a packed row; zeros when there are none (yet, or any more)."""
+    return list(HOURS.unpack(bytes(data))) if data else [0] * 24
+
+
+def record(post_id, views=1):
+    """
+    Add views to the post's bucket for the current minute: one UPDATE, or
+    an INSERT for the minute's first view, which also makes sure a
+    compaction is queued.
+    """
+    minute = timezone.now().replace(second=0, microsecond=0)
+    bucket = ViewMinute.objects.filter(post_id=post_id, minute=minute)
+    if bucket.update(views=F("views") + views):
+        return
+    try:
+        with transaction.atomic():
+            ViewMinute.objects.create(post_id=post_id, minute=minute, views=views)
+    except IntegrityError:
+        # Created by a concurrent view in the meantime.
+        bucket.update(views=F("views") + views)
+    schedule_compaction()
+
+
+def compact(now=None):
+    """
+    Fold the minute buckets of past minutes into the daily rows, then drop
+    what is older than the retention periods. Returns how many buckets were
+    compacted.
+    """
+    now = now or timezone.now()
+    cutoff = now.replace(second=0, microsecond=0)
+
+    with transaction.atomic():
+        # Locked, so a late view can't be added to a bucket after it was read.
+        minutes = list(
+            ViewMinute.objects.select_for_update()
+            .filter(minute__lt=cutoff)
+            .values_list("pk", "post_id", "minute", "views")
+        )
+        counts = defaultdict(lambda: [0] * 24)
+        for _, post_id, minute, views in minutes:
+            counts[post_id, minute.date()][minute.hour] += views
+
+        if counts:
+            merge(counts)
+        pks = [pk for pk, *_ in minutes]
+        for start in range(0, len(pks), DELETE_BATCH):
+            ViewMinute.objects.filter(pk__in=pks[start:start + DELETE_BATCH]).delete()
+
+    today = now.date()
+    hourly_days = getattr(settings, "ANALYTICS_HOURLY_RETENTION_DAYS", 90)
+    DailyViews.objects.filter(day__lt=today - timedelta(days=hourly_days)).exclude(hours=b"").update(hours=b"")
+    retention = getattr(settings, "ANALYTICS_RETENTION_DAYS", None)
+    if retention is not None:
+        DailyViews.objects.filter(day__lt=today - timedelta(days=retention)).delete()
+    return len(minutes)
+
+
+def merge(counts):
+    """Add `{(post id, day): hourly counts}` to the daily rows, creating missing ones."""
+    rows = DailyViews.objects.select_for_update().filter(
+        post_id__in={post_id for post_id, _ in counts}, day__in={day for _, day in counts}
+    )
+    existing = {(row.post_id, row.day): row for row in rows}
+
+    changed, created = [], []
+    for (post_id, day), hours in counts.items():
+        row = existing.get((post_id, day))
+        if row is None:
+            created.append(DailyViews(post_id=post_id, day=day, total=sum(hours), hours=pack(hours)))
+            continue
+        merged = [old + new for old, new in zip(unpack(row.hours), hours)]
+        row.hours, row.total = pack(merged), row.total + sum(hours)
+        changed.append(row)
+
+    DailyViews.objects.bulk_update(changed, ["hours", "total"])
+    DailyViews.objects.bulk_create(created)
+
+
+@job("analytics.compact_views")
+def compact_views():
+    """
+    Compact the minute buckets, and come back while new views keep
+    arriving after the current minute.
+    """
+    compact()
+    if ViewMinute.objects.exists():
+        schedule_compaction()
+
+
+def schedule_compaction():
+    """Queue a compaction ANALYTICS_COMPACT_INTERVAL seconds from now, unless one is queued already."""
+    delay = timedelta(seconds=getattr(settings, "ANALYTICS_COMPACT_INTERVAL", 60))
+    enqueue(compact_views, dedupe_key="analytics-compact", run_at=timezone.now() + delay)
+
+
+def check_range(start, end, resolution="day"):
+    """
+    Raise ValueError for a range `views()` should not answer: reversed,
+    longer than ANALYTICS_MAX_DAYS (ANALYTICS_MAX_HOURLY_DAYS hourly), or
+    hourly before the hourly counts were dropped.
+    """
+    if start > end:
+        raise ValueError("The start date is after the end date.")
+    if resolution == "hour":
+        limit = getattr(settings, "ANALYTICS_MAX_HOURLY_DAYS", 31)
+        kept = getattr(settings, "ANALYTICS_HOURLY_RETENTION_DAYS", 90)
+        if start < timezone.now().date() - timedelta(days=kept):
+            raise ValueError(f"Hourly views are only kept for {kept} days.")
+    else:
+        limit = getattr(settings, "ANALYTICS_MAX_DAYS", 731)
+    if (end - start).days >= limit:
+        raise ValueError(f"At most {limit} days can be shown at once.")
+
+
+def views(post_id, start, end, resolution="day"):
+    """
+    Views of a post from day `start` to `end` (inclusive, UTC) as a list of
+    `(day, views)`, or `(hour, views)` with `resolution="hour"`, with zeros
+    where there were none.
+
+    One range read on the (post, day) index; views of the last
+    ANALYTICS_COMPACT_INTERVAL seconds are not compacted yet and not included.
+    """
+    rows = {
+        day: (total, hours)
+        for day, total, hours in DailyViews.objects.filter(post_id=post_id, day__range=(start, end))
+        .values_list("day", "total", "hours")
+    }
+
+    points = []
+    day = start
+    while day <= end:
+        total, hours = rows.get(day, (0, b""))
+        if resolution == "hour":
+            midnight = datetime.combine(day, time.min, tzinfo=dt_timezone.utc)
+            points += [(midnight + timedelta(hours=hour), count) for hour, count in enumerate(unpack(hours))]
+        else:
+            points.append((day, total))
+        day += timedelta(days=1)
+    return points
@@ -0,0 +1,115 @@
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from analytics import series
+from analytics.models import DailyViews, ViewMinute
+from blogs.models import Post
+from jobs.models import Job
+
+
+def at(day, hour, minute=0):
+    return datetime(day.year, day.month, day.day, hour, minute, tzinfo=dt_timezone.utc)
+
+
+@pytest.mark.django_db
+class TestViewSeries:
+    """Test suite for minute buckets, daily rollups and range reads of post views."""
+
+    @pytest.fixture
+    def post(self, author):
+        return Post.objects.create(author=author, title="Charted", content="Text", status=Post.Status.PUBLISHED)
+
+    def bucket(self, post, minute, views):
+        ViewMinute.objects.create(post=post, minute=minute, views=views)
+
+    def test_hourly_counts_pack_into_96_bytes(self):
+        counts = list(range(24))
+        assert len(series.pack(counts)) == 96
+        assert series.unpack(series.pack(counts)) == counts
+        assert series.unpack(b"") == [0] * 24
+
+    def test_views_are_counted_per_minute(self, client, post, run_jobs):
+        client.get(reverse("post-detail", kwargs={"slug": post.slug}))
+        client.get(reverse("post-detail", kwargs={"slug": post.slug}))
+        run_jobs()
+
+        bucket = ViewMinute.objects.get(post=post)
+        assert bucket.views == 2
+        assert Job.objects.get(name="analytics.compact_views").run_at > timezone.now()
+
+    def test_compaction_rolls_minutes_into_days(self, post):
+        day = date(2025, 3, 1)
+        self.bucket(post, at(day, 9, 5), 3)
+        self.bucket(post, at(day, 9, 40), 2)
+        self.bucket(post, at(day, 23, 59), 1)
+        self.bucket(post, at(day + timedelta(days=1), 0, 0), 4)
+        DailyViews.objects.create(post=post, day=day, total=10, hours=series.pack([10] + [0] * 23))
+        now = at(day + timedelta(days=1), 0, 0)  # that minute is still being counted
+
+        assert series.compact(now) == 3
+        row = DailyViews.objects.get(post=post, day=day)
+        hours = series.unpack(row.hours)
+        assert (row.total, hours[0], hours[9], hours[23]) == (16, 10, 5, 1)
+        assert list(ViewMinute.objects.values_list("views", flat=True)) == [4]
+
+    def test_retention(self, settings, post):
+        settings.ANALYTICS_HOURLY_RETENTION_DAYS = 10
+        settings.ANALYTICS_RETENTION_DAYS = 100
+        today = timezone.now().date()
+        for age in (5, 50, 500):
+            DailyViews.objects.create(post=post, day=today - timedelta(days=age), total=1, hours=series.pack([1] + [0] * 23))
+
+        series.compact()
+        rows = {row.day: row for row in DailyViews.objects.all()}
+        assert set(rows) == {today - timedelta(days=5), today - timedelta(days=50)}
+        assert rows[today - timedelta(days=5)].hours != b""
+        assert bytes(rows[today - timedelta(days=50)].hours) == b""
+        assert rows[today - timedelta(days=50)].total == 1
+
+    def test_ranges_are_read_in_one_query(self, post, django_assert_num_queries):
+        day = date(2025, 3, 1)
+        DailyViews.objects.create(post=post, day=day, total=7, hours=series.pack([0] * 23 + [7]))
+
+        with django_assert_num_queries(1):
+            daily = series.views(post.pk, day - timedelta(days=1), day + timedelta(days=1))
+        assert daily == [(day - timedelta(days=1), 0), (day, 7), (day + timedelta(days=1), 0)]
+
+        hourly = series.views(post.pk, day, day, resolution="hour")
+        assert len(hourly) == 24 and hourly[-1] == (at(day, 23), 7)
+
+    def test_ranges_are_checked(self, settings):
+        settings.ANALYTICS_MAX_HOURLY_DAYS = 7
+        today = timezone.now().date()
+        with pytest.raises(ValueError):
+            series.check_range(today, today - timedelta(days=1))
+        with pytest.raises(ValueError):
+            series.check_range(today - timedelta(days=7), today, "hour")
+        series.check_range(today - timedelta(days=6), today, "hour")
+
+    def test_api_is_for_the_author_only(self, client, post, django_user_model):
+        today = timezone.now().date()
+        DailyViews.objects.create(post=post, day=today, total=3, hours=series.pack([3] + [0] * 23))
+        url = reverse("post-analytics-series", kwargs={"slug": post.slug})
+
+        assert client.get(url).status_code == 403
+        other = django_user_model.objects.create_user(username="other", email="other@example.com", password="x")
+        client.force_login(other)
+        assert client.get(url).status_code == 403
+
+        client.force_login(post.author.user)
+        data = client.get(url, {"start": today.isoformat(), "end": today.isoformat()}).json()
+        assert (data["total"], data["points"]) == (3, [{"time": today.isoformat(), "views": 3}])
+        assert client.get(url, {"start": "2020-01-02", "end": "2020-01-01"}).status_code == 400
+
+    def test_dashboard_chart(self, client, post):
+        today = timezone.now().date()
+        DailyViews.objects.create(post=post, day=today, total=4, hours=series.pack([4] + [0] * 23))
+        client.force_login(post.author.user)
+
+        response = client.get(reverse("post-analytics", kwargs={"slug": post.slug}))
+        assert response.context["total"] == 4
+        assert len(response.context["bars"]) == 30
+        assert response.context["bars"][-1]["height"] == 100
@@ -0,0 +1,106 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.template.loader import render_to_string
+from django.utils.cache import get_conditional_response
+
+
+CONTENT_TYPES = {
+    "json": "application/json; charset=utf-8",
+    "yaml": "application/yaml; charset=utf-8",
+}
+
+
+def generate():
+    """
+    Introspect every API view and return the OpenAPI document as JSON bytes,
+    exactly as `manage.py generate_swagger` writes it. drf_yasg is only
+    imported here, never on the startup path.
+    """
+    from drf_yasg.app_settings import swagger_settings
+    from drf_yasg.codecs import OpenAPICodecJson
+
+    generator = swagger_settings.DEFAULT_GENERATOR_CLASS(
+        info=swagger_settings.DEFAULT_INFO, url=swagger_settings.DEFAULT_API_URL
+    )
+    return OpenAPICodecJson(validators=[]).encode(generator.get_schema(request=None, public=True))
+
+
+def to_yaml(content):
+    from drf_yasg.codecs import yaml_sane_dump
+
+    return yaml_sane_dump(json.loads(content, object_pairs_hook=OrderedDict), binary=True)
+
+
+class SchemaDocuments:
+    """
+    The API schema of this build, per format.
+
+    Read from OPENAPI_SCHEMA_FILE, written at image build time by
+    `manage.py generate_swagger`, or generated on first request when there
+    is no such file. Either way the schema is introspected at most once
+    per process; the ETag is the content hash, so it changes with every
+    deploy that changes the API.
+    """
+
+    def __init__(self):
+        self.documents = {}
+        self.lock = threading.Lock()
+
+    def load(self):
+        path = Path(getattr(settings, "OPENAPI_SCHEMA_FILE", settings.BASE_DIR / "openapi.json"))
+        return path.read_bytes() if path.exists() else generate()
+
+    def document(self, content):
+        return {"content": content, "etag": f'"{hashlib.sha256(content).hexdigest()[:32]}"'}
+
+    def get(self, fmt="json"):
+        if fmt not in self.documents:
+            with self.lock:
+                if "json" not in self.documents:
+                    self.documents["json"] = self.document(self.load())
+                if fmt not in self.documents:
+                    self.documents[fmt] = self.document(to_yaml(self.documents["json"]["content"]))
+        return self.documents[fmt]
+
+    def title(self):
+        return json.loads(self.get()["content"])["info"]["title"]
+
+    def clear(self):
+        self.documents = {}
+
+
+documents = SchemaDocuments()
+
+
+def schema_view(request, format):
+    """The precomputed schema as `/swagger.json/` or `/swagger.yaml/`, with conditional GET."""
+    fmt = format.lstrip(".")
+    if fmt not in CONTENT_TYPES:
+        raise Http404
+    document = documents.get(fmt)
+    response = get_conditional_response(request, etag=document["etag"]) or HttpResponse(
+        document["content"], content_type=CONTENT_TYPES[fmt]
+    )
+    response["ETag"] = document["etag"]
+    response["Cache-Control"] = "no-cache"
+    return response
+
+
+def docs_view(request, ui):
+    """
+    Swagger UI or ReDoc. The page only loads the precomputed schema from
+    `schema-json` (the SPEC_URL settings), nothing is introspected here.
+    """
+    from drf_yasg.renderers import ReDocRenderer, SwaggerUIRenderer
+
+    renderer = {"swagger": SwaggerUIRenderer, "redoc": ReDocRenderer}[ui]()
+    context = {"request": request}
+    renderer.set_context(context)
+    context["title"] = documents.title()
+    return HttpResponse(render_to_string(renderer.template, context, request))
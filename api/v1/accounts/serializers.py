@@ -2,7 +2,7 @@ from django.contrib.auth import get_user_model
 from rest_framework import serializers
 from django.contrib.auth import authenticate
 from rest_framework_simplejwt.tokens import RefreshToken
-from accounts.models import AuthorProfile, ReaderProfile
+from accounts.models import AuthorProfile, AuthorStats, ReaderProfile
 
 User = get_user_model()
 
@@ -110,12 +110,29 @@ class LoginSerializer(serializers.Serializer):
         return attrs
 
 
+class AuthorStatsSerializer(serializers.ModelSerializer):
+    """
+    Read-only rollup of an author's posts, views and comments.
+    """
+
+    class Meta:
+        model = AuthorStats
+        fields = [
+            "published_posts",
+            "total_views",
+            "total_comments",
+            "last_published_at",
+        ]
+        read_only_fields = fields
+
+
 class AuthorProfileSerializer(serializers.ModelSerializer):
     """
     Serializer for AuthorProfile model.
     Includes nested user info and handles read-only fields like total_posts.
     """
 
+    stats = AuthorStatsSerializer(read_only=True)
     username = serializers.CharField(source="user.username", read_only=True)
     email = serializers.EmailField(source="user.email", read_only=True)
     role = serializers.CharField(source="user.role", read_only=True)
@@ -134,8 +151,9 @@ class AuthorProfileSerializer(serializers.ModelSerializer):
             "profile_image_url",
             "verified",
             "total_posts",
+            "stats",
         ]
-        read_only_fields = ["id", "username", "email", "role", "total_posts", "profile_image_url"]
+        read_only_fields = ["id", "username", "email", "role", "total_posts", "profile_image_url", "stats"]
 
     def get_profile_image_url(self, obj):
         """
@@ -1,6 +1,7 @@
-from rest_framework import generics, status
+from rest_framework import filters, generics, status
 from rest_framework.response import Response
 from django.contrib.auth import get_user_model
+from django.db.models import F
 from rest_framework.permissions import IsAuthenticated
 from accounts.models import AuthorProfile, ReaderProfile
 
@@ -23,6 +24,7 @@ class RegisterView(generics.CreateAPIView):
     queryset = User.objects.all()
     serializer_class = RegisterSerializer
     permission_classes = [IsAnonymousUser]
+    throttle_scope = "auth"
     swagger_tag = ["User Signup"]
 
 
@@ -61,6 +63,7 @@ class LoginView(generics.GenericAPIView):
 
     serializer_class = LoginSerializer
     permission_classes = [IsAnonymousUser]
+    throttle_scope = "auth"
     swagger_tag = ["User Signup"]
 
     def post(self, request, *args, **kwargs):
@@ -88,10 +91,23 @@ class LoginView(generics.GenericAPIView):
 class AuthorProfileListView(generics.ListAPIView):
     """
     List all authors. Read-only endpoint.
+    Most viewed first by default; `?ordering=` accepts any of the stats
+    fields (e.g. `-stats__last_published_at`), which are served from the
+    indexed `AuthorStats` rollup rather than aggregated per request.
     """
-    queryset = AuthorProfile.objects.all()
+    queryset = AuthorProfile.objects.select_related("user", "stats")
     serializer_class = AuthorProfileSerializer
     permission_classes = [IsAuthenticated]
+    throttle_scope = {"GET": "read"}
+    filter_backends = [filters.OrderingFilter]
+    ordering_fields = [
+        "stats__total_views",
+        "stats__published_posts",
+        "stats__total_comments",
+        "stats__last_published_at",
+    ]
+    # Authors without a stats row last, not first as PostgreSQL sorts NULLs in DESC
+    ordering = [F("stats__total_views").desc(nulls_last=True), "pk"]
 
 
 class AuthorProfileRetrieveUpdateView(generics.RetrieveUpdateAPIView):
@@ -99,9 +115,10 @@ class AuthorProfileRetrieveUpdateView(generics.RetrieveUpdateAPIView):
     Retrieve or update the author's own profile.
     Only the profile owner can update it.
     """
-    queryset = AuthorProfile.objects.all()
+    queryset = AuthorProfile.objects.select_related("user", "stats")
     serializer_class = AuthorProfileSerializer
     permission_classes = [IsAuthenticated, IsAuthorUser]
+    throttle_scope = {"GET": "read"}
     lookup_field = "id"
 
 
@@ -112,6 +129,7 @@ class ReaderProfileListView(generics.ListAPIView):
     queryset = ReaderProfile.objects.all()
     serializer_class = ReaderProfileSerializer
     permission_classes = [IsAuthenticated]
+    throttle_scope = {"GET": "read"}
 
 
 class ReaderProfileRetrieveUpdateView(generics.RetrieveUpdateAPIView):
@@ -122,4 +140,5 @@ class ReaderProfileRetrieveUpdateView(generics.RetrieveUpdateAPIView):
     queryset = ReaderProfile.objects.all()
     serializer_class = ReaderProfileSerializer
     permission_classes = [IsAuthenticated, IsReaderUser]
+    throttle_scope = {"GET": "read"}
     lookup_field = "id"
\ No newline at end of file
@@ -71,3 +71,14 @@ class IsOwnerOrAdminOrReadOnly(permissions.BasePermission):
 
         # Allow comment owners to modify their own comments
         return obj.user == request.user
+
+
+class IsPostAuthor(permissions.BasePermission):
+    """
+    Custom permission that allows only the post's author, for reads too
+    (e.g. the post's analytics).
+    """
+
+    def has_object_permission(self, request, view, obj):
+        author_profile = getattr(request.user, "authorprofile", None)
+        return author_profile is not None and obj.author_id == author_profile.pk
@@ -1,5 +1,9 @@
+from datetime import timedelta
+
+from django.utils import timezone
 from rest_framework import serializers
-from blogs.models import Category, Post, Comment
+from analytics import series
+from blogs.models import Category, Post, Comment, TrendingPost
 from api.v1.accounts.serializers import AuthorProfileSerializer
 
 
@@ -39,6 +43,8 @@ class PostSerializer(serializers.ModelSerializer):
             "title",
             "slug",
             "content",
+            "content_html",
+            "content_toc",
             "cover_image",
             "status",
             "category",
@@ -49,7 +55,9 @@ class PostSerializer(serializers.ModelSerializer):
             "updated_at",
             "published_at",
         ]
-        read_only_fields = ["slug", "views_count", "published_at", "created_at", "updated_at"]
+        read_only_fields = [
+            "slug", "content_html", "content_toc", "views_count", "published_at", "created_at", "updated_at",
+        ]
 
     def create(self, validated_data):
         """
@@ -123,3 +131,42 @@ class CommentSerializer(serializers.ModelSerializer):
             parent=parent,
             **validated_data
         )
+
+
+class TrendingPostSerializer(serializers.ModelSerializer):
+    """
+    Serializer for an entry of the trending ranking.
+    Flattens the post's listing fields next to its rank and score.
+    """
+
+    id = serializers.IntegerField(source="post.id")
+    title = serializers.CharField(source="post.title")
+    slug = serializers.SlugField(source="post.slug")
+    cover_image = serializers.ImageField(source="post.cover_image")
+    author = serializers.CharField(source="post.author.user.username")
+    views_count = serializers.IntegerField(source="post.views_count")
+    published_at = serializers.DateTimeField(source="post.published_at")
+
+    class Meta:
+        model = TrendingPost
+        fields = ["rank", "score", "id", "title", "slug", "cover_image", "author", "views_count", "published_at"]
+
+
+class AnalyticsQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the post analytics endpoint.
+    Dates are UTC and inclusive; defaults to the last 30 days, by day.
+    """
+
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    resolution = serializers.ChoiceField(choices=["day", "hour"], default="day")
+
+    def validate(self, data):
+        data.setdefault("end", timezone.now().date())
+        data.setdefault("start", data["end"] - timedelta(days=29))
+        try:
+            series.check_range(data["start"], data["end"], data["resolution"])
+        except ValueError as error:
+            raise serializers.ValidationError(str(error))
+        return data
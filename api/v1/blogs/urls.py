@@ -3,7 +3,9 @@ from .views import (
     CategoryListCreateView, 
     CategoryRetrieveUpdateDestroyView,
     PostListCreateView,
+    TrendingPostListView,
     PostDetailView,
+    PostAnalyticsView,
     CommentListCreateView, 
     CommentDetailView
     )
@@ -13,8 +15,12 @@ urlpatterns = [
     path("categories/<slug:slug>/", CategoryRetrieveUpdateDestroyView.as_view(), name="category-detail"),
     # List all posts or create a new one
     path("posts/", PostListCreateView.as_view(), name="post-list-create"),
+    # Precomputed trending ranking (before the slug route, which would match it)
+    path("posts/trending/", TrendingPostListView.as_view(), name="post-trending"),
     # Retrieve, update, or delete a specific post by its slug
     path("posts/<slug:slug>/", PostDetailView.as_view(), name="post-detail"),
+    # Views over time of a post, for its author
+    path("posts/<slug:slug>/analytics/", PostAnalyticsView.as_view(), name="post-analytics-series"),
     # List all comments for a specific post or create a new one
     path("posts/<int:post_id>/comments/", CommentListCreateView.as_view(), name="comment-list-create"),
     # Retrieve, update, or delete a specific comment by its ID
@@ -1,11 +1,16 @@
 from rest_framework import generics
+from rest_framework.response import Response
+from analytics import series
+from blogs import trending
 from blogs.models import Category, Post, Comment
-from .serializers import CategorySerializer, PostSerializer, CommentSerializer
+from .serializers import (AnalyticsQuerySerializer, CategorySerializer, PostSerializer,
+                          CommentSerializer, TrendingPostSerializer)
 from .permissions import (IsAdminOrReadOnly,
                            IsVerifiedAuthor, 
                             IsAuthorOrReadOnly,
-                             IsOwnerOrAdminOrReadOnly)
-from rest_framework.permissions import IsAuthenticatedOrReadOnly
+                             IsOwnerOrAdminOrReadOnly,
+                              IsPostAuthor)
+from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly, SAFE_METHODS
 
 
 class CategoryListCreateView(generics.ListCreateAPIView):
@@ -16,6 +21,7 @@ class CategoryListCreateView(generics.ListCreateAPIView):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsAdminOrReadOnly]
+    throttle_scope = {"GET": "read"}
 
 
 class CategoryRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
@@ -26,6 +32,7 @@ class CategoryRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsAdminOrReadOnly]
+    throttle_scope = {"GET": "read"}
     lookup_field = "slug"  # Use slug in URL for better SEO/readability
 
 
@@ -34,9 +41,22 @@ class PostListCreateView(generics.ListCreateAPIView):
     View for listing all published posts and creating new ones.
     Only verified authors can create posts.
     """
-    queryset = Post.objects.all()
+    queryset = Post.published.all()
     serializer_class = PostSerializer
     permission_classes = [IsVerifiedAuthor | IsAuthorOrReadOnly]
+    throttle_scope = {"GET": "read"}
+
+
+class TrendingPostListView(generics.ListAPIView):
+    """
+    List the trending posts, best first.
+    Served from the precomputed ranking (`blogs.trending`) in one query.
+    """
+    serializer_class = TrendingPostSerializer
+    throttle_scope = {"GET": "read"}
+
+    def get_queryset(self):
+        return trending.ranked()
 
 
 class PostDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -44,9 +64,50 @@ class PostDetailView(generics.RetrieveUpdateDestroyAPIView):
     View for retrieving, updating, or deleting a single post.
     Only the author can modify or delete their post.
     """
-    queryset = Post.objects.all()
     serializer_class = PostSerializer
     permission_classes = [IsAuthorOrReadOnly]
+    throttle_scope = {"GET": "read"}
+    lookup_field = "slug"
+
+    def get_queryset(self):
+        """
+        Readers only ever see published posts; authors can still edit or
+        delete their drafts (checked by `IsAuthorOrReadOnly`).
+        """
+        if self.request.method in SAFE_METHODS:
+            return Post.published.all()
+        return Post.objects.all()
+
+
+class PostAnalyticsView(generics.GenericAPIView):
+    """
+    Views over time of a single post, for its author only.
+    Takes `start`/`end` dates and a `day` or `hour` resolution, see
+    `AnalyticsQuerySerializer`.
+    """
+    queryset = Post.objects.only("pk", "slug", "author")
+    serializer_class = AnalyticsQuerySerializer
+    permission_classes = [IsAuthenticated, IsPostAuthor]
+    throttle_scope = {"GET": "read"}
+    lookup_field = "slug"
+    swagger_overrides = {
+        "GET": {
+            "query_serializer": AnalyticsQuerySerializer,
+            "responses": {200: "`post`, `start`, `end`, `resolution`, `total` and `points` (`time`, `views`)"},
+        },
+    }
+
+    def get(self, request, *args, **kwargs):
+        post = self.get_object()
+        query = self.get_serializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        points = series.views(post.pk, **query.validated_data)
+        return Response({
+            "post": post.slug,
+            **query.validated_data,
+            "total": sum(views for _, views in points),
+            "points": [{"time": time, "views": views} for time, views in points],
+        })
 
 
 class CommentListCreateView(generics.ListCreateAPIView):
@@ -57,6 +118,7 @@ class CommentListCreateView(generics.ListCreateAPIView):
     """
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    throttle_scope = {"GET": "read", "POST": "comment"}
     
     def get_queryset(self):
         """
@@ -83,4 +145,5 @@ class CommentDetailView(generics.RetrieveUpdateDestroyAPIView):
     queryset = Comment.objects.all().select_related("user", "post")
     serializer_class = CommentSerializer
     permission_classes = [IsOwnerOrAdminOrReadOnly]
+    throttle_scope = {"GET": "read"}
     
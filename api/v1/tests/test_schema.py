@@ -0,0 +1,56 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from api import schema
+
+
+class PrecomputedSchemaTests(TestCase):
+    """
+    Tests for serving the API schema generated once, at build time or on
+    first request.
+    """
+
+    def setUp(self):
+        schema.documents.clear()
+        self.addCleanup(schema.documents.clear)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.schema_file = Path(directory.name) / "openapi.json"
+        self.url = reverse("schema-json", kwargs={"format": ".json"})
+
+    def test_schema_is_generated_once_per_process(self):
+        with override_settings(OPENAPI_SCHEMA_FILE=self.schema_file), \
+                mock.patch.object(schema, "generate", wraps=schema.generate) as generate:
+            first = self.client.get(self.url)
+            second = self.client.get(self.url)
+
+        self.assertEqual(generate.call_count, 1)
+        self.assertEqual(first.content, second.content)
+        document = json.loads(first.content)
+        self.assertEqual(document["info"]["title"], "Codeshift Blog API")
+        self.assertIn("/blogs/posts/{slug}/analytics/", document["paths"])
+
+    def test_build_time_file_is_served_with_etag(self):
+        self.schema_file.write_bytes(b'{"info": {"title": "Built"}, "paths": {}}')
+        with override_settings(OPENAPI_SCHEMA_FILE=self.schema_file), \
+                mock.patch.object(schema, "generate") as generate:
+            response = self.client.get(self.url)
+            not_modified = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+            yaml = self.client.get(reverse("schema-json", kwargs={"format": ".yaml"}))
+            page = self.client.get(reverse("schema-swagger-ui"))
+
+        generate.assert_not_called()
+        self.assertEqual(response.content, self.schema_file.read_bytes())
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertIn(b"title: Built", yaml.content)
+        self.assertContains(page, "<title>Built</title>")
+        self.assertContains(page, self.url)
+
+    def test_unknown_format_is_not_found(self):
+        response = self.client.get(reverse("schema-json", kwargs={"format": ".xml"}))
+        self.assertEqual(response.status_code, 404)
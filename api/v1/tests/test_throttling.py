@@ -0,0 +1,120 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework.views import APIView
+
+from api.v1.throttling import (
+    AnonSlidingWindowThrottle,
+    ScopedSlidingWindowThrottle,
+    SlidingWindowThrottle,
+)
+
+
+class FixedRateThrottle(SlidingWindowThrottle):
+    scope = "test"
+    rate = "3/min"
+
+
+class SlidingWindowThrottleTests(APITestCase):
+    """
+    Unit tests for the sliding-window-counter throttle.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.view = APIView()
+        self.now = 1_000_040.0  # 20 seconds into a one-minute window
+
+    def make_request(self, method="get"):
+        request = getattr(self.factory, method)("/")
+        request.user = mock.Mock(is_authenticated=False)
+        return request
+
+    def allow(self, throttle_class=FixedRateThrottle, request=None):
+        throttle = throttle_class()
+        throttle.timer = lambda: self.now
+        return throttle, throttle.allow_request(request or self.make_request(), self.view)
+
+    def test_blocks_after_limit_within_window(self):
+        """The fourth request inside one window should be throttled."""
+        results = [self.allow()[1] for _ in range(4)]
+        self.assertEqual(results, [True, True, True, False])
+
+    def test_previous_window_is_weighted(self):
+        """Requests from the previous window count proportionally to their overlap."""
+        for _ in range(3):
+            self.allow()
+
+        # 30s into the next window half of the previous count (1.5) remains,
+        # leaving room for two more requests in the current window.
+        self.now += 70
+        results = [self.allow()[1] for _ in range(3)]
+        self.assertEqual(results, [True, True, False])
+
+    def test_storage_is_constant(self):
+        """Only two integer counters are kept per client, whatever the traffic."""
+        for _ in range(10):
+            throttle, _ = self.allow()
+
+        keys = [key for key in cache._cache if throttle.key in key]
+        self.assertEqual(len(keys), 1)
+
+    def test_wait_is_positive_when_throttled(self):
+        """A throttled client is told how long to back off."""
+        for _ in range(3):
+            self.allow()
+        throttle, allowed = self.allow()
+
+        self.assertFalse(allowed)
+        self.assertGreater(throttle.wait(), 0)
+        self.assertLessEqual(throttle.wait(), 60)
+
+    def test_rate_limit_is_recorded_on_request(self):
+        """The remaining budget is stored for the headers middleware."""
+        request = self.make_request()
+        self.allow(request=request)
+        self.assertEqual(request.rate_limit.limit, 3)
+        self.assertEqual(request.rate_limit.remaining, 2)
+
+
+class ScopedThrottleTests(APITestCase):
+    """
+    Tests for per-endpoint scopes.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+
+    def test_scope_resolves_by_method(self):
+        """A mapping scope picks the entry for the request method."""
+        view = mock.Mock(throttle_scope={"GET": "read", "POST": "comment"})
+        self.assertEqual(
+            ScopedSlidingWindowThrottle.resolve_scope(self.factory.get("/"), view), "read"
+        )
+        self.assertEqual(
+            ScopedSlidingWindowThrottle.resolve_scope(self.factory.post("/"), view), "comment"
+        )
+        self.assertIsNone(
+            ScopedSlidingWindowThrottle.resolve_scope(self.factory.delete("/"), view)
+        )
+
+    def test_scoped_views_skip_global_limit(self):
+        """Views with a scope are not counted against the global anon budget."""
+        request = self.factory.get("/")
+        request.user = mock.Mock(is_authenticated=False)
+        view = mock.Mock(throttle_scope="read")
+
+        self.assertIsNone(AnonSlidingWindowThrottle().get_cache_key(request, view))
+
+    def test_api_response_has_rate_limit_headers(self):
+        """Throttled API responses expose the remaining budget."""
+        response = self.client.get(reverse("category-list-create"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("X-RateLimit-Limit", response)
+        self.assertIn("X-RateLimit-Remaining", response)
+        self.assertIn("X-RateLimit-Reset", response)
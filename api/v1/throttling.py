@@ -0,0 +1,189 @@
+from collections import namedtuple
+
+from rest_framework.throttling import SimpleRateThrottle
+
+from monitoring.metrics import THROTTLED
+
+
+RateLimit = namedtuple("RateLimit", ["limit", "remaining", "reset"])
+
+
+class SlidingWindowThrottle(SimpleRateThrottle):
+    """
+    Constant-memory sliding-window-counter throttle.
+
+    Instead of keeping the full request history like `SimpleRateThrottle`,
+    each client has two integer counters in the cache: the current fixed
+    window and the previous one. The request count for the sliding window is
+    estimated by weighting the previous counter by how much of it still
+    overlaps the sliding window. Counters are bumped with `cache.incr`, which
+    is atomic on memcached/redis, so the cost per request is O(1) whatever
+    the rate window is.
+    """
+
+    def get_scope(self, request, view):
+        return self.scope
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+
+        return self.cache_format % {"scope": self.scope, "ident": ident}
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        current_key = f"{self.key}:{window}"
+        previous_key = f"{self.key}:{window - 1}"
+
+        counts = self.cache.get_many([previous_key, current_key])
+        self.previous = counts.get(previous_key, 0)
+        self.current = counts.get(current_key, 0)
+        self.elapsed = self.now - window * self.duration
+
+        if self.estimate() >= self.num_requests:
+            self.record(request, remaining=0)
+            THROTTLED.inc(scope=self.scope)
+            return self.throttle_failure()
+
+        # `add` is a no-op when the counter already exists, and `incr` is
+        # atomic, so concurrent workers never lose an update.
+        self.cache.add(current_key, 0, 2 * self.duration)
+        try:
+            self.current = self.cache.incr(current_key)
+        except ValueError:
+            # The key expired between `add` and `incr`.
+            self.cache.set(current_key, 1, 2 * self.duration)
+            self.current = 1
+
+        self.record(request, remaining=max(0, int(self.num_requests - self.estimate())))
+        return self.throttle_success()
+
+    def estimate(self):
+        """Return the approximate number of requests in the sliding window."""
+        weight = 1 - self.elapsed / self.duration
+        return self.previous * weight + self.current
+
+    def throttle_success(self):
+        return True
+
+    def wait(self):
+        """
+        Return the number of seconds until the estimated count drops back
+        below the limit.
+        """
+        until_next_window = self.duration - self.elapsed
+        if self.current >= self.num_requests or not self.previous:
+            # Only the next window can free capacity; after that the current
+            # counter becomes the decaying "previous" one.
+            return until_next_window + self.duration * (1 - self.num_requests / self.current)
+
+        # Solve previous * (1 - (elapsed + t) / duration) + current < limit.
+        free = (self.num_requests - self.current) / self.previous
+        return max(0, self.duration * (1 - free) - self.elapsed) + 1
+
+    def record(self, request, remaining):
+        """
+        Store the most restrictive limit seen for this request so that
+        `RateLimitHeadersMiddleware` can expose it.
+        """
+        reset = int(self.duration - self.elapsed)
+        rate_limit = RateLimit(self.num_requests, remaining, reset)
+        http_request = getattr(request, "_request", request)
+
+        existing = getattr(http_request, "rate_limit", None)
+        if existing is None or rate_limit.remaining < existing.remaining:
+            http_request.rate_limit = rate_limit
+
+
+class AnonSlidingWindowThrottle(SlidingWindowThrottle):
+    """
+    Global limit for anonymous users on views without a `throttle_scope`.
+    """
+
+    scope = "anon"
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return None
+        if ScopedSlidingWindowThrottle.resolve_scope(request, view):
+            return None
+        return super().get_cache_key(request, view)
+
+
+class UserSlidingWindowThrottle(SlidingWindowThrottle):
+    """
+    Global limit for authenticated users on views without a `throttle_scope`.
+    """
+
+    scope = "user"
+
+    def get_cache_key(self, request, view):
+        if not (request.user and request.user.is_authenticated):
+            return None
+        if ScopedSlidingWindowThrottle.resolve_scope(request, view):
+            return None
+        return super().get_cache_key(request, view)
+
+
+class ScopedSlidingWindowThrottle(SlidingWindowThrottle):
+    """
+    Per-endpoint limits.
+
+    Views opt in with a `throttle_scope` attribute, either a scope name or a
+    mapping of HTTP method to scope name (`"*"` is the fallback), e.g.
+    `{"GET": "read", "POST": "comment"}`. Scoped views are exempt from the
+    global anon/user limits so cheap reads and expensive writes get their
+    own budgets.
+    """
+
+    scope_attr = "throttle_scope"
+
+    def __init__(self):
+        # Rate is resolved per request from the view's scope.
+        pass
+
+    @classmethod
+    def resolve_scope(cls, request, view):
+        scope = getattr(view, cls.scope_attr, None)
+        if isinstance(scope, dict):
+            scope = scope.get(request.method, scope.get("*"))
+        return scope
+
+    def allow_request(self, request, view):
+        self.scope = self.resolve_scope(request, view)
+        if not self.scope:
+            return True
+
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        return super().allow_request(request, view)
+
+
+class RateLimitHeadersMiddleware:
+    """
+    Add `X-RateLimit-*` headers to responses of throttled API views.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        rate_limit = getattr(request, "rate_limit", None)
+        if rate_limit is not None:
+            response["X-RateLimit-Limit"] = str(rate_limit.limit)
+            response["X-RateLimit-Remaining"] = str(rate_limit.remaining)
+            response["X-RateLimit-Reset"] = str(rate_limit.reset)
+
+        return response
@@ -0,0 +1,10 @@
+"""
+Performance benchmarks for the main pages and API endpoints.
+
+Kept apart from the functional test suite in `pytest.ini`. Run with::
+
+    python -m benchmarks --scale 0.01 --output bench-results.json
+    python -m benchmarks --compare bench-results.json
+
+`benchmarks.startup` reports cold-start and import time instead.
+"""
@@ -0,0 +1,162 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings.bench")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.core.management import call_command  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test import Client  # noqa: E402
+
+from monitoring.queries import record_queries  # noqa: E402
+
+from . import dataset  # noqa: E402
+from .scenarios import build_scenarios  # noqa: E402
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    index = min(len(values) - 1, round(pct / 100 * (len(values) - 1)))
+    return values[index]
+
+
+def measure(client, scenario, iterations, warmup):
+    """
+    Time `iterations` requests after `warmup` untimed ones, then make one
+    extra request under tracemalloc to capture peak memory.
+
+    Query and duplicate-query counts are the maximum over the timed
+    requests, so a query that only some requests make is not missed; the
+    database time is the median.
+    """
+    for _ in range(warmup):
+        client.get(scenario.url)
+
+    latencies, queries, duplicates, db_times = [], [], [], []
+    for _ in range(iterations):
+        with record_queries() as recorder:
+            start = time.perf_counter()
+            response = client.get(scenario.url)
+            latencies.append((time.perf_counter() - start) * 1000)
+        queries.append(recorder.count)
+        duplicates.append(sum(count - 1 for count in recorder.duplicates().values()))
+        db_times.append(recorder.duration * 1000)
+
+    tracemalloc.start()
+    client.get(scenario.url)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "status": response.status_code,
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "mean_ms": round(statistics.fmean(latencies), 2),
+        "queries": max(queries),
+        "db_ms": round(statistics.median(db_times), 2),
+        "duplicate_queries": max(duplicates),
+        "response_kb": round(len(response.content) / 1024, 1),
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
+
+
+def compare(previous, current, threshold):
+    """
+    Print per-scenario deltas and return the names of scenarios whose p50
+    latency or query count regressed by more than `threshold` (a ratio).
+    """
+    regressions = []
+    print(f"{'scenario':28} {'p50 ms':>18} {'max queries':>14}")
+    for name, result in current["scenarios"].items():
+        before = previous["scenarios"].get(name)
+        if not before:
+            continue
+        print(
+            f"{name:28} {before['p50_ms']:>8} -> {result['p50_ms']:<8}"
+            f" {before['queries']:>5} -> {result['queries']:<5}"
+        )
+        slower = result["p50_ms"] > before["p50_ms"] * (1 + threshold)
+        more_queries = result["queries"] > before["queries"]
+        if slower or more_queries:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier for the dataset volumes.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--only", nargs="*", help="Run only these scenario names.")
+    parser.add_argument("--output", help="Write JSON results to this file.")
+    parser.add_argument("--compare", help="Compare against a previous JSON results file.")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed p50 slowdown ratio.")
+    args = parser.parse_args(argv)
+
+    call_command("migrate", verbosity=0)
+    if not dataset.is_seeded():
+        dataset.seed(scale=args.scale, seed=args.seed)
+
+    scenarios, users = build_scenarios()
+    results = {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "database": connection.vendor,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "scale": args.scale,
+            "iterations": args.iterations,
+            "queries": "max per request",
+        },
+        "scenarios": {},
+    }
+
+    clients = {None: Client(raise_request_exception=False)}
+    for role, user in users.items():
+        clients[role] = Client(raise_request_exception=False)
+        clients[role].force_login(user)
+
+    for scenario in scenarios:
+        if args.only and scenario.name not in args.only:
+            continue
+        result = measure(clients[scenario.login], scenario, args.iterations, args.warmup)
+        results["scenarios"][scenario.name] = result
+        print(
+            f"{scenario.name:28} [{result['status']}] p50={result['p50_ms']:>9}ms p95={result['p95_ms']:>9}ms"
+            f" max queries={result['queries']:>5} peak={result['peak_memory_kb']:>9}KB"
+        )
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+    if args.compare:
+        with open(args.compare) as fh:
+            regressions = compare(json.load(fh), results, args.threshold)
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
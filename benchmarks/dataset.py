@@ -0,0 +1,34 @@
+from django.core.management import call_command
+
+from blogs.management.commands.seed_blog import DEEP_THREAD_PREFIX
+from blogs.models import Post
+
+
+# Full-size volumes; `--scale` multiplies them.
+VOLUMES = {
+    "users": 50_000,
+    "posts": 100_000,
+    "comments": 1_000_000,
+}
+DEEP_THREAD_SIZE = 2_000
+
+
+def deep_thread_post():
+    return Post.objects.filter(slug__startswith=DEEP_THREAD_PREFIX).order_by("pk").first()
+
+
+def is_seeded():
+    return deep_thread_post() is not None
+
+
+def seed(scale=1.0, seed=42):
+    """Populate the benchmark database through the `seed_blog` command."""
+    call_command(
+        "seed_blog",
+        users=max(int(VOLUMES["users"] * scale), 20),
+        posts=max(int(VOLUMES["posts"] * scale), 20),
+        comments=max(int(VOLUMES["comments"] * scale), 100),
+        deep_threads=1,
+        deep_thread_size=DEEP_THREAD_SIZE,
+        seed=seed,
+    )
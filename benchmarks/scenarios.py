@@ -0,0 +1,43 @@
+from collections import namedtuple
+
+from django.urls import reverse
+
+from accounts.models import AuthorProfile, ReaderProfile
+from blogs.models import Category, Comment
+
+from .dataset import deep_thread_post
+
+
+# `login` is "author", "reader" or None for anonymous requests.
+Scenario = namedtuple("Scenario", ["name", "url", "login"])
+
+
+def build_scenarios():
+    """
+    Return the benchmark scenarios, resolving URLs against the seeded data.
+    """
+    deep_post = deep_thread_post()
+    category = Category.objects.order_by("id").first()
+    author = AuthorProfile.objects.order_by("-total_posts").first()
+    reader = ReaderProfile.objects.order_by("id").first()
+    comment = Comment.objects.filter(post=deep_post, parent=None).order_by("id").first()
+    home = reverse("home")
+
+    return [
+        Scenario("home", home, None),
+        Scenario("home_page_deep", f"{home}?page=500", None),
+        Scenario("home_search", f"{home}?query=latency", None),
+        Scenario("home_category", f"{home}?category={category.id}", None),
+        Scenario("post_detail_deep_thread", f"/{deep_post.slug}/", None),
+        Scenario("author_dashboard", reverse("post-list"), "author"),
+        Scenario("api_post_list", reverse("post-list-create"), None),
+        Scenario("api_post_detail", f"/api/v1/blogs/posts/{deep_post.slug}/", None),
+        Scenario("api_category_list", reverse("category-list-create"), None),
+        Scenario("api_category_detail", reverse("category-detail", kwargs={"slug": category.slug}), None),
+        Scenario("api_comment_list", reverse("comment-list-create", kwargs={"post_id": deep_post.id}), None),
+        Scenario("api_comment_detail", reverse("comment-detail", kwargs={"pk": comment.pk}), None),
+        Scenario("api_author_list", reverse("author-list"), "reader"),
+        Scenario("api_author_detail", reverse("author-detail", kwargs={"id": author.id}), "reader"),
+        Scenario("api_reader_list", reverse("reader-list"), "reader"),
+        Scenario("api_reader_detail", reverse("reader-detail", kwargs={"id": reader.id}), "reader"),
+    ], {"author": author.user, "reader": reader.user}
@@ -0,0 +1,76 @@
+"""
+Cold-start report: how long a fresh worker takes to import `core.wsgi`
+(settings, apps, URLconf and template warm-up) and which top-level
+packages the import time goes to, from `python -X importtime`.
+
+    python -m benchmarks.startup --settings core.settings.prod --runs 5
+    python -m benchmarks.startup --settings core.settings.dev core.settings.prod
+
+Every run is a new interpreter; the report shows the median wall time and
+the import-time breakdown of the median run.
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+
+
+IMPORT_TIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)")
+
+
+def run(settings_module):
+    """Start one interpreter that imports `core.wsgi`; returns (wall ms, self µs per top-level package)."""
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings_module}
+    env.setdefault("SECRET_KEY", "startup-benchmark")
+    env.setdefault("REDIS_URL", "redis://localhost:6379/0")  # not connected to on import
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import core.wsgi"],
+        env=env, capture_output=True, text=True,
+    )
+    wall = (time.perf_counter() - start) * 1000
+    if process.returncode:
+        raise SystemExit(f"{settings_module} failed to start:\n{process.stderr[-2000:]}")
+
+    packages = Counter()
+    for match in IMPORT_TIME.finditer(process.stderr):
+        packages[match[3].split(".")[0]] += int(match[1])
+    return wall, packages
+
+
+def report(settings_module, runs, top):
+    results = sorted((run(settings_module) for _ in range(runs)), key=lambda result: result[0])
+    wall, packages = results[len(results) // 2]
+    return {
+        "settings": settings_module,
+        "wall_ms": round(statistics.median(result[0] for result in results), 1),
+        "import_ms": round(sum(packages.values()) / 1000, 1),
+        "top_packages_ms": {name: round(us / 1000, 1) for name, us in packages.most_common(top)},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--settings", nargs="+", default=["core.settings.prod"])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Packages listed per settings module")
+    parser.add_argument("--output", help="Also write the report as JSON to this file")
+    args = parser.parse_args()
+
+    reports = [report(settings_module, args.runs, args.top) for settings_module in args.settings]
+    for result in reports:
+        print(f"{result['settings']}: {result['wall_ms']} ms wall, {result['import_ms']} ms importing")
+        for name, ms in result["top_packages_ms"].items():
+            print(f"  {name:28} {ms:8.1f} ms")
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(reports, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,21 @@
+from django import forms
+from django.conf import settings
 from django.contrib import admin
-from .models import Category, Post, Comment
+from django.contrib.admin.helpers import ActionForm
+from django.contrib.auth import get_permission_codename
+from django.core.exceptions import ValidationError
+from django.db.models import QuerySet
+from django.forms.models import BaseInlineFormSet
+from django.urls import reverse
+from django.utils.html import format_html
+
+from utils.admin import EstimatedCountPaginator, FullTextSearchMixin
+from . import bulk
+from .models import Category, Post, Comment, comment_search_vector, post_search_vector
+
+
+# Large columns of posts that comment lists never show
+POST_BODY = ("content", "content_html", "content_toc")
 
 
 @admin.register(Category)
@@ -17,53 +33,156 @@ class CategoryAdmin(admin.ModelAdmin):
 
 
 
+class LatestCommentsFormSet(BaseInlineFormSet):
+    """
+    Only the newest ADMIN_INLINE_COMMENTS comments of the post, so posts
+    with thousands of comments still open quickly.
+    """
+
+    def get_queryset(self):
+        if not hasattr(self, "_latest"):
+            limit = getattr(settings, "ADMIN_INLINE_COMMENTS", 20)
+            self._latest = super().get_queryset().order_by("-created_at")[:limit]
+        return self._latest
+
+
 class CommentInline(admin.TabularInline):
     """
-    Inline view for comments under a post.
-    Useful for quickly reviewing comments while editing a post.
+    Inline view for the latest comments under a post.
+    Useful for quickly moderating comments while editing a post; the
+    "All comments" link lists the rest.
     """
     model = Comment
+    formset = LatestCommentsFormSet
     extra = 0
     fields = ("user", "content", "parent", "created_at")
-    readonly_fields = ("created_at",)
+    readonly_fields = ("user", "parent", "created_at")
     show_change_link = True
 
+    def get_queryset(self, request):
+        return (
+            super().get_queryset(request)
+            .select_related("user", "parent__user", "parent__post")
+            .defer(*(f"parent__post__{field}" for field in POST_BODY))
+        )
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+class PostActionForm(ActionForm):
+    """The action bar of the post list, with the target of "Move to category"."""
+    category = forms.ModelChoiceField(Category.objects.order_by("name"), required=False, empty_label="No category")
+
 
 @admin.register(Post)
-class PostAdmin(admin.ModelAdmin):
+class PostAdmin(FullTextSearchMixin, admin.ModelAdmin):
     """
     Admin configuration for blog posts.
-    Provides filtering, search, and inline comment management.
+    Provides filtering, search, and inline comment management. On
+    PostgreSQL, search goes through the full-text index on title and
+    content (plus the author's username), and large unfiltered lists are
+    paginated with an estimated count.
+    Bulk actions run as set-based statements, see `blogs.bulk`.
     """
     list_display = ("title", "author", "status", "category", "views_count")
+    list_select_related = ("author__user", "category")
     list_filter = ("status", "category", "created_at")
     search_fields = ("title", "content", "author__user__username")
+    search_vector = staticmethod(post_search_vector)
+    full_text_fields = ("title", "content")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     prepopulated_fields = {"slug": ("title",)}
     autocomplete_fields = ("author", "category")
     inlines = [CommentInline]
-    readonly_fields = ("views_count", "published_at" , "created_at", "updated_at")
+    readonly_fields = ("views_count", "all_comments", "published_at" , "created_at", "updated_at")
     date_hierarchy = "created_at"
     ordering = ("-created_at",)
+    action_form = PostActionForm
+    actions = ("publish_posts", "unpublish_posts", "move_to_category")
 
     fieldsets = (
         ("Post Info", {"fields": ("title", "slug", "author", "status", "category")}),
         ("Content", {"fields": ("content", "cover_image")}),
-        ("Statistics", {"fields": ("views_count", )}),
+        ("Statistics", {"fields": ("views_count", "all_comments")}),
         ("Timestamps", {"fields": ("created_at", "published_at")}),
     )
 
+    @admin.display(description="Comments")
+    def all_comments(self, obj):
+        """Link to every comment of the post; the inline only shows the latest."""
+        if obj.pk is None:
+            return "-"
+        url = reverse("admin:blogs_comment_changelist")
+        return format_html('<a href="{}?post__id__exact={}">All comments</a>', url, obj.pk)
+
+    @admin.action(description="Publish selected posts", permissions=["change"])
+    def publish_posts(self, request, queryset):
+        self.message_user(request, f"{bulk.publish(queryset)} post(s) published.")
+
+    @admin.action(description="Unpublish selected posts", permissions=["change"])
+    def unpublish_posts(self, request, queryset):
+        self.message_user(request, f"{bulk.unpublish(queryset)} post(s) unpublished.")
+
+    @admin.action(description="Move selected posts to category", permissions=["change"])
+    def move_to_category(self, request, queryset):
+        try:
+            category = PostActionForm.base_fields["category"].clean(request.POST.get("category"))
+        except ValidationError:
+            self.message_user(request, "Choose an existing category.", level="error")
+            return
+        count = bulk.move_to_category(queryset, category)
+        self.message_user(request, f"{count} post(s) moved to {category or 'no category'}.")
+
+    def delete_queryset(self, request, queryset):
+        """Delete the selected posts in one pass, see `blogs.bulk.delete`."""
+        bulk.delete(queryset)
+
+    def get_deleted_objects(self, objs, request):
+        """
+        Summarize a bulk deletion by counts instead of listing every comment
+        that goes with the posts. Single posts are listed in full as usual.
+        """
+        if not isinstance(objs, QuerySet):
+            return super().get_deleted_objects(objs, request)
+        posts = [str(post) for post in objs.select_related(None).only("pk", "title")]
+        model_count = {
+            Post._meta.verbose_name_plural: len(posts),
+            Comment._meta.verbose_name_plural: Comment.objects.filter(post__in=objs).count(),
+        }
+        perms_needed = {
+            model._meta.verbose_name
+            for model in (Post, Comment)
+            if not request.user.has_perm(f"blogs.{get_permission_codename('delete', model._meta)}")
+        }
+        return posts, model_count, perms_needed, []
+
 
 @admin.register(Comment)
-class CommentAdmin(admin.ModelAdmin):
+class CommentAdmin(FullTextSearchMixin, admin.ModelAdmin):
     """
     Admin configuration for user comments.
-    Handles both top-level and nested comments.
+    Handles both top-level and nested comments. Newest first; on
+    PostgreSQL, search goes through the full-text index on content.
     """
     list_display = ("user", "post", "parent", "created_at", "short_content")
+    list_select_related = ("user", "post", "parent__user", "parent__post")
     list_filter = ("created_at",)
     search_fields = ("user__username", "content", "post__title")
+    search_vector = staticmethod(comment_search_vector)
+    full_text_fields = ("content",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    raw_id_fields = ("user", "post", "parent")
     readonly_fields = ("created_at", "updated_at")
-    ordering = ("created_at",)
+    ordering = ("-pk",)
+
+    def get_queryset(self, request):
+        # Posts are only shown by title.
+        return super().get_queryset(request).defer(
+            *(f"{relation}__{field}" for relation in ("post", "parent__post") for field in POST_BODY)
+        )
 
     def short_content(self, obj):
         """Display a short preview of comment content."""
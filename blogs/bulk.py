@@ -0,0 +1,113 @@
+from django.db import models, router, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.deletion import get_candidate_relations_to_delete
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from accounts.models import AuthorProfile
+from jobs.queue import enqueue
+from . import sitemaps, static_site
+from .feeds import invalidate_feeds
+from .models import Post
+from .signals import posts_published
+from .stats import rebuild_author_stats
+
+
+def affected(queryset):
+    """The posts of `queryset`, locked, with just what the side effects need."""
+    return list(queryset.select_related(None).select_for_update().only("pk", "author_id", "slug").order_by())
+
+
+def refresh_authors(author_ids):
+    """Recount `total_posts` and `AuthorStats` of the authors, one set-based pass for all of them."""
+    published = (
+        Post.objects.filter(author=OuterRef("pk"), status=Post.Status.PUBLISHED)
+        .order_by().values("author").annotate(n=Count("pk")).values("n")
+    )
+    AuthorProfile.objects.filter(pk__in=author_ids).update(total_posts=Coalesce(Subquery(published), 0))
+    rebuild_author_stats(author_ids)
+
+
+def changed(posts):
+    """
+    Apply what the post signals would have done for each of `posts`, once
+    for the whole set: author counters, feeds, static pages and sitemaps.
+    """
+    refresh_authors({post.author_id for post in posts})
+    transaction.on_commit(invalidate_feeds)
+    static_site.schedule(
+        {static_site.HOME_KEY, *(static_site.post_key(post.pk) for post in posts)},
+        [static_site.post_path(post) for post in posts],
+    )
+    # One post per child sitemap is enough to rebuild it.
+    buckets = {sitemaps.bucket_of(post.pk): post.pk for post in posts}
+    for bucket, post_pk in sorted(buckets.items()):
+        enqueue(sitemaps.post_changed, post_pk, dedupe_key=f"sitemaps:{sitemaps.posts_file(bucket)}")
+
+
+@transaction.atomic
+def update(queryset, **values):
+    """
+    Update the posts of `queryset` with a single UPDATE and apply the
+    side effects once. Returns the number of posts changed.
+    """
+    posts = affected(queryset)
+    if posts:
+        write(posts, **values)
+    return len(posts)
+
+
+def write(posts, **values):
+    Post.objects.filter(pk__in=[post.pk for post in posts]).update(updated_at=timezone.now(), **values)
+    changed(posts)
+
+
+@transaction.atomic
+def publish(queryset):
+    """
+    Publish the drafts of `queryset`, stamping `published_at` where it is
+    not set yet, and send `posts_published` for them.
+    """
+    posts = affected(queryset.exclude(status=Post.Status.PUBLISHED))
+    if posts:
+        write(posts, status=Post.Status.PUBLISHED, published_at=Coalesce("published_at", timezone.now()))
+        posts_published.send(sender=Post, posts=posts)
+    return len(posts)
+
+
+def unpublish(queryset):
+    """Turn the published posts of `queryset` back into drafts."""
+    return update(queryset.filter(status=Post.Status.PUBLISHED), status=Post.Status.DRAFT)
+
+
+def move_to_category(queryset, category):
+    """Move the posts of `queryset` to `category` (None for no category)."""
+    if category is None:
+        return update(queryset.filter(category__isnull=False), category=None)
+    return update(queryset.exclude(category=category), category=category)
+
+
+@transaction.atomic
+def delete(queryset):
+    """
+    Delete the posts of `queryset` with their comments and other dependent
+    rows, one DELETE per table, and apply the per-post side effects once
+    for the set. No delete signals are sent. Returns the number of posts
+    deleted.
+    """
+    posts = affected(queryset)
+    if not posts:
+        return 0
+    pks = [post.pk for post in posts]
+    using = router.db_for_write(Post)
+    # Comments (with their replies, which belong to the same posts), trending
+    # and analytics buckets, newsletter issues; none has dependents of its own.
+    for relation in get_candidate_relations_to_delete(Post._meta):
+        dependents = relation.related_model._base_manager.using(using).filter(**{f"{relation.field.name}__in": pks})
+        if relation.on_delete is models.SET_NULL:
+            dependents.update(**{relation.field.name: None})
+        else:
+            dependents._raw_delete(using)
+    Post._base_manager.using(using).filter(pk__in=pks)._raw_delete(using)
+    changed(posts)
+    return len(posts)
@@ -0,0 +1,93 @@
+import threading
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Category
+
+
+class CategoryCache:
+    """
+    Two-level cache of all categories.
+
+    L1 is an in-process snapshot of the whole (small) table, indexed by id,
+    slug and name. L2 is only a version stamp in the shared cache: every
+    lookup compares it with the snapshot's version and reloads the table
+    when another worker has invalidated it, so an edit anywhere is visible
+    everywhere on the next request at the cost of one cache GET.
+    """
+
+    version_key = "blogs:categories:version"
+
+    def __init__(self):
+        self.snapshot = None
+        self.lock = threading.Lock()
+
+    def current_version(self):
+        version = cache.get(self.version_key)
+        if version is None:
+            # First use, or the stamp was evicted: start a new version.
+            cache.add(self.version_key, uuid.uuid4().hex, None)
+            version = cache.get(self.version_key)
+        return version
+
+    def load(self):
+        version = self.current_version()
+        snapshot = self.snapshot
+        if snapshot is not None and snapshot["version"] == version:
+            return snapshot
+
+        with self.lock:
+            if self.snapshot is not None and self.snapshot["version"] == version:
+                return self.snapshot
+            # Read from the primary: a lagging replica could otherwise be
+            # cached under the new version.
+            categories = tuple(Category.objects.using("default").order_by("name"))
+            self.snapshot = {
+                "version": version,
+                "all": categories,
+                "id": {category.pk: category for category in categories},
+                "slug": {category.slug: category for category in categories},
+                "name": {category.name: category for category in categories},
+            }
+            return self.snapshot
+
+    def all(self):
+        """Return all categories ordered by name."""
+        return self.load()["all"]
+
+    def get(self, pk=None, slug=None, name=None):
+        """
+        Return the category with the given id, slug or name, or None.
+        """
+        snapshot = self.load()
+        if pk is not None:
+            try:
+                return snapshot["id"].get(int(pk))
+            except (TypeError, ValueError):
+                return None
+        if slug is not None:
+            return snapshot["slug"].get(slug)
+        if name is not None:
+            return snapshot["name"].get(name)
+        return None
+
+    def attach(self, posts):
+        """
+        Set `post.category` from the cache, saving the per-post category
+        query when a template renders it.
+        """
+        snapshot = self.load()
+        for post in posts:
+            category = snapshot["id"].get(post.category_id)
+            if category is not None:
+                post.category = category
+        return posts
+
+    def invalidate(self):
+        """Bump the shared version once the current transaction commits."""
+        transaction.on_commit(lambda: cache.set(self.version_key, uuid.uuid4().hex, None))
+
+
+category_cache = CategoryCache()
@@ -0,0 +1,11 @@
+from django.utils.functional import SimpleLazyObject
+
+from .cache import category_cache
+
+
+def categories(request):
+    """
+    Expose the cached categories as `categories` in every template.
+    Lazy, so pages that do not list categories skip the version check.
+    """
+    return {"categories": SimpleLazyObject(category_cache.all)}
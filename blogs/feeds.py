@@ -0,0 +1,171 @@
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.contrib.syndication.views import Feed
+from django.core.cache import cache
+from django.http import Http404, HttpResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.feedgenerator import Atom1Feed
+from django.utils.http import parse_http_date_safe
+from django.utils.text import Truncator
+
+from accounts.models import AuthorProfile
+from .cache import category_cache
+from .models import Post
+
+
+FEED_SIZE = 20
+FEED_VERSION_KEY = "blogs:feeds:version"
+
+
+class LatestPostsFeed(Feed):
+    """
+    Newest published posts, site-wide.
+
+    Items come from one query joining author, user and category. Post
+    bodies are deferred; the summary comes from the stored plain-text
+    excerpt.
+    """
+
+    title = "CodeShift Blog"
+    description = "Latest posts on CodeShift Blog."
+
+    def link(self):
+        return reverse("home")
+
+    def posts(self, obj):
+        return Post.published.all()
+
+    def items(self, obj):
+        return (
+            self.posts(obj)
+            .select_related("author__user", "category")
+            .defer("content", "content_html", "content_toc")
+            [:FEED_SIZE]
+        )
+
+    def item_title(self, item):
+        return item.title
+
+    def item_description(self, item):
+        return Truncator(item.excerpt).words(50)
+
+    def item_link(self, item):
+        return reverse("post-detail", kwargs={"slug": item.slug})
+
+    def item_pubdate(self, item):
+        return item.published_at
+
+    def item_updateddate(self, item):
+        return item.updated_at
+
+    def item_author_name(self, item):
+        return item.author.user.username
+
+    def item_categories(self, item):
+        return [item.category.name] if item.category else []
+
+
+class CategoryPostsFeed(LatestPostsFeed):
+    """Newest published posts of one category, looked up by slug."""
+
+    def get_object(self, request, slug):
+        category = category_cache.get(slug=slug)
+        if category is None:
+            raise Http404("Category does not exist.")
+        return category
+
+    def title(self, obj):
+        return f"CodeShift Blog: {obj.name}"
+
+    def description(self, obj):
+        return f"Latest {obj.name} posts on CodeShift Blog."
+
+    def link(self, obj):
+        return f"{reverse('home')}?category={obj.pk}"
+
+    def posts(self, obj):
+        return Post.published.filter(category_id=obj.pk)
+
+
+class AuthorPostsFeed(LatestPostsFeed):
+    """Newest published posts of one author, looked up by username."""
+
+    def get_object(self, request, username):
+        return AuthorProfile.objects.select_related("user").get(user__username=username)
+
+    def title(self, obj):
+        return f"CodeShift Blog: {obj.user.username}"
+
+    def description(self, obj):
+        return f"Latest posts by {obj.user.username} on CodeShift Blog."
+
+    def posts(self, obj):
+        return Post.published.filter(author_id=obj.pk)
+
+
+class AtomFeedMixin:
+    feed_type = Atom1Feed
+
+    def subtitle(self, obj):
+        return self._get_dynamic_attr("description", obj)
+
+
+class LatestPostsAtomFeed(AtomFeedMixin, LatestPostsFeed):
+    pass
+
+
+class CategoryPostsAtomFeed(AtomFeedMixin, CategoryPostsFeed):
+    pass
+
+
+class AuthorPostsAtomFeed(AtomFeedMixin, AuthorPostsFeed):
+    pass
+
+
+def invalidate_feeds():
+    """Start a new feed generation; every cached feed is rebuilt on next request."""
+    cache.set(FEED_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def cached_feed(feed_class):
+    """
+    Wrap a feed in a view that renders it once per feed generation.
+
+    The rendered feed is cached with its ETag and Last-Modified, and
+    conditional requests from pollers get a 304 without touching the
+    database. Post changes start a new generation, see `invalidate_feeds`.
+    """
+    feed = feed_class()
+
+    def view(request, **kwargs):
+        version = cache.get(FEED_VERSION_KEY)
+        if version is None:
+            cache.add(FEED_VERSION_KEY, uuid.uuid4().hex, None)
+            version = cache.get(FEED_VERSION_KEY)
+
+        parts = [feed_class.__name__, version, *(str(value) for value in kwargs.values())]
+        key = "blogs:feed:" + hashlib.md5(":".join(parts).encode()).hexdigest()
+        entry = cache.get(key)
+        if entry is None:
+            rendered = feed(request, **kwargs)
+            entry = {
+                "content": rendered.content,
+                "content_type": rendered["Content-Type"],
+                "etag": f'"{hashlib.md5(rendered.content).hexdigest()}"',
+                "last_modified": rendered.get("Last-Modified"),
+            }
+            cache.set(key, entry, getattr(settings, "FEED_CACHE_TIMEOUT", 60 * 60 * 24))
+
+        last_modified = entry["last_modified"] and parse_http_date_safe(entry["last_modified"])
+        not_modified = get_conditional_response(request, etag=entry["etag"], last_modified=last_modified)
+        response = not_modified or HttpResponse(entry["content"], content_type=entry["content_type"])
+        response["ETag"] = entry["etag"]
+        if entry["last_modified"]:
+            response["Last-Modified"] = entry["last_modified"]
+        response["Cache-Control"] = "no-cache"
+        return response
+
+    return view
@@ -0,0 +1,162 @@
+import asyncio
+import json
+import logging
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections
+from django.db.models import Max
+
+from monitoring.metrics import registry
+from .models import Comment
+
+
+logger = logging.getLogger("blogs.live")
+
+STREAMS = registry.gauge("codeshift_live_comment_streams", "Open live comment streams.")
+POLL_BATCH = 500
+
+
+def serialize(comment):
+    return {
+        "id": comment.pk,
+        "post_id": comment.post_id,
+        "parent_id": comment.parent_id,
+        "username": comment.user.username,
+        "profile_image": comment.user.get_profile_image,
+        "content": comment.content,
+        "created_at": comment.created_at.isoformat(),
+    }
+
+
+def comments(**filters):
+    return (
+        Comment.objects.filter(**filters)
+        .select_related("user__authorprofile", "user__readerprofile")
+        .order_by("pk")
+    )
+
+
+class CommentBroker:
+    """
+    Fans new comments out to the live comment streams of this process.
+
+    A single poller task per process asks the database for comments newer
+    than the last one it saw, every LIVE_COMMENTS_POLL_INTERVAL seconds while
+    any stream is open: one indexed query per interval, however many
+    clients are connected. The database is the shared channel, so comments
+    created by any process or server are picked up. Comments committed in
+    this process wake the poller right away (`notify`).
+    """
+
+    def __init__(self):
+        self.subscribers = defaultdict(set)
+        self.loop = None
+        self.wakeup = None
+        self.task = None
+        self.last_id = None
+
+    def subscribe(self, post_id):
+        queue = asyncio.Queue(maxsize=100)
+        self.subscribers[post_id].add(queue)
+        STREAMS.set(sum(map(len, self.subscribers.values())))
+
+        loop = asyncio.get_running_loop()
+        if self.task is None or self.task.done() or self.loop is not loop:
+            self.loop, self.wakeup = loop, asyncio.Event()
+            self.task = loop.create_task(self.poll())
+        return queue
+
+    def unsubscribe(self, post_id, queue):
+        queues = self.subscribers.get(post_id, set())
+        queues.discard(queue)
+        if not queues:
+            self.subscribers.pop(post_id, None)
+        STREAMS.set(sum(map(len, self.subscribers.values())))
+        if not self.subscribers and self.wakeup is not None:
+            self.wakeup.set()  # let the poller exit
+
+    def notify(self):
+        """Wake the poller; safe to call from any thread."""
+        loop, wakeup = self.loop, self.wakeup
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(wakeup.set)
+
+    async def poll(self):
+        interval = getattr(settings, "LIVE_COMMENTS_POLL_INTERVAL", 2)
+        self.last_id = await latest_comment_id()
+        while self.subscribers:
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), interval)
+            except TimeoutError:
+                pass
+            self.wakeup.clear()
+
+            try:
+                new = await fetch(self.last_id)
+            except DatabaseError:
+                logger.exception("Could not poll for new comments")
+                continue
+            for comment in new:
+                self.last_id = comment["id"]
+                for queue in list(self.subscribers.get(comment["post_id"], ())):
+                    try:
+                        queue.put_nowait(comment)
+                    except asyncio.QueueFull:
+                        # A stalled client; it catches up from its last event id on reconnect.
+                        pass
+        self.last_id = None
+
+
+@sync_to_async
+def latest_comment_id():
+    return Comment.objects.aggregate(last=Max("pk"))["last"] or 0
+
+
+@sync_to_async
+def fetch(after):
+    close_old_connections()
+    return [serialize(comment) for comment in comments(pk__gt=after)[:POLL_BATCH]]
+
+
+@sync_to_async
+def missed(post_id, after):
+    return [serialize(comment) for comment in comments(post_id=post_id, pk__gt=after)[:POLL_BATCH]]
+
+
+broker = CommentBroker()
+
+
+def event(comment):
+    return f"id: {comment['id']}\nevent: comment\ndata: {json.dumps(comment)}\n\n"
+
+
+async def stream(post_id, after=None):
+    """
+    Server-sent events for one post: comments after `after` (what the page
+    or the last connection already had), then new comments as they arrive.
+    Idle streams are kept open with a comment line every
+    LIVE_COMMENTS_KEEPALIVE seconds.
+    """
+    keepalive = getattr(settings, "LIVE_COMMENTS_KEEPALIVE", 15)
+    queue = broker.subscribe(post_id)
+    sent = after or 0
+    try:
+        yield "retry: 3000\n\n"
+        if after is not None:
+            for comment in await missed(post_id, after):
+                sent = comment["id"]
+                yield event(comment)
+
+        while True:
+            try:
+                comment = await asyncio.wait_for(queue.get(), keepalive)
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if comment["id"] > sent:
+                sent = comment["id"]
+                yield event(comment)
+    finally:
+        broker.unsubscribe(post_id, queue)
@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from blogs import sitemaps
+from monitoring.metrics import timed
+
+
+class Command(BaseCommand):
+    """
+    Rebuild every sitemap file under `SITEMAP_ROOT`.
+
+    Only needed once, or to repair the files; afterwards signals rebuild
+    the affected child sitemap and the index after each post change.
+    """
+
+    help = "Generate the sitemap index and child sitemaps."
+
+    @timed("command", "build_sitemaps")
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        sitemaps.build_all()
+        self.stdout.write(self.style.SUCCESS(
+            f"Sitemaps written to {sitemaps.root()} in {time.perf_counter() - started:.1f}s"
+        ))
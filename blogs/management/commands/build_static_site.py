@@ -0,0 +1,85 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.models import Max, Min
+
+from blogs import static_site
+from blogs.models import Post, StaticPage
+from monitoring.metrics import timed
+
+
+def build_range(start, stop):
+    """
+    Write the pages of published posts with `start <= pk < stop`; runs in a
+    worker process. Returns their dependencies for the parent to record, so
+    workers never contend for database writes.
+    """
+    pages = {}
+    for post in Post.published.filter(pk__gte=start, pk__lt=stop).only("pk", "slug"):
+        path = static_site.post_path(post)
+        rendered = static_site.render_page(path)
+        if rendered is not None:
+            static_site.write_file(path, rendered[0])
+            pages[path] = rendered[1]
+    return pages
+
+
+class Command(BaseCommand):
+    """
+    Render every published post and the homepage to `STATIC_SITE_ROOT`.
+
+    Posts are split into primary key ranges rendered in parallel by a pool
+    of worker processes. Pages left over from posts that are no longer
+    published are removed. Signals keep the pages current afterwards.
+    """
+
+    help = "Pre-render the static post and home pages for anonymous visitors."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("--chunk-size", type=int, default=200, help="Primary keys per task.")
+
+    @timed("command", "build_static_site")
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        chunk_size = options["chunk_size"]
+
+        bounds = Post.published.aggregate(first=Min("pk"), last=Max("pk"))
+        ranges = []
+        if bounds["first"] is not None:
+            ranges = [
+                (start, start + chunk_size)
+                for start in range(bounds["first"], bounds["last"] + 1, chunk_size)
+            ]
+
+        if options["workers"] <= 1:
+            built = self.record(build_range(*args) for args in ranges)
+        else:
+            # Forked workers must not share the parent's connections.
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=options["workers"], initializer=django.setup) as pool:
+                built = self.record(pool.map(build_range, *zip(*ranges)) if ranges else [])
+
+        static_site.build(static_site.HOME)
+        built.add(static_site.HOME)
+
+        stale = set(StaticPage.objects.values_list("path", flat=True)) - built
+        for path in stale:
+            static_site.remove_page(path)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Built {len(built)} pages, removed {len(stale)} in {time.perf_counter() - started:.1f}s"
+        ))
+
+    def record(self, results):
+        """Record the pages of each finished range; returns all built paths."""
+        built = set()
+        for pages in results:
+            if pages:
+                static_site.record_pages(pages)
+            built.update(pages)
+        return built
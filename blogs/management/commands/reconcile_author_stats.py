@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from blogs.stats import rebuild_author_stats
+from monitoring.metrics import timed
+
+
+class Command(BaseCommand):
+    """
+    Rebuild `AuthorStats` from posts and comments.
+
+    The rollup is kept up to date incrementally by signals; run this
+    periodically (e.g. nightly from cron) to repair any drift from bulk
+    updates, raw SQL or failed transactions, and once after deploying the
+    table.
+    """
+
+    help = "Recompute per-author post, view and comment statistics."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--author", type=int, action="append", dest="authors", help="Only this author id (repeatable).")
+        parser.add_argument("--batch-size", type=int, default=1_000)
+
+    @timed("command", "reconcile_author_stats")
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        done = rebuild_author_stats(options["authors"], batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Reconciled stats for {done} authors in {time.perf_counter() - started:.1f}s"
+        ))
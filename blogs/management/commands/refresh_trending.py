@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from blogs.models import TrendingPost
+from blogs.trending import refresh_trending
+from monitoring.metrics import timed
+
+
+class Command(BaseCommand):
+    """
+    Recompute the trending ranking now.
+
+    Workers refresh it on their own while posts get views or comments;
+    this is for the first deploy, or to apply changed TRENDING_* settings.
+    """
+
+    help = "Recompute the trending posts ranking."
+
+    @timed("command", "refresh_trending")
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        refresh_trending()
+        self.stdout.write(self.style.SUCCESS(
+            f"Ranked {TrendingPost.objects.count()} trending posts in {time.perf_counter() - started:.1f}s"
+        ))
@@ -0,0 +1,76 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.models import Max, Min
+
+from blogs.models import Post
+from blogs.rendering import RENDERER_VERSION
+from monitoring.metrics import timed
+
+
+def stale_posts(force=False):
+    posts = Post.objects.all()
+    if not force:
+        posts = posts.exclude(render_version=RENDERER_VERSION)
+    return posts
+
+
+def render_range(start, stop, force=False):
+    """
+    Re-render the stale posts with `start <= pk < stop`; runs in a worker
+    process. Writes only the rendered columns, so `updated_at` and the
+    post signals are left alone.
+    """
+    posts = list(stale_posts(force).filter(pk__gte=start, pk__lt=stop).only("pk", "content"))
+    for post in posts:
+        post.render_content(force=True)
+    Post.objects.bulk_update(posts, Post.RENDERED_FIELDS)
+    return len(posts)
+
+
+class Command(BaseCommand):
+    """
+    Re-render the stored HTML of posts rendered by an older renderer.
+
+    Run after bumping `blogs.rendering.RENDERER_VERSION`. The primary key
+    range is split into chunks that are rendered in parallel by a pool of
+    worker processes, each with its own database connection.
+    """
+
+    help = "Re-render post markdown to HTML after a renderer change."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("--chunk-size", type=int, default=500, help="Primary keys per task.")
+        parser.add_argument("--all", action="store_true", dest="force", help="Re-render every post.")
+
+    @timed("command", "render_posts")
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        force, chunk_size = options["force"], options["chunk_size"]
+
+        bounds = stale_posts(force).aggregate(first=Min("pk"), last=Max("pk"))
+        if bounds["first"] is None:
+            self.stdout.write("All posts are up to date.")
+            return
+
+        ranges = [
+            (start, start + chunk_size, force)
+            for start in range(bounds["first"], bounds["last"] + 1, chunk_size)
+        ]
+
+        if options["workers"] <= 1:
+            done = sum(render_range(*args) for args in ranges)
+        else:
+            # Forked workers must not share the parent's connections.
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=options["workers"], initializer=django.setup) as pool:
+                done = sum(pool.map(render_range, *zip(*ranges)))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Rendered {done} posts in {time.perf_counter() - started:.1f}s"
+        ))
@@ -0,0 +1,234 @@
+import random
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Count, F, Max, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.text import slugify
+
+from accounts.models import AuthorProfile, ReaderProfile, User
+from blogs.models import Category, Comment, Post
+from blogs.stats import rebuild_author_stats
+from monitoring.metrics import timed
+
+
+DEEP_THREAD_PREFIX = "deep-thread-"
+SEED_PASSWORD = "seedpass123"
+
+CATEGORY_NAMES = [
+    "Tech", "Life", "Music", "Nature", "Cars", "Travel", "Food", "Science",
+    "Sports", "Books", "Movies", "Health", "Design", "Business", "History",
+]
+WORDS = (
+    "the a of and to in is it that for on with as was at by an be this are "
+    "django python query index cache latency thread comment author reader "
+    "database page render template view request response model signal "
+    "server client worker queue deploy release feature design pattern "
+    "music travel nature science story history health garden coffee city"
+).split()
+
+
+def next_pk(model):
+    """Return the first primary key after the current maximum."""
+    return (model.objects.aggregate(top=Max("pk"))["top"] or 0) + 1
+
+
+class Command(BaseCommand):
+    """
+    Generate a large, realistic dataset for load and performance testing.
+
+    Rows are written with `bulk_create` in batches and explicit primary keys,
+    so parents can be referenced before the database hands back any ids and
+    no per-row `save()`, slug lookup or signal runs. All fake users share one
+    pre-hashed password. Denormalized counters are reconciled once at the
+    end. The same `--seed` always produces the same data.
+    """
+
+    help = "Bulk-generate authors, readers, categories, posts and comment threads."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1_000)
+        parser.add_argument("--author-ratio", type=float, default=0.05)
+        parser.add_argument("--categories", type=int, default=10)
+        parser.add_argument("--posts", type=int, default=5_000)
+        parser.add_argument("--comments", type=int, default=50_000)
+        parser.add_argument("--max-depth", type=int, default=6, help="Deepest reply nesting level.")
+        parser.add_argument("--deep-threads", type=int, default=1, help="Posts with one very large, deep thread.")
+        parser.add_argument("--deep-thread-size", type=int, default=2_000)
+        parser.add_argument("--batch-size", type=int, default=5_000)
+        parser.add_argument("--seed", type=int, default=42)
+
+    @timed("command", "seed_blog")
+    def handle(self, *args, **options):
+        self.rng = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.now = timezone.now()
+        started = time.perf_counter()
+
+        authors, user_ids = self.create_users(options["users"], options["author_ratio"])
+        categories = self.create_categories(options["categories"])
+        post_ids, deep_ids = self.create_posts(options["posts"], options["deep_threads"], authors, categories)
+        self.create_comments(
+            post_ids, deep_ids, user_ids,
+            options["comments"], options["deep_thread_size"], options["max_depth"],
+        )
+        self.reconcile()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeding finished in {time.perf_counter() - started:.1f}s"
+        ))
+
+    def bulk_insert(self, model, rows):
+        """Insert an iterable of unsaved instances in batches."""
+        batch, total = [], 0
+        with transaction.atomic():
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    model.objects.bulk_create(batch)
+                    total += len(batch)
+                    batch = []
+            if batch:
+                model.objects.bulk_create(batch)
+                total += len(batch)
+        self.stdout.write(f"  {model.__name__}: {total} rows")
+        return total
+
+    def text(self, words):
+        return " ".join(self.rng.choice(WORDS) for _ in range(words))
+
+    def create_users(self, total, author_ratio):
+        """Create users plus their author/reader profiles; return (author ids, user ids)."""
+        # Hashing is deliberately slow, so hash once and share the result.
+        password = make_password(SEED_PASSWORD)
+        first = next_pk(User)
+        user_ids = list(range(first, first + total))
+        authors_total = max(1, int(total * author_ratio))
+
+        self.bulk_insert(User, (
+            User(
+                pk=pk,
+                username=f"seed_user_{pk}",
+                email=f"seed_user_{pk}@example.com",
+                password=password,
+                role="author" if index < authors_total else "reader",
+            )
+            for index, pk in enumerate(user_ids)
+        ))
+
+        first_author = next_pk(AuthorProfile)
+        author_ids = list(range(first_author, first_author + authors_total))
+        self.bulk_insert(AuthorProfile, (
+            AuthorProfile(pk=pk, user_id=user_id, bio=self.text(self.rng.randint(5, 40)))
+            for pk, user_id in zip(author_ids, user_ids[:authors_total])
+        ))
+        self.bulk_insert(ReaderProfile, (
+            ReaderProfile(user_id=user_id, subscribed=self.rng.random() < 0.3)
+            for user_id in user_ids[authors_total:]
+        ))
+        return author_ids, user_ids
+
+    def create_categories(self, total):
+        names = CATEGORY_NAMES[:total] + [f"Topic {i}" for i in range(len(CATEGORY_NAMES), total)]
+        for name in names:
+            Category.objects.get_or_create(name=name, defaults={"slug": slugify(name)})
+        return list(Category.objects.filter(name__in=names).values_list("pk", flat=True))
+
+    def create_posts(self, total, deep_threads, author_ids, category_ids):
+        """Create posts with varied content lengths and heavy-tailed view counts."""
+        first = next_pk(Post)
+        post_ids = list(range(first, first + total + deep_threads))
+        deep_ids = set(post_ids[total:])
+
+        def make_post(index, pk):
+            deep = pk in deep_ids
+            published = deep or self.rng.random() < 0.9
+            title = self.text(self.rng.randint(3, 10)).capitalize()
+            # Most posts are short, a few are very long.
+            paragraphs = min(int(self.rng.lognormvariate(1.3, 0.8)) + 1, 60)
+            published_at = self.now - timezone.timedelta(minutes=(total - index) * 7)
+            post = Post(
+                pk=pk,
+                author_id=self.rng.choice(author_ids),
+                title=title,
+                slug=f"{DEEP_THREAD_PREFIX}{pk}" if deep else f"{slugify(title)[:280]}-{pk}",
+                content="\n\n".join(self.text(self.rng.randint(30, 150)) for _ in range(paragraphs)),
+                status=Post.Status.PUBLISHED if published else Post.Status.DRAFT,
+                category_id=self.rng.choice(category_ids) if category_ids else None,
+                views_count=int(self.rng.paretovariate(1.2) * 10),
+                published_at=published_at if published else None,
+            )
+            # bulk_create skips save(), which renders the markdown.
+            post.render_content()
+            return post
+
+        self.bulk_insert(Post, (make_post(index, pk) for index, pk in enumerate(post_ids)))
+
+        # `created_at` is auto_now_add, which bulk_create always overwrites.
+        Post.objects.filter(pk__gte=first, published_at__isnull=False).update(created_at=F("published_at"))
+        return post_ids[:total], sorted(deep_ids)
+
+    def create_comments(self, post_ids, deep_ids, user_ids, total, deep_size, max_depth):
+        """
+        Create comment trees. Each post gets a heavy-tailed share of
+        `total`; within a post a comment replies to an earlier one with a
+        fixed probability, up to `max_depth` levels.
+        """
+        weights = [self.rng.paretovariate(1.5) for _ in post_ids]
+        scale = total / sum(weights) if weights else 0
+        counts = [int(weight * scale) for weight in weights]
+        for _ in range(total - sum(counts) if counts else 0):
+            counts[self.rng.randrange(len(counts))] += 1
+
+        plan = list(zip(post_ids, counts)) + [(pk, deep_size) for pk in deep_ids]
+        pk = next_pk(Comment)
+
+        def comments():
+            nonlocal pk
+            for post_id, count in plan:
+                deep = post_id in deep_ids
+                nodes = []  # (pk, depth) of this post's comments so far
+                for _ in range(count):
+                    parent_id, depth = None, 0
+                    if nodes and self.rng.random() < (0.8 if deep else 0.4):
+                        # Favour recent comments so long reply chains form.
+                        parent_id, parent_depth = nodes[-self.rng.randint(1, min(len(nodes), 10))]
+                        if parent_depth < max_depth:
+                            depth = parent_depth + 1
+                        else:
+                            parent_id = None
+                    nodes.append((pk, depth))
+                    yield Comment(
+                        pk=pk,
+                        post_id=post_id,
+                        user_id=self.rng.choice(user_ids),
+                        parent_id=parent_id,
+                        content=self.text(self.rng.randint(5, 80)),
+                    )
+                    pk += 1
+
+        self.bulk_insert(Comment, comments())
+
+    def reconcile(self):
+        """Recompute denormalized counters and reset id sequences."""
+        published = (
+            Post.objects.filter(author=OuterRef("pk"))
+            .values("author")
+            .annotate(total=Count("pk", filter=Q(status=Post.Status.PUBLISHED)))
+            .values("total")
+        )
+        AuthorProfile.objects.update(total_posts=Coalesce(Subquery(published), 0))
+        rebuild_author_stats(batch_size=self.batch_size)
+
+        # Explicit primary keys bypass PostgreSQL sequences; move them past
+        # the inserted rows. SQLite tracks this on its own.
+        statements = connection.ops.sequence_reset_sql(
+            no_style(), [User, AuthorProfile, ReaderProfile, Post, Comment]
+        )
+        with connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
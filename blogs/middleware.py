@@ -0,0 +1,50 @@
+import re
+
+from django.conf import settings
+from django.http import FileResponse
+
+from . import static_site
+from .stats import count_view
+
+
+PAGE_PATH = re.compile(r"^/(?:[-\w]+/)?$")
+
+
+class StaticPageMiddleware:
+    """
+    Serve pages pre-rendered by `blogs.static_site` to anonymous visitors
+    without running a view, template or query (besides counting the view).
+
+    Only plain GET/HEAD requests without a query string, session cookie or
+    Authorization header qualify; everything else, and any path without a
+    generated file, falls through to Django. A front proxy can serve the
+    same files directly with the same rules.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if self.servable(request):
+            try:
+                page = open(static_site.output_file(request.path_info), "rb")
+            except FileNotFoundError:
+                pass
+            else:
+                if request.method == "GET" and request.path_info != static_site.HOME:
+                    count_view(request.path_info.strip("/"))
+                response = FileResponse(page, content_type="text/html; charset=utf-8")
+                response["Cache-Control"] = "no-cache"
+                return response
+
+        return self.get_response(request)
+
+    def servable(self, request):
+        return (
+            static_site.enabled()
+            and request.method in ("GET", "HEAD")
+            and not request.GET
+            and PAGE_PATH.match(request.path_info)
+            and settings.SESSION_COOKIE_NAME not in request.COOKIES
+            and "HTTP_AUTHORIZATION" not in request.META
+        )
@@ -0,0 +1,83 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+from utils.migration_operations import AddIndexConcurrently, RemoveFieldIndexConcurrently, RemoveIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    """
+    Replace the single-column Post indexes with composite indexes matching
+    the real queries. Indexes are built and dropped concurrently on
+    PostgreSQL, so this migration is not wrapped in a transaction. The
+    foreign-key indexes made redundant by the composites are dropped last,
+    also concurrently (`AlterField` would drop them with a blocking
+    `DROP INDEX`).
+    """
+
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0010_remove_readerprofile_favorite_posts'),
+        ('blogs', '0005_remove_post_tags_delete_tag'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='post',
+            index=models.Index(fields=['author', 'status'], name='post_author_status_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='post',
+            index=models.Index(fields=['author', '-created_at'], name='post_author_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='post',
+            index=models.Index(fields=['category', '-created_at'], name='post_category_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='post',
+            index=models.Index(fields=['status', '-published_at'], name='post_status_published_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='comment',
+            index=models.Index(fields=['post', 'parent', 'created_at'], name='comment_post_thread_idx'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='post',
+            name='blogs_post_status_77dfe1_idx',
+        ),
+        RemoveIndexConcurrently(
+            model_name='post',
+            name='blogs_post_slug_582fe9_idx',
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='post',
+                    name='author',
+                    field=models.ForeignKey(db_index=False, help_text='Author who wrote the post.', on_delete=django.db.models.deletion.CASCADE, related_name='posts', to='accounts.authorprofile'),
+                ),
+            ],
+            database_operations=[RemoveFieldIndexConcurrently('post', 'author')],
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='post',
+                    name='category',
+                    field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='posts', to='blogs.category'),
+                ),
+            ],
+            database_operations=[RemoveFieldIndexConcurrently('post', 'category')],
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='comment',
+                    name='post',
+                    field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='blogs.post'),
+                ),
+            ],
+            database_operations=[RemoveFieldIndexConcurrently('comment', 'post')],
+        ),
+    ]
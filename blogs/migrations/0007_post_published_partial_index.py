@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+from utils.migration_operations import AddIndexConcurrently, RemoveIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    """
+    Replace the (status, -published_at) index with a partial index on
+    published posts only, used by `Post.published`.
+    """
+
+    atomic = False
+
+    dependencies = [
+        ('blogs', '0006_post_comment_access_path_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='post',
+            index=models.Index(condition=models.Q(('status', 'published')), fields=['-published_at'], name='post_published_idx'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='post',
+            name='post_status_published_idx',
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogs', '0008_post_rendered_content'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StaticPage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('path', models.CharField(max_length=400, unique=True)),
+                ('generated_at', models.DateTimeField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='StaticPageDependency',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(db_index=True, max_length=100)),
+                ('page', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='dependencies', to='blogs.staticpage')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('page', 'key'), name='static_page_dependency_unique')],
+            },
+        ),
+    ]
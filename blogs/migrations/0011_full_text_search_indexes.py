@@ -0,0 +1,29 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+from utils.migration_operations import AddPostgresIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    """
+    Full-text GIN indexes for the admin search of posts and comments.
+    Built on PostgreSQL only; other databases search with LIKE.
+    """
+
+    atomic = False
+
+    dependencies = [
+        ('blogs', '0010_trending'),
+    ]
+
+    operations = [
+        AddPostgresIndexConcurrently(
+            model_name='comment',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('content', config='english'), name='comment_search_idx'),
+        ),
+        AddPostgresIndexConcurrently(
+            model_name='post',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('title', 'content', config='english'), name='post_search_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:07
+
+from django.db import migrations, models
+
+from utils.migration_operations import AddFieldWithoutPostgresIndexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogs', '0011_full_text_search_indexes'),
+    ]
+
+    operations = [
+        AddFieldWithoutPostgresIndexes(
+            model_name='post',
+            name='excerpt',
+            field=models.TextField(blank=True, editable=False),
+        ),
+    ]
@@ -1,7 +1,10 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
 from django.db import models
 from django.utils.text import slugify
 from django.utils import timezone
 from accounts.models import AuthorProfile, User
+from .rendering import RENDERER_VERSION, content_hash, render_markdown
 
 
 class Category(models.Model):
@@ -22,6 +25,33 @@ class Category(models.Model):
             self.slug = slugify(self.name)
         super().save(*args, **kwargs)
 
+
+def post_search_vector():
+    """Full-text document of a post; `post_search_idx` is built on exactly this expression."""
+    return SearchVector("title", "content", config="english")
+
+
+def comment_search_vector():
+    """Full-text document of a comment; `comment_search_idx` is built on exactly this expression."""
+    return SearchVector("content", config="english")
+
+
+class PublishedPostManager(models.Manager):
+    """
+    Published posts only, newest publication first.
+    Every public read path goes through `Post.published`, so drafts are
+    excluded by construction and queries can use the partial index on
+    published posts.
+    """
+
+    def get_queryset(self):
+        return (
+            super().get_queryset()
+            .filter(status=Post.Status.PUBLISHED)
+            .order_by("-published_at")
+        )
+
+
 class Post(models.Model):
     """Core blog post model representing an article."""
 
@@ -33,11 +63,18 @@ class Post(models.Model):
         AuthorProfile,
         on_delete=models.CASCADE,
         related_name="posts",
-        help_text="Author who wrote the post."
+        help_text="Author who wrote the post.",
+        db_index=False,  # covered by the (author, ...) indexes below
     )
     title = models.CharField(max_length=255)
     slug = models.SlugField(max_length=300, unique=True, blank=True)
-    content = models.TextField()
+    content = models.TextField(help_text="Markdown source.")
+    # Rendered from `content` on save, see `render_content()`
+    content_html = models.TextField(blank=True, editable=False)
+    content_toc = models.JSONField(default=list, blank=True, editable=False)
+    excerpt = models.TextField(blank=True, editable=False)
+    content_hash = models.CharField(max_length=64, blank=True, editable=False)
+    render_version = models.PositiveSmallIntegerField(default=0, editable=False)
     cover_image = models.ImageField(upload_to="post_covers/", blank=True, null=True)
     status = models.CharField(
         max_length=10,
@@ -49,7 +86,8 @@ class Post(models.Model):
         Category,
         on_delete=models.SET_NULL,
         null=True,
-        related_name="posts"
+        related_name="posts",
+        db_index=False,  # covered by the (category, -created_at) index below
     )
 
     views_count = models.PositiveIntegerField(default=0)
@@ -59,18 +97,37 @@ class Post(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     published_at = models.DateTimeField(blank=True, null=True)
 
+    objects = models.Manager()
+    published = PublishedPostManager()
+
     class Meta:
         ordering = ["-created_at"]
+        # Shaped after the real access paths; `slug` is already indexed
+        # by its unique constraint.
         indexes = [
-            models.Index(fields=["status"]),
-            models.Index(fields=["slug"]),
+            # Author post counts in blogs.signals
+            models.Index(fields=["author", "status"], name="post_author_status_idx"),
+            # Author dashboard (PostListView), newest first
+            models.Index(fields=["author", "-created_at"], name="post_author_created_idx"),
+            # Homepage category filter and related posts
+            models.Index(fields=["category", "-created_at"], name="post_category_created_idx"),
+            # Public listings (`Post.published`): only the published subset
+            models.Index(
+                fields=["-published_at"],
+                condition=models.Q(status="published"),
+                name="post_published_idx",
+            ),
+            # Admin search (PostgreSQL only, see utils.admin.FullTextSearchMixin)
+            GinIndex(post_search_vector(), name="post_search_idx"),
         ]
 
     def __str__(self):
         return self.title
 
+    RENDERED_FIELDS = ["content_html", "content_toc", "excerpt", "content_hash", "render_version"]
+
     def save(self, *args, **kwargs):
-        """Auto-generate slug and published_at timestamp."""
+        """Auto-generate slug and published_at timestamp, and render content."""
         if not self.slug:
             self.slug = slugify(self.title)
 
@@ -78,8 +135,32 @@ class Post(models.Model):
         if self.status == self.Status.PUBLISHED and not self.published_at:
             self.published_at = timezone.now()
 
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "content" in update_fields:
+            if self.render_content() and update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, *self.RENDERED_FIELDS}
+
         super().save(*args, **kwargs)
 
+    def render_content(self, force=False):
+        """
+        Render the markdown `content` to sanitized HTML, a table of contents
+        and a plain-text excerpt.
+        Skipped when neither the content nor the renderer changed since the
+        last render; returns whether anything was rendered.
+        """
+        digest = content_hash(self.content)
+        if not force and digest == self.content_hash and self.render_version == RENDERER_VERSION:
+            return False
+
+        rendered = render_markdown(self.content)
+        self.content_html = rendered.html
+        self.content_toc = rendered.toc
+        self.excerpt = rendered.excerpt
+        self.content_hash = digest
+        self.render_version = RENDERER_VERSION
+        return True
+
     def increment_views(self):
         """Increase the view count each time the post is viewed."""
         self.views_count = models.F("views_count") + 1
@@ -97,7 +178,8 @@ class Comment(models.Model):
     post = models.ForeignKey(
         "Post",
         on_delete=models.CASCADE,
-        related_name="comments"
+        related_name="comments",
+        db_index=False,  # covered by the (post, parent, created_at) index below
     )
     user = models.ForeignKey(
         User,
@@ -117,6 +199,12 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ["created_at"]
+        indexes = [
+            # Threads of a post in display order
+            models.Index(fields=["post", "parent", "created_at"], name="comment_post_thread_idx"),
+            # Admin search (PostgreSQL only, see utils.admin.FullTextSearchMixin)
+            GinIndex(comment_search_vector(), name="comment_search_idx"),
+        ]
         verbose_name = "Comment"
         verbose_name_plural = "Comments"
 
@@ -130,3 +218,75 @@ class Comment(models.Model):
     def get_replies(self):
         """Return all direct replies to this comment."""
         return self.replies.all()
+
+
+class StaticPage(models.Model):
+    """
+    A page rendered to a file by `blogs.static_site`, keyed by URL path.
+    Its dependencies name the objects it shows, so a change to any of them
+    regenerates exactly the affected pages.
+    """
+
+    path = models.CharField(max_length=400, unique=True)
+    generated_at = models.DateTimeField()
+
+    def __str__(self):
+        return self.path
+
+
+class StaticPageDependency(models.Model):
+    """Object key (e.g. `post:42`, `listing:home`) a static page was built from."""
+
+    page = models.ForeignKey(
+        StaticPage,
+        on_delete=models.CASCADE,
+        related_name="dependencies",
+        db_index=False,  # covered by the (page, key) constraint below
+    )
+    key = models.CharField(max_length=100, db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["page", "key"], name="static_page_dependency_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.page} <- {self.key}"
+
+
+class PostActivity(models.Model):
+    """Views and new comments of a post in one hour, the input of `blogs.trending`."""
+
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name="activity",
+        db_index=False,  # covered by the (post, hour) constraint below
+    )
+    hour = models.DateTimeField(db_index=True)
+    views = models.PositiveIntegerField(default=0)
+    comments = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = "Post activity"
+        constraints = [
+            models.UniqueConstraint(fields=["post", "hour"], name="post_activity_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.post} @ {self.hour:%Y-%m-%d %H:00}"
+
+
+class TrendingPost(models.Model):
+    """A post's place in the trending ranking last computed by `blogs.trending`."""
+
+    post = models.OneToOneField(Post, on_delete=models.CASCADE, related_name="trending")
+    rank = models.PositiveSmallIntegerField(unique=True)
+    score = models.FloatField()
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ["rank"]
+
+    def __str__(self):
+        return f"#{self.rank} {self.post}"
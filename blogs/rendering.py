@@ -0,0 +1,65 @@
+import hashlib
+import html
+from collections import namedtuple
+
+import markdown
+import nh3
+from django.utils.html import strip_tags
+
+
+# Bump whenever the output of `render_markdown` changes (extensions,
+# sanitizer rules), then run `manage.py render_posts` to re-render.
+RENDERER_VERSION = 2
+
+MARKDOWN_EXTENSIONS = ["extra", "sane_lists", "toc"]
+
+ALLOWED_TAGS = nh3.ALLOWED_TAGS
+ALLOWED_ATTRIBUTES = {
+    **{tag: set(attrs) for tag, attrs in nh3.ALLOWED_ATTRIBUTES.items()},
+    # Anchors for the table of contents and footnotes
+    **{tag: {"id"} for tag in ("h1", "h2", "h3", "h4", "h5", "h6", "li", "sup")},
+    # `language-*` classes from fenced code blocks
+    "code": {"class"},
+}
+
+# Characters of plain text kept for listings, feeds and newsletters
+EXCERPT_LENGTH = 1000
+
+RenderedContent = namedtuple("RenderedContent", ["html", "toc", "excerpt"])
+
+
+def content_hash(text):
+    """Return the SHA-256 hex digest of the markdown source."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def render_markdown(text):
+    """
+    Render markdown to sanitized HTML, a table of contents and a plain-text
+    excerpt.
+
+    The table of contents is a list of `{"level", "id", "name", "children"}`
+    dicts, one per top-level heading, with plain-text names. The excerpt is
+    unescaped text, to be escaped once by whatever outputs it.
+    """
+    md = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS, output_format="html")
+    rendered = md.convert(text)
+    cleaned = nh3.clean(rendered, tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRIBUTES)
+    return RenderedContent(cleaned, _toc(md.toc_tokens), _excerpt(cleaned))
+
+
+def _excerpt(cleaned):
+    text = " ".join(html.unescape(strip_tags(cleaned)).split())
+    return text[:EXCERPT_LENGTH]
+
+
+def _toc(tokens):
+    return [
+        {
+            "level": token["level"],
+            "id": token["id"],
+            "name": html.unescape(token["name"]),
+            "children": _toc(token["children"]),
+        }
+        for token in tokens
+    ]
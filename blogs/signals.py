@@ -1,28 +1,182 @@
 from django.db.models.signals import post_save, post_delete
-from django.dispatch import receiver
-from .models import Post, AuthorProfile
+from django.db import transaction
+from django.dispatch import Signal, receiver
+from monitoring.metrics import timed
+from accounts.models import AuthorStats
+from jobs.queue import enqueue
+from . import live, sitemaps, static_site, trending
+from .feeds import invalidate_feeds
+from .cache import category_cache
+from .models import Category, Comment, Post, AuthorProfile
+from .stats import bump_author_stats
+from .tasks import refresh_author_counts
+
+
+# Sent by `blogs.bulk.publish` with the `posts` it published in one UPDATE,
+# for which `post_save` never runs.
+posts_published = Signal()
+
+
+def is_view_increment(update_fields):
+    """`Post.increment_views()` saves nothing but the view counter."""
+    return update_fields is not None and set(update_fields) == {"views_count"}
+
+
+def queue_author_recount(author_id):
+    enqueue(refresh_author_counts, author_id, dedupe_key=f"author-counts:{author_id}")
+
+
+@receiver(post_save, sender=AuthorProfile)
+@timed("signal")
+def create_author_stats(sender, instance, created, **kwargs):
+    """
+    Give every new author an empty stats row, so listings sorted by stats
+    never see NULLs.
+    """
+    if created:
+        AuthorStats.objects.get_or_create(author=instance)
+
+
+@receiver(post_save, sender=Post)
+@timed("signal")
+def update_author_counts_on_post_save(sender, instance, update_fields=None, **kwargs):
+    """
+    Keep `AuthorProfile.total_posts` and `AuthorStats` in step with the
+    author's posts. A view increment is applied as a delta; any other save
+    queues a recount of the author.
+    """
+    if is_view_increment(update_fields):
+        bump_author_stats(instance.author_id, views=1)
+    else:
+        queue_author_recount(instance.author_id)
+
+
+@receiver(post_delete, sender=Post)
+@timed("signal")
+def update_author_counts_on_post_delete(sender, instance, **kwargs):
+    """
+    Queue a recount of the author, including comments removed with the post.
+    """
+    queue_author_recount(instance.author_id)
+
+
+@receiver(post_save, sender=Comment)
+@timed("signal")
+def update_author_stats_on_comment_save(sender, instance, created, **kwargs):
+    """
+    Count a new comment towards the post author's stats.
+    """
+    if created:
+        bump_author_stats(instance.post.author_id, comments=1)
+
+
+@receiver(post_delete, sender=Comment)
+@timed("signal")
+def update_author_stats_on_comment_delete(sender, instance, origin=None, **kwargs):
+    """
+    Discount a deleted comment from the post author's stats.
+    Comments deleted along with their post are recounted by the post handler.
+    """
+    if isinstance(origin, Post) or getattr(origin, "model", None) is Post:
+        return
+    author_id = Post.objects.filter(pk=instance.post_id).values_list("author_id", flat=True).first()
+    if author_id is not None:
+        bump_author_stats(author_id, comments=-1)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_cache(sender, **kwargs):
+    """
+    Drop every worker's cached categories after an admin or API edit.
+    """
+    category_cache.invalidate()
 
 
 @receiver(post_save, sender=Post)
-def update_author_total_posts_on_save(sender, instance, created, **kwargs):
+@receiver(post_delete, sender=Post)
+def regenerate_static_pages_for_post(sender, instance, **kwargs):
     """
-    Update the author's total published post count whenever a Post is created or updated.
-    This ensures `AuthorProfile.total_posts` always reflects the number of published posts.
+    Rebuild the post's static page, the homepage and pages showing the post.
+    Pages of unpublished or deleted posts are removed.
     """
-    author = instance.author
+    if is_view_increment(kwargs.get("update_fields")):
+        return
+    static_site.schedule(
+        {static_site.post_key(instance.pk), static_site.HOME_KEY},
+        [static_site.post_path(instance), static_site.HOME],
+    )
 
-    # Count only published posts
-    total_published = author.posts.filter(status=Post.Status.PUBLISHED).count()
 
-    # Update author's total_posts
-    AuthorProfile.objects.filter(pk=author.pk).update(total_posts=total_published)
+@receiver(post_save, sender=Comment)
+@timed("signal")
+def count_comment_for_trending(sender, instance, created, **kwargs):
+    """
+    Count a new comment in its post's trending bucket.
+    """
+    if created:
+        trending.record(instance.post_id, comments=1)
 
 
+@receiver(post_save, sender=Comment)
+def push_live_comment(sender, instance, created, **kwargs):
+    """
+    Push a new comment to open live comment streams once it is committed,
+    whether it came from the post page or the API.
+    """
+    if created:
+        transaction.on_commit(live.broker.notify)
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def regenerate_static_pages_for_comment(sender, instance, origin=None, **kwargs):
+    """
+    Rebuild the static page that lists the comment.
+    """
+    if isinstance(origin, Post) or getattr(origin, "model", None) is Post:
+        return
+    static_site.schedule({static_site.post_key(instance.post_id)})
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def regenerate_static_pages_for_categories(sender, **kwargs):
+    """
+    Rebuild static pages showing the category sidebar.
+    """
+    static_site.schedule({static_site.CATEGORIES_KEY})
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_feeds_on_change(sender, **kwargs):
+    """
+    Start a new feed generation when posts or category names change.
+    """
+    if is_view_increment(kwargs.get("update_fields")):
+        return
+    transaction.on_commit(invalidate_feeds)
+
+
+@receiver(post_save, sender=Post)
 @receiver(post_delete, sender=Post)
-def update_author_total_posts_on_delete(sender, instance, **kwargs):
+def update_sitemaps_for_post(sender, instance, **kwargs):
+    """
+    Rebuild the child sitemap holding the post, and the index.
+    """
+    if is_view_increment(kwargs.get("update_fields")):
+        return
+    bucket = sitemaps.bucket_of(instance.pk)
+    enqueue(sitemaps.post_changed, instance.pk, dedupe_key=f"sitemaps:{sitemaps.posts_file(bucket)}")
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def update_sitemaps_for_categories(sender, **kwargs):
     """
-    Update author's total post count when a post is deleted.
+    Rebuild the category sitemap.
     """
-    author = instance.author
-    total_published = author.posts.filter(status=Post.Status.PUBLISHED).count()
-    AuthorProfile.objects.filter(pk=author.pk).update(total_posts=total_published)
+    enqueue(sitemaps.categories_changed, dedupe_key=f"sitemaps:{sitemaps.CATEGORIES_FILE}")
@@ -0,0 +1,170 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from itertools import chain
+from pathlib import Path
+
+from django.conf import settings
+from django.db.models import F, Max
+from django.urls import reverse
+from django.utils.xmlutils import SimplerXMLGenerator
+
+from jobs.queue import job
+from .cache import category_cache
+from .models import Post
+
+
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+INDEX_FILE = "sitemap.xml"
+CATEGORIES_FILE = "categories.xml"
+ITERATION_BATCH = 2_000
+
+
+def bucket_size():
+    """URLs per child sitemap; 50k is the protocol limit."""
+    return getattr(settings, "SITEMAP_MAX_URLS", 50_000)
+
+
+def root():
+    return Path(settings.SITEMAP_ROOT)
+
+
+def absolute(location):
+    return settings.SITE_URL.rstrip("/") + location
+
+
+def posts_file(bucket):
+    return f"posts-{bucket}.xml"
+
+
+def bucket_of(post_pk):
+    """
+    Posts are split into child sitemaps by fixed primary key ranges, so a
+    file never exceeds the URL limit and a changed post maps to exactly one
+    file that can be rebuilt on its own.
+    """
+    return post_pk // bucket_size()
+
+
+@contextmanager
+def sitemap_writer(name, root_tag):
+    """Stream XML into a temporary file and atomically move it into place."""
+    directory = root()
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, temp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            xml = SimplerXMLGenerator(handle, "utf-8")
+            xml.startDocument()
+            xml.startElement(root_tag, {"xmlns": SITEMAP_NS})
+            yield xml
+            xml.endElement(root_tag)
+            xml.endDocument()
+        os.chmod(temp, 0o644)
+        os.replace(temp, directory / name)
+    except BaseException:
+        Path(temp).unlink(missing_ok=True)
+        raise
+
+
+def write_entry(xml, tag, location, lastmod=None):
+    xml.startElement(tag, {})
+    xml.addQuickElement("loc", location)
+    if lastmod is not None:
+        xml.addQuickElement("lastmod", lastmod.date().isoformat())
+    xml.endElement(tag)
+
+
+def iterate_posts(start, stop):
+    """
+    Yield `(slug, updated_at)` of published posts with `start <= pk < stop`
+    by keyset pagination, holding one batch in memory at a time.
+    """
+    last_pk = start - 1
+    while True:
+        batch = list(
+            Post.published.filter(pk__gt=last_pk, pk__lt=stop)
+            .order_by("pk")
+            .values_list("pk", "slug", "updated_at")[:ITERATION_BATCH]
+        )
+        if not batch:
+            return
+        for _, slug, updated_at in batch:
+            yield slug, updated_at
+        last_pk = batch[-1][0]
+
+
+def build_posts(bucket):
+    """Rebuild one child sitemap of posts, or delete it once it is empty."""
+    size = bucket_size()
+    posts = iterate_posts(bucket * size, (bucket + 1) * size)
+    first = next(posts, None)
+    if first is None:
+        (root() / posts_file(bucket)).unlink(missing_ok=True)
+        return
+
+    with sitemap_writer(posts_file(bucket), "urlset") as xml:
+        for slug, updated_at in chain([first], posts):
+            write_entry(xml, "url", absolute(reverse("post-detail", kwargs={"slug": slug})), updated_at)
+
+
+def build_categories():
+    """Rebuild the category sitemap; lastmod is the category's latest post update."""
+    lastmods = dict(
+        Post.published.order_by().values("category_id").annotate(lastmod=Max("updated_at"))
+        .values_list("category_id", "lastmod")
+    )
+    with sitemap_writer(CATEGORIES_FILE, "urlset") as xml:
+        for category in category_cache.all():
+            location = absolute(f"{reverse('home')}?category={category.pk}")
+            write_entry(xml, "url", location, lastmods.get(category.pk))
+
+
+def build_index():
+    """
+    Rebuild the sitemap index from one grouped query over the post buckets.
+    """
+    buckets = (
+        Post.published.order_by()
+        .annotate(bucket=F("pk") / bucket_size())
+        .values("bucket")
+        .annotate(lastmod=Max("updated_at"))
+        .order_by("bucket")
+        .values_list("bucket", "lastmod")
+    )
+    with sitemap_writer(INDEX_FILE, "sitemapindex") as xml:
+        write_entry(xml, "sitemap", absolute(reverse("sitemap-section", kwargs={"name": "categories"})))
+        for bucket, lastmod in buckets:
+            location = absolute(reverse("sitemap-section", kwargs={"name": f"posts-{bucket}"}))
+            write_entry(xml, "sitemap", location, lastmod)
+
+
+def build_all():
+    """Rebuild every sitemap file and remove files of empty buckets."""
+    existing = {path.name for path in root().glob("posts-*.xml")}
+    last_pk = Post.published.aggregate(last=Max("pk"))["last"] or 0
+    for bucket in range(bucket_of(last_pk) + 1):
+        build_posts(bucket)
+        existing.discard(posts_file(bucket))
+    for name in existing:
+        (root() / name).unlink(missing_ok=True)
+    build_categories()
+    build_index()
+
+
+def is_built():
+    return (root() / INDEX_FILE).exists()
+
+
+@job("blogs.update_post_sitemap")
+def post_changed(post_pk):
+    """Rebuild the child sitemap holding a post and the index, once built."""
+    if is_built():
+        build_posts(bucket_of(post_pk))
+        build_index()
+
+
+@job("blogs.update_category_sitemap")
+def categories_changed():
+    if is_built():
+        build_categories()
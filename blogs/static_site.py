@@ -0,0 +1,185 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.db import transaction
+from django.http import HttpRequest
+from django.template.loader import render_to_string
+from django.urls import Resolver404, resolve, reverse
+from django.utils import timezone
+
+from jobs.queue import enqueue, job
+from .models import Post, StaticPage, StaticPageDependency
+from .views import AllPostsView, PostDetailView
+
+
+logger = logging.getLogger("blogs.static_site")
+
+HOME = "/"
+HOME_KEY = "listing:home"
+CATEGORIES_KEY = "categories"
+TRENDING_KEY = "trending"
+
+
+def post_key(pk):
+    return f"post:{pk}"
+
+
+def post_path(post):
+    return reverse("post-detail", kwargs={"slug": post.slug})
+
+
+def enabled():
+    return getattr(settings, "STATIC_SITE_ENABLED", False)
+
+
+def output_file(path):
+    """Return the file a URL path is written to: `/slug/` -> `slug/index.html`."""
+    relative = path.strip("/")
+    root = Path(settings.STATIC_SITE_ROOT)
+    return root / relative / "index.html" if relative else root / "index.html"
+
+
+def anonymous_request(path):
+    """A bare GET request as an anonymous visitor would send it."""
+    request = HttpRequest()
+    request.method = "GET"
+    request.path = request.path_info = path
+    request.META = {"SERVER_NAME": "localhost", "SERVER_PORT": "80"}
+    request.user = AnonymousUser()
+    return request
+
+
+def render_page(path):
+    """
+    Render the anonymous view of `path`.
+
+    Returns `(html, dependency keys)`, or None when the path no longer has a
+    static page (e.g. the post was unpublished).
+    """
+    request = anonymous_request(path)
+
+    if path == HOME:
+        response = AllPostsView.as_view()(request)
+        shown = Post.published.values_list("pk", flat=True)[:AllPostsView.paginate_by]
+        return response.content.decode(), {HOME_KEY, TRENDING_KEY, *map(post_key, shown)}
+
+    try:
+        match = resolve(path)
+    except Resolver404:
+        return None
+    if match.url_name != "post-detail" or match.func.view_class is not PostDetailView:
+        return None
+
+    post = Post.published.select_related("author__user").filter(slug=match.kwargs["slug"]).first()
+    if post is None:
+        return None
+
+    view = PostDetailView()
+    context = view.get_context_data(post)
+    html = render_to_string(view.template_name, context, request=request)
+    shown = [post, *context["related_posts"]]
+    return html, {CATEGORIES_KEY, *(post_key(item.pk) for item in shown)}
+
+
+def write_file(path, html):
+    """Atomically replace the file of a page."""
+    target = output_file(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        handle.write(html)
+    os.chmod(temp, 0o644)
+    os.replace(temp, target)
+
+
+def record_pages(pages):
+    """Record what each page was built from; `pages` maps paths to dependency keys."""
+    now = timezone.now()
+    with transaction.atomic():
+        StaticPage.objects.bulk_create(
+            [StaticPage(path=path, generated_at=now) for path in pages],
+            update_conflicts=True,
+            unique_fields=["path"],
+            update_fields=["generated_at"],
+        )
+        ids = dict(StaticPage.objects.filter(path__in=list(pages)).values_list("path", "pk"))
+        StaticPageDependency.objects.filter(page_id__in=ids.values()).delete()
+        StaticPageDependency.objects.bulk_create([
+            StaticPageDependency(page_id=ids[path], key=key)
+            for path, keys in pages.items()
+            for key in sorted(keys)
+        ])
+
+
+def write_page(path, html, dependencies):
+    write_file(path, html)
+    record_pages({path: dependencies})
+
+
+def remove_page(path):
+    """Delete a page so requests for it fall through to Django again."""
+    target = output_file(path)
+    target.unlink(missing_ok=True)
+    if target.parent != Path(settings.STATIC_SITE_ROOT):
+        try:
+            target.parent.rmdir()
+        except OSError:
+            pass
+    StaticPage.objects.filter(path=path).delete()
+
+
+def build(path):
+    """(Re)generate one page, or remove it if it should no longer exist."""
+    rendered = render_page(path)
+    if rendered is None:
+        remove_page(path)
+        return False
+    write_page(path, *rendered)
+    return True
+
+
+@job("blogs.regenerate_static_pages")
+def regenerate(keys, paths=()):
+    """
+    Rebuild `paths` and every page that depends on one of `keys`.
+
+    Up to `STATIC_SITE_INLINE_LIMIT` pages are rebuilt, explicitly named
+    paths first. Pages beyond the limit are removed instead, so they are
+    served dynamically (never stale) until the next full rebuild.
+    """
+    ordered = list(dict.fromkeys(paths))
+    dependents = (
+        StaticPage.objects.filter(dependencies__key__in=list(keys))
+        .order_by("path")
+        .values_list("path", flat=True)
+        .distinct()
+    )
+    ordered += [path for path in dependents if path not in ordered]
+
+    limit = getattr(settings, "STATIC_SITE_INLINE_LIMIT", 50)
+    for path in ordered[:limit]:
+        build(path)
+    for path in ordered[limit:]:
+        remove_page(path)
+    if len(ordered) > limit:
+        logger.warning(
+            "Removed %d static pages over the inline limit; run build_static_site to regenerate them.",
+            len(ordered) - limit,
+        )
+
+
+def schedule(keys, paths=()):
+    """
+    Queue a regeneration job when enabled. Identical requests made before
+    a worker picks the job up (e.g. a burst of comments) are merged.
+    """
+    if enabled():
+        keys, paths = sorted(keys), list(paths)
+        digest = hashlib.sha1(json.dumps([keys, paths]).encode()).hexdigest()
+        enqueue(regenerate, keys, paths, dedupe_key=f"static:{digest}")
@@ -0,0 +1,186 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.redis import RedisCache
+from django.db.models import Count, F, Max, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from accounts.models import AuthorProfile, AuthorStats
+from analytics import series
+from jobs.queue import enqueue, job
+from .models import Comment, Post
+from .trending import record as record_activity
+
+
+PUBLISHED = Q(status=Post.Status.PUBLISHED)
+STATS_FIELDS = ["published_posts", "total_views", "total_comments", "last_published_at", "updated_at"]
+
+
+def rebuild_author_stats(author_ids=None, batch_size=1000):
+    """
+    Recompute `AuthorStats` from posts and comments and upsert the rows.
+
+    Rebuilds every author, or only `author_ids`, in batches of `batch_size`
+    authors, each one aggregate query plus one upsert. Returns the number of
+    authors processed.
+    """
+    posts = Post.objects.filter(author=OuterRef("pk")).values("author")
+    comments = Comment.objects.filter(post__author=OuterRef("pk")).values("post__author")
+
+    authors = AuthorProfile.objects.order_by("pk").annotate(
+        published_posts=Coalesce(Subquery(posts.annotate(n=Count("pk", filter=PUBLISHED)).values("n")), 0),
+        total_views=Coalesce(Subquery(posts.annotate(n=Sum("views_count")).values("n")), 0),
+        last_published_at=Subquery(posts.annotate(n=Max("published_at", filter=PUBLISHED)).values("n")),
+        total_comments=Coalesce(Subquery(comments.annotate(n=Count("pk")).values("n")), 0),
+    )
+    if author_ids is not None:
+        authors = authors.filter(pk__in=author_ids)
+
+    done = 0
+    last_pk = 0
+    while True:
+        batch = list(
+            authors.filter(pk__gt=last_pk).values_list(
+                "pk", "published_posts", "total_views", "total_comments", "last_published_at"
+            )[:batch_size]
+        )
+        if not batch:
+            return done
+
+        AuthorStats.objects.bulk_create(
+            [
+                AuthorStats(
+                    author_id=pk,
+                    published_posts=published_posts,
+                    total_views=total_views,
+                    total_comments=total_comments,
+                    last_published_at=last_published_at,
+                )
+                for pk, published_posts, total_views, total_comments, last_published_at in batch
+            ],
+            update_conflicts=True,
+            unique_fields=["author"],
+            update_fields=STATS_FIELDS,
+        )
+        done += len(batch)
+        last_pk = batch[-1][0]
+
+
+def refresh_post_stats(author_id, include_comments=False, create=True):
+    """
+    Recompute the post-derived columns of one author's stats.
+
+    Uses the (author, status) index on posts; the comment count is only
+    recounted when `include_comments` is set. A missing row is rebuilt
+    from scratch unless `create` is False (e.g. while the author is being
+    deleted).
+    """
+    changes = Post.objects.filter(author_id=author_id).aggregate(
+        published_posts=Count("pk", filter=PUBLISHED),
+        total_views=Coalesce(Sum("views_count"), 0),
+        last_published_at=Max("published_at", filter=PUBLISHED),
+    )
+    if include_comments:
+        changes["total_comments"] = Comment.objects.filter(post__author_id=author_id).count()
+
+    updated = AuthorStats.objects.filter(author_id=author_id).update(updated_at=timezone.now(), **changes)
+    if not updated and create:
+        rebuild_author_stats([author_id])
+
+
+def bump_author_stats(author_id, views=0, comments=0):
+    """
+    Apply view/comment deltas to one author's stats with a single UPDATE.
+    """
+    changes = {}
+    if views:
+        changes["total_views"] = F("total_views") + views
+    if comments:
+        changes["total_comments"] = Greatest(F("total_comments") + comments, 0)
+
+    if changes and not AuthorStats.objects.filter(author_id=author_id).update(**changes):
+        rebuild_author_stats([author_id])
+
+
+def view_buffer_key(slug):
+    return f"blogs:views:{slug}"
+
+
+def view_pending_key(slug):
+    return f"blogs:views:pending:{slug}"
+
+
+def buffers_views():
+    """Views are buffered only in a cache shared by all processes with an atomic `incr`."""
+    return isinstance(caches["default"], RedisCache)
+
+
+def count_view(slug):
+    """
+    Count a page view of a post. With Redis, the view is added to the
+    post's counter there, and the first view since the last flush queues a
+    `record_views` job writing them all. Otherwise it is written right away.
+    """
+    if not buffers_views():
+        add_views(slug, 1)
+        return
+
+    key = view_buffer_key(slug)
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Evicted between `add` and `incr`.
+        cache.set(key, 1, None)
+    # The flag outlives a lost job only briefly; a duplicate is deduplicated.
+    delay = getattr(settings, "VIEW_FLUSH_DELAY", 10)
+    if cache.add(view_pending_key(slug), 1, delay + 300):
+        enqueue(
+            record_views, slug,
+            dedupe_key=f"views:{slug}",
+            run_at=timezone.now() + timedelta(seconds=delay),
+        )
+
+
+def add_views(slug, views):
+    """
+    The effect of `views` calls of `Post.increment_views()` and its signal,
+    in two UPDATEs, plus the views in the post's trending and analytics
+    buckets.
+    """
+    post_id = Post.objects.filter(slug=slug).values_list("pk", flat=True).first()
+    if post_id is None:
+        return
+    post = Post.objects.filter(pk=post_id)
+    post.update(views_count=F("views_count") + views)
+    AuthorStats.objects.filter(author_id=Subquery(post.values("author_id")[:1])).update(
+        total_views=F("total_views") + views
+    )
+    record_activity(post_id, views=views)
+    series.record(post_id, views=views)
+
+
+@job("blogs.record_views")
+def record_views(slug):
+    """
+    Write the views of a post buffered by `count_view`. The pending flag is
+    cleared first, so views counted after the read queue the next job.
+    """
+    cache.delete(view_pending_key(slug))
+    key = view_buffer_key(slug)
+    views = cache.get(key)
+    if not views:
+        return
+    try:
+        cache.decr(key, views)
+    except ValueError:
+        pass  # Evicted since; the views read are still written.
+    add_views(slug, views)
+
+
+@job("blogs.record_view")
+def record_view(slug):
+    """A single view; drains jobs queued before views were buffered."""
+    add_views(slug, 1)
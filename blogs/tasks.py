@@ -0,0 +1,37 @@
+from django.conf import settings
+
+from accounts.models import AuthorProfile
+from jobs.queue import job
+from utils.images import downscale
+from .models import Post
+from .stats import refresh_post_stats
+
+
+@job("blogs.refresh_author_counts")
+def refresh_author_counts(author_id):
+    """
+    Recount an author's published posts and `AuthorStats` after their
+    posts changed. Queued once per author, so a burst of edits (or a
+    cascade delete) is recounted once.
+    """
+    published = Post.objects.filter(author_id=author_id, status=Post.Status.PUBLISHED).count()
+    AuthorProfile.objects.filter(pk=author_id).update(total_posts=published)
+    refresh_post_stats(author_id, include_comments=True)
+
+
+@job("blogs.optimize_cover_image")
+def optimize_cover_image(post_id):
+    """
+    Shrink an uploaded cover image to the size post pages display.
+    """
+    post = Post.objects.filter(pk=post_id).only("pk", "cover_image").first()
+    if post is None or not post.cover_image:
+        return
+
+    name = downscale(post.cover_image, settings.COVER_IMAGE_MAX_SIZE)
+    if name and name != post.cover_image.name:
+        from . import static_site  # imports the views, which import this module
+
+        # Only the file name changed; skip the save signals.
+        Post.objects.filter(pk=post_id).update(cover_image=name)
+        static_site.schedule({static_site.post_key(post_id)})
@@ -0,0 +1,60 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db.models import Count, Q
+from django.test import TestCase
+
+from accounts.models import AuthorProfile, ReaderProfile, User
+from blogs.models import Comment, Post
+
+
+class SeedBlogCommandTests(TestCase):
+    """
+    Tests for the `seed_blog` management command.
+    """
+
+    def seed(self, **options):
+        options = {"users": 40, "posts": 30, "comments": 300, "deep_thread_size": 50, "max_depth": 3, **options}
+        call_command("seed_blog", stdout=StringIO(), **options)
+
+    def test_creates_requested_volumes(self):
+        """Users, profiles, posts and comments are created in the requested amounts."""
+        self.seed()
+
+        self.assertEqual(User.objects.count(), 40)
+        self.assertEqual(AuthorProfile.objects.count() + ReaderProfile.objects.count(), 40)
+        self.assertEqual(Post.objects.count(), 31)  # including the deep thread
+        self.assertEqual(Comment.objects.count(), 350)
+
+    def test_author_counters_are_reconciled(self):
+        """`total_posts` matches the number of published posts per author."""
+        self.seed()
+
+        authors = AuthorProfile.objects.annotate(
+            published=Count("posts", filter=Q(posts__status=Post.Status.PUBLISHED))
+        )
+        for author in authors:
+            self.assertEqual(author.total_posts, author.published)
+
+    def test_reply_depth_is_bounded(self):
+        """No reply chain is deeper than `--max-depth`."""
+        self.seed(max_depth=2)
+
+        parents = dict(Comment.objects.values_list("pk", "parent_id"))
+        for pk in parents:
+            depth = 0
+            while parents[pk] is not None:
+                pk = parents[pk]
+                depth += 1
+            self.assertLessEqual(depth, 2)
+
+    def test_same_seed_is_deterministic(self):
+        """Running twice with the same seed produces the same content."""
+        self.seed(seed=7)
+        first = list(Post.objects.order_by("pk").values_list("title", "status", "views_count"))
+        Post.objects.all().delete()
+        User.objects.all().delete()
+
+        self.seed(seed=7)
+        second = list(Post.objects.order_by("pk").values_list("title", "status", "views_count"))
+        self.assertEqual(first, second)
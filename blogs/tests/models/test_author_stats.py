@@ -0,0 +1,104 @@
+from importlib import import_module
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.loader import MigrationLoader
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.models import AuthorProfile, AuthorStats
+from blogs.models import Comment, Post
+
+
+@pytest.mark.django_db
+class TestAuthorStats:
+    """Test suite for the incrementally maintained `AuthorStats` rollup."""
+
+    @pytest.fixture
+    def reader(self, django_user_model):
+        return django_user_model.objects.create_user(
+            username="reader_user", email="reader@example.com", password="testpass123"
+        )
+
+    @pytest.fixture
+    def post(self, author):
+        return Post.objects.create(author=author, title="Stats Post", content="Text", status=Post.Status.PUBLISHED)
+
+    def stats(self, author):
+        return AuthorStats.objects.get(author=author)
+
+    def test_publishing_updates_post_columns(self, author, post, run_jobs):
+        Post.objects.create(author=author, title="Draft", content="Text")
+        run_jobs()
+        author.refresh_from_db()
+        assert author.total_posts == 1
+        stats = self.stats(author)
+        assert stats.published_posts == 1
+        assert stats.last_published_at == post.published_at
+
+    def test_views_are_applied_as_deltas(self, author, post):
+        post.increment_views()
+        post.increment_views()
+        assert self.stats(author).total_views == 2
+
+    def test_comments_are_counted_and_discounted(self, author, post, reader):
+        comment = Comment.objects.create(post=post, user=reader, content="Hi")
+        Comment.objects.create(post=post, user=reader, content="Reply", parent=comment)
+        assert self.stats(author).total_comments == 2
+
+        comment.delete()  # cascades to the reply
+        assert self.stats(author).total_comments == 0
+
+    def test_deleting_post_recounts_comments(self, author, post, reader, run_jobs):
+        other = Post.objects.create(author=author, title="Other", content="Text", status=Post.Status.PUBLISHED)
+        Comment.objects.create(post=post, user=reader, content="Hi")
+        Comment.objects.create(post=other, user=reader, content="Hi")
+
+        post.delete()
+        run_jobs()
+        stats = self.stats(author)
+        assert (stats.published_posts, stats.total_comments) == (1, 1)
+
+    def test_reconcile_repairs_drift(self, author, post, reader):
+        Comment.objects.create(post=post, user=reader, content="Hi")
+        Post.objects.filter(pk=post.pk).update(views_count=42)  # bypasses signals
+        AuthorStats.objects.all().delete()
+
+        call_command("reconcile_author_stats", stdout=StringIO())
+        stats = self.stats(author)
+        assert (stats.published_posts, stats.total_views, stats.total_comments) == (1, 42, 1)
+
+    def test_api_lists_authors_by_popularity(self, author, post, django_user_model):
+        quiet_user = django_user_model.objects.create_user(
+            username="quiet", email="quiet@example.com", password="testpass123", role="author"
+        )
+        AuthorProfile.objects.create(user=quiet_user)
+        post.increment_views()
+
+        client = APIClient()
+        client.force_authenticate(user=author.user)
+        response = client.get(reverse("author-list"))
+
+        assert [row["username"] for row in response.json()] == ["author_user", "quiet"]
+        assert response.json()[0]["stats"]["total_views"] == 1
+
+    def test_migration_backfills_existing_authors(self, author, post):
+        AuthorStats.objects.all().delete()
+
+        migration = import_module("accounts.migrations.0011_authorstats")
+        state = MigrationLoader(connection).project_state(("accounts", "0011_authorstats"))
+        migration.backfill_author_stats(state.apps, None)
+        assert self.stats(author).published_posts == 1
+
+    def test_authors_without_stats_are_listed_last(self, author, post, django_user_model):
+        newcomer = django_user_model.objects.create_user(
+            username="newcomer", email="newcomer@example.com", password="testpass123", role="author"
+        )
+        AuthorStats.objects.filter(author=AuthorProfile.objects.create(user=newcomer)).delete()
+
+        client = APIClient()
+        client.force_authenticate(user=author.user)
+        response = client.get(reverse("author-list"))
+        assert [row["username"] for row in response.json()] == ["author_user", "newcomer"]
@@ -0,0 +1,71 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import AuthorProfile
+from blogs.cache import CategoryCache, category_cache
+from blogs.models import Category, Post
+
+
+def category_queries(queries):
+    return [query["sql"] for query in queries if "blogs_category" in query["sql"]]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestCategoryCache:
+    """Test suite for the two-level category cache."""
+
+    @pytest.fixture
+    def categories(self):
+        return Category.objects.create(name="Tech"), Category.objects.create(name="Music")
+
+    def test_lookups_by_id_slug_and_name(self, categories):
+        tech, _ = categories
+        cache = CategoryCache()
+        assert cache.get(pk=tech.pk) == tech
+        assert cache.get(pk=str(tech.pk)) == tech
+        assert cache.get(slug="tech") == tech
+        assert cache.get(name="Tech") == tech
+        assert cache.get(name="Missing") is None
+        assert cache.get(pk="not-a-number") is None
+        assert [category.name for category in cache.all()] == ["Music", "Tech"]
+
+    def test_second_lookup_runs_no_query(self, categories):
+        cache = CategoryCache()
+        cache.all()
+        with CaptureQueriesContext(connection) as queries:
+            cache.get(name="Tech")
+        assert len(queries) == 0
+
+    def test_edit_invalidates_other_workers(self, categories):
+        tech, _ = categories
+        worker_a, worker_b = CategoryCache(), CategoryCache()
+        worker_a.all()
+        worker_b.all()
+
+        tech.name = "Technology"
+        tech.save()
+
+        assert worker_a.get(pk=tech.pk).name == "Technology"
+        assert worker_b.get(name="Technology") == tech
+
+        Category.objects.filter(pk=tech.pk).get().delete()
+        assert worker_b.get(pk=tech.pk) is None
+
+    def test_detail_page_runs_no_category_query(self, client, categories, django_user_model):
+        user = django_user_model.objects.create_user(
+            username="author_user", email="author@example.com", password="testpass123"
+        )
+        post = Post.objects.create(
+            author=AuthorProfile.objects.create(user=user), title="Cached", content="Text",
+            category=categories[0], status=Post.Status.PUBLISHED,
+        )
+        category_cache.all()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(reverse("post-detail", kwargs={"slug": post.slug}))
+
+        assert response.status_code == 200
+        assert category_queries(queries) == []
+        assert "Music" in response.content.decode()
@@ -0,0 +1,86 @@
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from blogs.models import Post
+from blogs.rendering import RENDERER_VERSION
+
+
+@pytest.mark.django_db
+class TestPostRendering:
+    """Test suite for markdown rendering of post content on save."""
+
+    @pytest.fixture
+    def post(self, author):
+        return Post.objects.create(
+            author=author,
+            title="Markdown Post",
+            content="# Intro & Setup\n\nSome **bold** text.\n\n## Details\n\n<script>alert(1)</script>",
+            status=Post.Status.PUBLISHED,
+        )
+
+    def test_renders_sanitized_html_and_toc(self, post):
+        assert '<h1 id="intro-setup">' in post.content_html
+        assert "<strong>bold</strong>" in post.content_html
+        assert "<script>" not in post.content_html
+        assert post.content_toc == [{
+            "level": 1, "id": "intro-setup", "name": "Intro & Setup",
+            "children": [{"level": 2, "id": "details", "name": "Details", "children": []}],
+        }]
+        assert post.render_version == RENDERER_VERSION
+
+    def test_unchanged_content_is_not_rendered_again(self, post):
+        with mock.patch("blogs.models.render_markdown") as render:
+            post.title = "New title"
+            post.save()
+            post.increment_views()
+        render.assert_not_called()
+
+    def test_update_fields_include_rendered_columns(self, post):
+        post.content = "Plain *text*"
+        post.save(update_fields=["content"])
+        post.refresh_from_db()
+        assert post.content_html == "<p>Plain <em>text</em></p>"
+
+    def test_excerpt_is_unescaped_plain_text(self, author):
+        post = Post.objects.create(
+            author=author,
+            title="Cartoons",
+            content='Tom & Jerry <3\n\nSay "cheese" & *smile*',
+            status=Post.Status.PUBLISHED,
+        )
+        assert post.excerpt == 'Tom & Jerry <3 Say "cheese" & smile'
+
+    def test_homepage_escapes_excerpt_once(self, client, author):
+        Post.objects.create(
+            author=author,
+            title="Cartoons",
+            content='Tom & Jerry <3 "quoted"',
+            status=Post.Status.PUBLISHED,
+        )
+        page = client.get(reverse("home")).content.decode()
+        assert "Tom &amp; Jerry &lt;3 &quot;quoted&quot;" in page
+        assert "&amp;amp;" not in page and "&amp;lt;" not in page
+
+    def test_detail_page_and_api_serve_rendered_html(self, client, post):
+        page = client.get(reverse("post-detail", kwargs={"slug": post.slug}))
+        assert "<strong>bold</strong>" in page.content.decode()
+
+        api = client.get(reverse("post-list-create"))
+        assert api.json()[0]["content_html"] == post.content_html
+
+    def test_command_rerenders_stale_posts(self, post):
+        Post.objects.filter(pk=post.pk).update(content_html="", render_version=0)
+
+        out = StringIO()
+        call_command("render_posts", workers=1, stdout=out)
+
+        post.refresh_from_db()
+        assert "<strong>bold</strong>" in post.content_html
+        assert "Rendered 1 posts" in out.getvalue()
+
+        call_command("render_posts", workers=1, stdout=out)
+        assert "All posts are up to date." in out.getvalue()
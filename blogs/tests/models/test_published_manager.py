@@ -0,0 +1,44 @@
+import pytest
+from django.urls import reverse
+from blogs.models import Category, Post
+
+
+@pytest.mark.django_db
+class TestPublishedManager:
+    """Test suite for the `Post.published` manager and the public read paths."""
+
+    @pytest.fixture
+    def posts(self, author):
+        category = Category.objects.create(name="Technology")
+        draft = Post.objects.create(author=author, title="Draft Post", content="Secret", category=category)
+        older = Post.objects.create(
+            author=author, title="Older Post", content="Text", category=category, status=Post.Status.PUBLISHED
+        )
+        newer = Post.objects.create(
+            author=author, title="Newer Post", content="Text", category=category, status=Post.Status.PUBLISHED
+        )
+        return draft, older, newer
+
+    def test_excludes_drafts_and_orders_by_publication(self, posts):
+        draft, older, newer = posts
+        assert list(Post.published.all()) == [newer, older]
+        assert draft in Post.objects.all()
+
+    def test_homepage_hides_drafts(self, client, posts):
+        response = client.get(reverse("home"))
+        titles = [post.title for post in response.context["posts"]]
+        assert titles == ["Newer Post", "Older Post"]
+
+    def test_search_hides_drafts(self, client, posts):
+        response = client.get(reverse("home"), {"query": "Post"})
+        titles = [post.title for post in response.context["posts"]]
+        assert "Draft Post" not in titles
+
+    def test_api_list_hides_drafts(self, client, posts):
+        response = client.get(reverse("post-list-create"))
+        assert [post["title"] for post in response.json()] == ["Newer Post", "Older Post"]
+
+    def test_api_detail_hides_drafts(self, client, posts):
+        draft, older, _ = posts
+        assert client.get(f"/api/v1/blogs/posts/{draft.slug}/").status_code == 404
+        assert client.get(f"/api/v1/blogs/posts/{older.slug}/").status_code == 200
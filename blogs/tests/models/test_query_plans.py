@@ -0,0 +1,68 @@
+import pytest
+from django.contrib.admin.sites import site
+from django.db import connection
+from django.test import RequestFactory
+
+from accounts.models import AuthorProfile
+from blogs.models import Category, Comment, Post
+
+
+@pytest.mark.django_db
+class TestHotQueryPlans:
+    """Each hot query should be answered through one of the composite indexes."""
+
+    @pytest.fixture
+    def data(self, django_user_model):
+        user = django_user_model.objects.create_user(
+            username="author_user", email="author@example.com", password="testpass123"
+        )
+        author = AuthorProfile.objects.create(user=user)
+        category = Category.objects.create(name="Technology")
+        post = Post.objects.create(
+            author=author, title="Indexed", content="Body", category=category, status=Post.Status.PUBLISHED
+        )
+        Comment.objects.create(post=post, user=user, content="First")
+        return author, category, post
+
+    def assert_uses_index(self, queryset, index_name):
+        plan = queryset.explain()
+        assert index_name in plan, plan
+
+    def test_author_published_count(self, data):
+        """Author recount in blogs.signals."""
+        author, _, _ = data
+        queryset = Post.objects.filter(author=author, status=Post.Status.PUBLISHED).order_by()
+        self.assert_uses_index(queryset, "post_author_status_idx")
+
+    def test_author_dashboard(self, data):
+        """PostListView: one author's posts, newest first."""
+        author, _, _ = data
+        self.assert_uses_index(Post.objects.filter(author=author), "post_author_created_idx")
+
+    def test_category_listing(self, data):
+        """Homepage category filter and related posts."""
+        _, category, post = data
+        self.assert_uses_index(Post.objects.filter(category=category), "post_category_created_idx")
+        related = Post.objects.filter(category=category).exclude(id=post.id)[:4]
+        self.assert_uses_index(related, "post_category_created_idx")
+
+    def test_published_listing(self, data):
+        """Public listings scan only the partial index of published posts."""
+        self.assert_uses_index(Post.published.all(), "post_published_idx")
+
+    def test_comment_thread(self, data):
+        """Top-level comments of a post in display order."""
+        _, _, post = data
+        self.assert_uses_index(Comment.objects.filter(post=post, parent=None), "comment_post_thread_idx")
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="full-text indexes are PostgreSQL only")
+    @pytest.mark.parametrize("model, index_name", [(Post, "post_search_idx"), (Comment, "comment_search_idx")])
+    def test_admin_full_text_search(self, data, admin_user, model, index_name):
+        """Admin search: the full-text part goes through the GIN index, next to the username search."""
+        request = RequestFactory().get("/")
+        request.user = admin_user
+        results, _ = site._registry[model].get_search_results(request, model.objects.all(), "first indexed")
+        with connection.cursor() as cursor:
+            # A few rows would be scanned whatever the indexes.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            self.assert_uses_index(results, index_name)
@@ -0,0 +1,92 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from blogs import static_site
+from blogs.models import Comment, Post, StaticPage
+from jobs.models import Job
+
+
+@pytest.fixture
+def site_root(settings, tmp_path):
+    settings.STATIC_SITE_ENABLED = True
+    settings.STATIC_SITE_ROOT = tmp_path
+    return tmp_path
+
+
+@pytest.mark.django_db(transaction=True)
+class TestStaticSite:
+    """Test suite for publish-time static page generation."""
+
+    @pytest.fixture
+    def post(self, site_root, author, run_jobs):
+        post = Post.objects.create(author=author, title="Static Post", content="Hello **static**", status=Post.Status.PUBLISHED)
+        run_jobs()
+        return post
+
+    def page(self, site_root, post):
+        return site_root / post.slug / "index.html"
+
+    def test_publishing_writes_post_and_home_pages(self, site_root, post):
+        assert "<strong>static</strong>" in self.page(site_root, post).read_text()
+        assert "Static Post" in (site_root / "index.html").read_text()
+        assert set(StaticPage.objects.get(path=f"/{post.slug}/").dependencies.values_list("key", flat=True)) == {
+            "categories", f"post:{post.pk}",
+        }
+
+    def test_drafts_and_unpublished_posts_have_no_page(self, site_root, author, post, run_jobs):
+        draft = Post.objects.create(author=author, title="Draft", content="Text")
+        run_jobs()
+        assert not self.page(site_root, draft).exists()
+
+        post.status = Post.Status.DRAFT
+        post.save()
+        run_jobs()
+        assert not self.page(site_root, post).exists()
+        assert "Static Post" not in (site_root / "index.html").read_text()
+
+    def test_comment_regenerates_post_page(self, site_root, post, django_user_model, run_jobs):
+        reader = django_user_model.objects.create_user(
+            username="reader_user", email="reader@example.com", password="testpass123"
+        )
+        Comment.objects.create(post=post, user=reader, content="First!")
+        Comment.objects.create(post=post, user=reader, content="Second!")
+        assert Job.objects.filter(name="blogs.regenerate_static_pages").count() == 1
+
+        run_jobs()
+        assert "First!" in self.page(site_root, post).read_text()
+
+    def test_pages_over_inline_limit_are_removed(self, site_root, settings, post, author, run_jobs):
+        other = Post.objects.create(author=author, title="Other", content="Text", status=Post.Status.PUBLISHED)
+        run_jobs()
+        settings.STATIC_SITE_INLINE_LIMIT = 1
+
+        static_site.regenerate({static_site.CATEGORIES_KEY})
+        built = [self.page(site_root, item).exists() for item in (other, post)]
+        assert built == [True, False]
+
+    def test_anonymous_visitors_get_the_file(self, site_root, client, post, run_jobs):
+        self.page(site_root, post).write_text("pre-rendered")
+
+        response = client.get(reverse("post-detail", kwargs={"slug": post.slug}))
+        assert b"".join(response.streaming_content) == b"pre-rendered"
+        run_jobs()
+        post.refresh_from_db()
+        assert post.views_count == 1
+
+    def test_logged_in_visitors_are_served_by_django(self, site_root, client, post):
+        self.page(site_root, post).write_text("pre-rendered")
+        client.force_login(post.author.user)
+
+        response = client.get(reverse("post-detail", kwargs={"slug": post.slug}))
+        assert b"Hello" in response.content
+
+    def test_full_rebuild_prunes_stale_pages(self, site_root, post):
+        Post.objects.filter(pk=post.pk).update(status=Post.Status.DRAFT)  # bypasses signals
+
+        out = StringIO()
+        call_command("build_static_site", workers=1, stdout=out)
+        assert not self.page(site_root, post).exists()
+        assert "Built 1 pages, removed 1" in out.getvalue()
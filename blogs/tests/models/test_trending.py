@@ -0,0 +1,88 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from blogs.models import Comment, Post, PostActivity, TrendingPost
+from blogs.trending import current_hour, refresh_trending, scores
+from jobs.models import Job
+
+
+@pytest.mark.django_db
+class TestTrending:
+    """Test suite for bucketed activity and the time-decayed trending ranking."""
+
+    @pytest.fixture
+    def posts(self, author):
+        return [
+            Post.objects.create(author=author, title=f"Post {index}", content="Text", status=Post.Status.PUBLISHED)
+            for index in range(3)
+        ]
+
+    def activity(self, post, hours_ago, views=0, comments=0):
+        hour = current_hour() - timedelta(hours=hours_ago)
+        PostActivity.objects.create(post=post, hour=hour, views=views, comments=comments)
+
+    def test_views_and_comments_are_bucketed_by_hour(self, client, posts, django_user_model, run_jobs):
+        post = posts[0]
+        client.get(reverse("post-detail", kwargs={"slug": post.slug}))
+        client.get(reverse("post-detail", kwargs={"slug": post.slug}))
+        run_jobs()
+        reader = django_user_model.objects.create_user(username="reader", email="reader@example.com", password="testpass123")
+        Comment.objects.create(post=post, user=reader, content="Nice")
+
+        bucket = PostActivity.objects.get(post=post)
+        assert (bucket.hour, bucket.views, bucket.comments) == (current_hour(), 2, 1)
+        refresh = Job.objects.get(name="blogs.refresh_trending")
+        assert refresh.run_at > timezone.now()
+
+    def test_recent_activity_outweighs_older_activity(self, settings, posts):
+        settings.TRENDING_HALF_LIFE_HOURS = 12
+        settings.TRENDING_COMMENT_WEIGHT = 5
+        self.activity(posts[0], hours_ago=24, views=100)  # 100 / 4
+        self.activity(posts[1], hours_ago=0, views=20, comments=2)  # 20 + 2 * 5
+        self.activity(posts[2], hours_ago=12, views=40)  # 40 / 2
+        self.activity(posts[2], hours_ago=100, views=1000)  # outside the window
+
+        ranked = scores(limit=10)
+        assert [post_id for post_id, _ in ranked] == [posts[1].pk, posts[0].pk, posts[2].pk]
+        assert [score for _, score in ranked] == pytest.approx([30, 25, 20])
+
+    def test_drafts_are_not_ranked(self, posts):
+        Post.objects.filter(pk=posts[0].pk).update(status=Post.Status.DRAFT)
+        self.activity(posts[0], hours_ago=0, views=10)
+        assert scores() == []
+
+    def test_refresh_stores_the_ranking(self, settings, posts):
+        settings.TRENDING_SIZE = 2
+        settings.STATIC_SITE_ENABLED = True
+        self.activity(posts[0], hours_ago=1, views=5)
+        self.activity(posts[1], hours_ago=0, views=10)
+        self.activity(posts[2], hours_ago=0, views=1)
+        self.activity(posts[2], hours_ago=80, views=50)
+
+        refresh_trending()
+        assert list(TrendingPost.objects.values_list("rank", "post_id")) == [(1, posts[1].pk), (2, posts[0].pk)]
+        assert PostActivity.objects.count() == 3
+        assert Job.objects.filter(name="blogs.refresh_trending").exists()
+        regenerate = Job.objects.filter(name="blogs.regenerate_static_pages")
+        assert list(regenerate.values_list("args", flat=True)) == [[["trending"], []]]
+
+        regenerate.delete()
+        refresh_trending()  # same ranking: nothing to regenerate
+        assert not regenerate.exists()
+
+    def test_trending_is_served_in_one_query(self, client, posts, django_assert_num_queries):
+        self.activity(posts[2], hours_ago=0, views=10)
+        self.activity(posts[0], hours_ago=0, views=5)
+        refresh_trending()
+
+        with django_assert_num_queries(1):
+            response = client.get("/api/v1/blogs/posts/trending/")
+        assert [(entry["rank"], entry["slug"]) for entry in response.json()] == [(1, posts[2].slug), (2, posts[0].slug)]
+        assert response.json()[0]["author"] == "author_user"
+
+        response = client.get(reverse("home"))
+        assert response.context["trending"][0].post == posts[2]
+        assert "Trending" in response.content.decode()
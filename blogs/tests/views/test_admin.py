@@ -0,0 +1,203 @@
+from unittest import mock
+
+import pytest
+from django.contrib.admin.sites import site
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import F, Value
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import AuthorProfile
+from blogs.models import Category, Comment, Post
+from jobs.models import Job
+from utils.admin import EstimatedCountPaginator, estimated_count
+
+
+@pytest.mark.django_db
+class TestAdminPerformance:
+    """Test suite for the post and comment admin on large tables."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+        yield
+        cache.clear()
+
+    @pytest.fixture
+    def author(self, admin_user):
+        return AuthorProfile.objects.create(user=admin_user)
+
+    @pytest.fixture
+    def category(self):
+        return Category.objects.create(name="Django")
+
+    def make_posts(self, author, category, count, start=0):
+        return [
+            Post.objects.create(author=author, category=category, title=f"Post {index}", content="Text")
+            for index in range(start, start + count)
+        ]
+
+    def count_queries(self, client, url):
+        with CaptureQueriesContext(connection) as context:
+            assert client.get(url).status_code == 200
+        return len(context)
+
+    def test_post_changelist_queries_do_not_grow_with_rows(self, admin_client, author, category):
+        url = reverse("admin:blogs_post_changelist")
+        self.make_posts(author, category, 2)
+        few = self.count_queries(admin_client, url)
+        self.make_posts(author, category, 10, start=2)
+        cache.clear()
+        assert self.count_queries(admin_client, url) == few
+
+    def test_comment_changelist_queries_do_not_grow_with_rows(self, admin_client, admin_user, author, category):
+        url = reverse("admin:blogs_comment_changelist")
+        post, other = self.make_posts(author, category, 2)
+        parent = Comment.objects.create(post=post, user=admin_user, content="First")
+        few = self.count_queries(admin_client, url)
+        for index in range(10):
+            Comment.objects.create(post=other, user=admin_user, content=f"Reply {index}", parent=parent)
+        assert self.count_queries(admin_client, url) == few
+
+    def test_date_hierarchy_buckets_are_cached(self, admin_client, author, category):
+        url = reverse("admin:blogs_post_changelist")
+        self.make_posts(author, category, 3)
+        first = self.count_queries(admin_client, url)
+        second = self.count_queries(admin_client, url)
+        assert second < first
+
+        response = admin_client.get(url, {"q": "Post 1"})
+        assert [post.title for post in response.context["cl"].result_list] == ["Post 1"]
+
+    def test_inline_shows_the_latest_comments(self, settings, admin_client, admin_user, author, category):
+        settings.ADMIN_INLINE_COMMENTS = 3
+        post = self.make_posts(author, category, 1)[0]
+        comments = [Comment.objects.create(post=post, user=admin_user, content=f"Comment {index}") for index in range(5)]
+
+        response = admin_client.get(reverse("admin:blogs_post_change", args=[post.pk]))
+        formset = response.context["inline_admin_formsets"][0].formset
+        assert [form.instance.pk for form in formset.forms] == [comment.pk for comment in comments[:1:-1]]
+        assert f"?post__id__exact={post.pk}" in response.content.decode()
+
+    def test_full_text_search_keeps_the_other_search_fields(self, admin_user, author, category):
+        post = self.make_posts(author, category, 1)[0]
+        other_author = AuthorProfile.objects.create(
+            user=type(admin_user).objects.create_user(
+                username="someone", email="someone@example.com", password="testpass123"
+            )
+        )
+        other = Post.objects.create(author=other_author, category=category, title="Unrelated", content="Text")
+
+        # Stands in for PostgreSQL: the "document" is the title, matched exactly.
+        model_admin = site._registry[Post]
+        request = RequestFactory().get("/")
+        request.user = admin_user
+        with (
+            mock.patch.object(connection, "vendor", "postgresql"),
+            mock.patch("utils.admin.SearchQuery", lambda term, **kwargs: Value(term)),
+            mock.patch.object(model_admin, "search_vector", lambda: F("title")),
+        ):
+            def search(term):
+                return list(model_admin.get_search_results(request, Post.objects.order_by("pk"), term)[0])
+
+            assert search("Post 0") == [post]
+            assert search("someone") == [other]
+            assert search("Text") == []  # body fields are only searched through the document
+
+    def test_counts_are_exact_without_postgres(self, author, category):
+        self.make_posts(author, category, 3)
+        posts = Post.objects.order_by("pk")
+        assert estimated_count(posts) is None
+        assert EstimatedCountPaginator(posts, 2).count == 3
+
+
+@pytest.mark.django_db
+class TestBulkActions:
+    """Test suite for the set-based bulk actions of the post admin."""
+
+    @pytest.fixture
+    def author(self, admin_user):
+        return AuthorProfile.objects.create(user=admin_user)
+
+    @pytest.fixture
+    def category(self):
+        return Category.objects.create(name="Django")
+
+    def make_posts(self, author, count, prefix="Post", **fields):
+        return [
+            Post.objects.create(author=author, title=f"{prefix} {index}", content="Text", **fields)
+            for index in range(count)
+        ]
+
+    def act(self, client, action, posts, **data):
+        url = reverse("admin:blogs_post_changelist")
+        with CaptureQueriesContext(connection) as context:
+            response = client.post(url, {"action": action, "_selected_action": [post.pk for post in posts], **data})
+        assert response.status_code == 302
+        return len(context)
+
+    def test_publish_is_one_statement_whatever_the_selection(self, admin_client, author):
+        few = self.act(admin_client, "publish_posts", self.make_posts(author, 2))
+        assert self.act(admin_client, "publish_posts", self.make_posts(author, 20, prefix="More")) == few
+
+        assert not Post.objects.exclude(status=Post.Status.PUBLISHED).exists()
+        assert not Post.objects.filter(published_at__isnull=True).exists()
+        author.refresh_from_db()
+        assert (author.total_posts, author.stats.published_posts) == (22, 22)
+
+    def test_unpublish_keeps_the_publication_date(self, admin_client, author):
+        posts = self.make_posts(author, 3, status=Post.Status.PUBLISHED)
+        published_at = Post.objects.get(pk=posts[0].pk).published_at
+
+        self.act(admin_client, "unpublish_posts", posts[:2])
+        assert list(Post.objects.filter(status=Post.Status.DRAFT).values_list("pk", flat=True).order_by("pk")) == [
+            posts[0].pk, posts[1].pk
+        ]
+        assert Post.objects.get(pk=posts[0].pk).published_at == published_at
+        author.refresh_from_db()
+        assert author.total_posts == 1
+
+    def test_move_to_category(self, admin_client, author, category):
+        posts = self.make_posts(author, 3)
+        self.act(admin_client, "move_to_category", posts[:2], category=category.pk)
+        assert Post.objects.filter(category=category).count() == 2
+
+        self.act(admin_client, "move_to_category", posts, category="")
+        assert not Post.objects.filter(category__isnull=False).exists()
+
+    def test_delete_is_a_fixed_number_of_statements(self, admin_client, admin_user, author):
+        def make_posts(count, prefix):
+            posts = self.make_posts(author, count, prefix=prefix, status=Post.Status.PUBLISHED)
+            for post in posts:
+                parent = Comment.objects.create(post=post, user=admin_user, content="Hi")
+                Comment.objects.create(post=post, user=admin_user, content="Reply", parent=parent)
+            return posts
+
+        few = self.act(admin_client, "delete_selected", make_posts(2, "Post"), post="yes")
+        assert self.act(admin_client, "delete_selected", make_posts(20, "More"), post="yes") == few
+        assert not Post.objects.exists()
+        assert not Comment.objects.exists()
+
+    def test_delete_applies_side_effects_once(self, settings, admin_client, admin_user, author, run_jobs):
+        settings.STATIC_SITE_ENABLED = True
+        posts = self.make_posts(author, 5, status=Post.Status.PUBLISHED)
+        for post in posts:
+            Comment.objects.create(post=post, user=admin_user, content="Hi")
+        run_jobs()
+
+        response = admin_client.post(
+            reverse("admin:blogs_post_changelist"),
+            {"action": "delete_selected", "_selected_action": [post.pk for post in posts[:4]]},
+        )
+        assert dict(response.context["model_count"]) == {"posts": 4, "Comments": 4}
+
+        self.act(admin_client, "delete_selected", posts[:4], post="yes")
+        assert list(Post.objects.values_list("pk", flat=True)) == [posts[4].pk]
+        assert Comment.objects.count() == 1
+        author.refresh_from_db()
+        assert (author.total_posts, author.stats.published_posts, author.stats.total_comments) == (1, 1, 1)
+        assert Job.objects.filter(name="blogs.regenerate_static_pages").count() == 1
+        assert Job.objects.filter(name="blogs.update_post_sitemap").count() == 1
+        assert not Job.objects.filter(name="blogs.refresh_author_counts").exists()
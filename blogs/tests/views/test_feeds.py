@@ -0,0 +1,59 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from blogs.models import Category, Post
+
+
+@pytest.mark.django_db(transaction=True)
+class TestFeeds:
+    """Test suite for the cached RSS/Atom feeds."""
+
+    @pytest.fixture
+    def posts(self, author):
+        tech = Category.objects.create(name="Tech")
+        music = Category.objects.create(name="Music")
+        return [
+            Post.objects.create(author=author, title="Tech Post", content="About **tech**", category=tech,
+                                status=Post.Status.PUBLISHED),
+            Post.objects.create(author=author, title="Music Post", content="About music", category=music,
+                                status=Post.Status.PUBLISHED),
+            Post.objects.create(author=author, title="Draft Post", content="Secret", category=tech),
+        ]
+
+    def test_site_feed_lists_published_posts(self, client, posts):
+        response = client.get(reverse("feed-rss"))
+        body = response.content.decode()
+        assert response["Content-Type"].startswith("application/rss+xml")
+        assert "Tech Post" in body and "Music Post" in body
+        assert "Draft Post" not in body
+        assert "About tech" in body
+
+    def test_category_and_author_feeds(self, client, posts, author):
+        body = client.get(reverse("category-feed-atom", kwargs={"slug": "tech"})).content.decode()
+        assert "Tech Post" in body and "Music Post" not in body
+
+        body = client.get(reverse("author-feed-rss", kwargs={"username": "author_user"})).content.decode()
+        assert "Tech Post" in body and "Music Post" in body
+
+        assert client.get(reverse("category-feed-rss", kwargs={"slug": "missing"})).status_code == 404
+        assert client.get(reverse("author-feed-rss", kwargs={"username": "missing"})).status_code == 404
+
+    def test_feed_is_rendered_once_per_change(self, client, posts):
+        first = client.get(reverse("feed-rss"))
+
+        with CaptureQueriesContext(connection) as queries:
+            again = client.get(reverse("feed-rss"))
+        assert len(queries) == 0
+        assert again.content == first.content
+
+        not_modified = client.get(reverse("feed-rss"), HTTP_IF_NONE_MATCH=first["ETag"])
+        assert not_modified.status_code == 304
+        assert client.get(reverse("feed-rss"), HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]).status_code == 304
+
+        posts[0].title = "Renamed Post"
+        posts[0].save()
+        changed = client.get(reverse("feed-rss"), HTTP_IF_NONE_MATCH=first["ETag"])
+        assert changed.status_code == 200
+        assert "Renamed Post" in changed.content.decode()
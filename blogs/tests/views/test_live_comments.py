@@ -0,0 +1,84 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+
+from accounts.models import AuthorProfile, User
+from blogs.live import broker, stream
+from blogs.models import Comment, Post
+
+
+def parse(chunk):
+    fields = dict(line.split(": ", 1) for line in chunk.decode().strip().splitlines())
+    return fields["event"], json.loads(fields["data"])
+
+
+@override_settings(LIVE_COMMENTS_POLL_INTERVAL=0.1)
+class LiveCommentTests(TransactionTestCase):
+    """
+    Tests for the server-sent events stream of new comments.
+    """
+
+    def setUp(self):
+        author = AuthorProfile.objects.create(
+            user=User.objects.create_user(username="author_user", email="author@example.com", password="testpass123")
+        )
+        self.reader = User.objects.create_user(username="reader_user", email="reader@example.com", password="testpass123")
+        self.post = Post.objects.create(author=author, title="Live Post", content="Text", status=Post.Status.PUBLISHED)
+        self.first = Comment.objects.create(post=self.post, user=self.reader, content="Already on the page")
+        self.url = reverse("post-comment-stream", kwargs={"slug": self.post.slug})
+
+    def tearDown(self):
+        broker.subscribers.clear()
+
+    async def next_event(self, stream):
+        return parse(await asyncio.wait_for(anext(stream), 5))
+
+    async def test_new_comments_are_pushed(self):
+        response = await self.async_client.get(self.url, {"after": self.first.pk})
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), b"retry: 3000\n\n")
+
+        await Comment.objects.acreate(post=self.post, user=self.reader, content="Live!", parent=self.first)
+        name, comment = await self.next_event(stream)
+        self.assertEqual((name, comment["content"], comment["parent_id"]), ("comment", "Live!", self.first.pk))
+        self.assertEqual(comment["username"], "reader_user")
+        await stream.aclose()
+
+    async def test_reconnect_replays_missed_comments(self):
+        missed = await Comment.objects.acreate(post=self.post, user=self.reader, content="While away")
+
+        response = await self.async_client.get(self.url, headers={"Last-Event-ID": str(self.first.pk)})
+        stream = aiter(response.streaming_content)
+        await anext(stream)
+        name, comment = await self.next_event(stream)
+        self.assertEqual(comment["id"], missed.pk)
+        await stream.aclose()
+
+    async def test_unknown_post_is_404(self):
+        response = await self.async_client.get(reverse("post-comment-stream", kwargs={"slug": "missing"}))
+        self.assertEqual(response.status_code, 404)
+
+    async def test_other_posts_comments_are_not_sent(self):
+        other = await sync_to_async(Post.objects.create)(
+            author=self.post.author, title="Other", content="Text", status=Post.Status.PUBLISHED
+        )
+        response = await self.async_client.get(self.url)
+        stream = aiter(response.streaming_content)
+        await anext(stream)
+
+        await Comment.objects.acreate(post=other, user=self.reader, content="Elsewhere")
+        await Comment.objects.acreate(post=self.post, user=self.reader, content="Here")
+        name, comment = await self.next_event(stream)
+        self.assertEqual(comment["content"], "Here")
+        await stream.aclose()
+
+    async def test_closed_streams_unsubscribe(self):
+        events = stream(self.post.pk)
+        await anext(events)
+        self.assertEqual(len(broker.subscribers[self.post.pk]), 1)
+        await events.aclose()
+        self.assertEqual(broker.subscribers, {})
@@ -0,0 +1,95 @@
+from io import BytesIO
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from PIL import Image
+
+from blogs.models import Post
+from blogs.stats import view_buffer_key
+from jobs.models import Job
+
+
+def upload(size):
+    buffer = BytesIO()
+    Image.new("RGB", size, "red").save(buffer, format="JPEG")
+    return SimpleUploadedFile("cover.jpg", buffer.getvalue(), content_type="image/jpeg")
+
+
+@pytest.mark.django_db
+class TestPostJobs:
+    """Test suite for the work post views leave to background jobs."""
+
+    @pytest.fixture
+    def post(self, author):
+        return Post.objects.create(author=author, title="Jobs Post", content="Text", status=Post.Status.PUBLISHED)
+
+    @pytest.fixture
+    def buffered(self, settings):
+        """Stands in for Redis: the test's LocMem cache is shared with the in-process worker."""
+        settings.VIEW_FLUSH_DELAY = 0
+        with mock.patch("blogs.stats.buffers_views", return_value=True):
+            yield
+
+    def view(self, client, post):
+        client.get(reverse("post-detail", kwargs={"slug": post.slug}))
+
+    def test_views_are_written_right_away_without_redis(self, client, post):
+        self.view(client, post)
+        post.refresh_from_db()
+        assert (post.views_count, post.author.stats.total_views) == (1, 1)
+        assert not Job.objects.filter(name="blogs.record_views").exists()
+
+    def test_views_are_counted_in_the_background(self, client, buffered, post, run_jobs):
+        self.view(client, post)
+        post.refresh_from_db()
+        assert post.views_count == 0
+
+        run_jobs()
+        post.refresh_from_db()
+        assert (post.views_count, post.author.stats.total_views) == (1, 1)
+
+    def test_views_are_written_once_per_burst(self, client, buffered, post, run_jobs):
+        self.view(client, post)
+        with CaptureQueriesContext(connection) as context:
+            self.view(client, post)
+        assert not any("jobs_job" in query["sql"] for query in context)  # a flush is pending
+        assert Job.objects.filter(name="blogs.record_views").count() == 1
+
+        run_jobs()
+        post.refresh_from_db()
+        assert (post.views_count, post.author.stats.total_views) == (2, 2)
+
+        self.view(client, post)
+        run_jobs()
+        post.refresh_from_db()
+        assert post.views_count == 3
+
+    def test_evicted_buffer_is_skipped(self, client, buffered, post, run_jobs):
+        self.view(client, post)
+        cache.delete(view_buffer_key(post.slug))
+        run_jobs()
+        post.refresh_from_db()
+        assert post.views_count == 0
+        assert not Job.objects.filter(name="blogs.record_views").exists()
+
+    def test_cover_images_are_shrunk_in_the_background(self, client, settings, tmp_path, author, run_jobs):
+        settings.MEDIA_ROOT = tmp_path
+        settings.COVER_IMAGE_MAX_SIZE = (200, 100)
+        client.force_login(author.user)
+
+        client.post(reverse("post-create"), {
+            "title": "Covered", "content": "Text", "status": Post.Status.PUBLISHED, "cover_image": upload((800, 600)),
+        })
+        assert Job.objects.filter(name="blogs.optimize_cover_image").exists()
+
+        run_jobs()
+        post = Post.objects.get(title="Covered")
+        with Image.open(post.cover_image.path) as image:
+            assert image.size == (133, 100)
+        author.refresh_from_db()
+        assert author.total_posts == 1
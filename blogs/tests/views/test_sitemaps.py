@@ -0,0 +1,72 @@
+import xml.etree.ElementTree as ET
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from accounts.models import AuthorProfile
+from blogs.models import Category, Post
+
+
+NS = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+
+
+def locations(content):
+    return [node.text for node in ET.fromstring(content).findall(".//sm:loc", NS)]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestSitemaps:
+    """Test suite for the precomputed, chunked sitemaps."""
+
+    @pytest.fixture(autouse=True)
+    def sitemap_settings(self, settings, tmp_path):
+        settings.SITEMAP_ROOT = tmp_path
+        settings.SITEMAP_MAX_URLS = 3
+        settings.SITE_URL = "https://blog.example"
+
+    @pytest.fixture
+    def posts(self, django_user_model):
+        user = django_user_model.objects.create_user(
+            username="author_user", email="author@example.com", password="testpass123"
+        )
+        author = AuthorProfile.objects.create(user=user)
+        category = Category.objects.create(name="Tech")
+        posts = [
+            Post.objects.create(author=author, title=f"Post {index}", content="Text", category=category,
+                                status=Post.Status.PUBLISHED)
+            for index in range(5)
+        ]
+        Post.objects.create(author=author, title="Draft", content="Text")
+        return posts
+
+    def test_index_splits_posts_into_chunks(self, client, posts):
+        index = client.get(reverse("sitemap"))
+        assert index["Content-Type"] == "application/xml"
+        sections = locations(b"".join(index.streaming_content))
+        assert sections[0] == "https://blog.example/sitemaps/categories.xml"
+
+        urls = []
+        for section in sections[1:]:
+            name = section.rsplit("/", 1)[1].removesuffix(".xml")
+            response = client.get(reverse("sitemap-section", kwargs={"name": name}))
+            found = locations(b"".join(response.streaming_content))
+            assert len(found) <= 3
+            urls += found
+
+        assert sorted(urls) == sorted(f"https://blog.example/{post.slug}/" for post in posts)
+
+    def test_publish_updates_built_sitemaps(self, client, posts, tmp_path, run_jobs):
+        call_command("build_sitemaps", stdout=StringIO())
+
+        draft = Post.objects.get(title="Draft")
+        draft.status = Post.Status.PUBLISHED
+        draft.save()
+        run_jobs()
+
+        section = tmp_path / f"posts-{draft.pk // 3}.xml"
+        assert f"https://blog.example/{draft.slug}/" in locations(section.read_bytes())
+
+    def test_unknown_section_is_404(self, client, posts):
+        assert client.get(reverse("sitemap-section", kwargs={"name": "posts-999"})).status_code == 404
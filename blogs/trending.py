@@ -0,0 +1,112 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Case, F, FloatField, Sum, Value, When
+from django.utils import timezone
+
+from jobs.queue import enqueue, job
+from .models import Post, PostActivity, TrendingPost
+
+
+def current_hour(now=None):
+    return (now or timezone.now()).replace(minute=0, second=0, microsecond=0)
+
+
+def record(post_id, views=0, comments=0):
+    """
+    Add views and comments to the post's bucket for the current hour: one
+    UPDATE, or an INSERT for the first event of the hour, which also makes
+    sure a ranking refresh is queued.
+    """
+    hour = current_hour()
+    bucket = PostActivity.objects.filter(post_id=post_id, hour=hour)
+    changes = {"views": F("views") + views, "comments": F("comments") + comments}
+    if bucket.update(**changes):
+        return
+    try:
+        with transaction.atomic():
+            PostActivity.objects.create(post_id=post_id, hour=hour, views=views, comments=comments)
+    except IntegrityError:
+        # Created by a concurrent event in the meantime.
+        bucket.update(**changes)
+    schedule_refresh()
+
+
+def scores(now=None, limit=None):
+    """
+    Return `(post id, score)` of published posts with activity in the last
+    TRENDING_WINDOW_HOURS hours, best first.
+
+    A post's score is its views plus TRENDING_COMMENT_WEIGHT per comment,
+    summed over its hourly buckets with each hour's weight halved every
+    TRENDING_HALF_LIFE_HOURS. The weights of the window's hours are computed
+    once and passed in as a CASE, so the database scores every post in one
+    aggregate query and only the top `limit` rows come back.
+    """
+    hour = current_hour(now)
+    window = getattr(settings, "TRENDING_WINDOW_HOURS", 72)
+    half_life = getattr(settings, "TRENDING_HALF_LIFE_HOURS", 12)
+    comment_weight = getattr(settings, "TRENDING_COMMENT_WEIGHT", 5)
+
+    decay = Case(
+        *[
+            When(hour=hour - timedelta(hours=age), then=Value(0.5 ** (age / half_life)))
+            for age in range(window)
+        ],
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+    ranked = (
+        PostActivity.objects.filter(hour__gt=hour - timedelta(hours=window), post__status=Post.Status.PUBLISHED)
+        .values("post_id")
+        .annotate(score=Sum((F("views") + F("comments") * comment_weight) * decay, output_field=FloatField()))
+        .order_by("-score", "-post_id")
+        .values_list("post_id", "score")
+    )
+    return list(ranked if limit is None else ranked[:limit])
+
+
+def ranked():
+    """
+    The stored ranking with each post's listing fields, in one query.
+    """
+    return (
+        TrendingPost.objects.filter(post__status=Post.Status.PUBLISHED)
+        .select_related("post__author__user")
+        .defer("post__content", "post__content_html", "post__content_toc")
+    )
+
+
+@job("blogs.refresh_trending")
+def refresh_trending():
+    """
+    Replace the stored ranking with the top TRENDING_SIZE posts and drop
+    buckets that left the window. Queues itself again after
+    TRENDING_REFRESH_INTERVAL seconds while any post has recent activity.
+    """
+    now = timezone.now()
+    top = scores(now, getattr(settings, "TRENDING_SIZE", 10))
+    previous = list(TrendingPost.objects.values_list("post_id", flat=True))
+
+    with transaction.atomic():
+        TrendingPost.objects.all().delete()
+        TrendingPost.objects.bulk_create([
+            TrendingPost(post_id=post_id, rank=rank, score=score, computed_at=now)
+            for rank, (post_id, score) in enumerate(top, start=1)
+        ])
+    window = getattr(settings, "TRENDING_WINDOW_HOURS", 72)
+    PostActivity.objects.filter(hour__lte=current_hour(now) - timedelta(hours=window)).delete()
+
+    if [post_id for post_id, _ in top] != previous:
+        from . import static_site  # imports the views, which import this module
+
+        static_site.schedule({static_site.TRENDING_KEY})
+    if top:
+        schedule_refresh()
+
+
+def schedule_refresh():
+    """Queue a refresh TRENDING_REFRESH_INTERVAL seconds from now, unless one is queued already."""
+    delay = timedelta(seconds=getattr(settings, "TRENDING_REFRESH_INTERVAL", 300))
+    enqueue(refresh_trending, dedupe_key="trending", run_at=timezone.now() + delay)
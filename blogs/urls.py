@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views
+from . import feeds, views
 
 urlpatterns = [
     path('', views.AllPostsView.as_view(), name='home' ),
@@ -7,8 +7,18 @@ urlpatterns = [
     path("create/", views.PostCreateView.as_view(), name="post-create"),
     path("about/", views.AboutView.as_view(), name="about"),
     path("contact/", views.ContactView.as_view(), name="contact"),
+    path("sitemap.xml", views.sitemap_index, name="sitemap"),
+    path("sitemaps/<slug:name>.xml", views.sitemap_section, name="sitemap-section"),
+    path("feeds/rss/", feeds.cached_feed(feeds.LatestPostsFeed), name="feed-rss"),
+    path("feeds/atom/", feeds.cached_feed(feeds.LatestPostsAtomFeed), name="feed-atom"),
+    path("feeds/categories/<slug:slug>/rss/", feeds.cached_feed(feeds.CategoryPostsFeed), name="category-feed-rss"),
+    path("feeds/categories/<slug:slug>/atom/", feeds.cached_feed(feeds.CategoryPostsAtomFeed), name="category-feed-atom"),
+    path("feeds/authors/<str:username>/rss/", feeds.cached_feed(feeds.AuthorPostsFeed), name="author-feed-rss"),
+    path("feeds/authors/<str:username>/atom/", feeds.cached_feed(feeds.AuthorPostsAtomFeed), name="author-feed-atom"),
     path("<slug:slug>/", views.PostDetailView.as_view(), name="post-detail"),
     path("<slug:slug>/edit/", views.PostUpdateView.as_view(), name="post-update"),
+    path("<slug:slug>/analytics/", views.PostAnalyticsView.as_view(), name="post-analytics"),
     path("<slug:slug>/delete/", views.PostDeleteView.as_view(), name="post-delete"),
+    path("<slug:slug>/comments/stream/", views.comment_stream, name="post-comment-stream"),
 
 ]
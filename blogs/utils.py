@@ -1,10 +1,16 @@
 from django.db.models import Q
 from .models import Post
 
-def search_posts(search_query):
+def search_posts(search_query, queryset=None):
+    """
+    Filter `queryset` (published posts by default) by title, content or
+    category name.
+    """
+    if queryset is None:
+        queryset = Post.published.all()
     if not search_query:
-        return Post.objects.all()
-    return Post.objects.filter(
+        return queryset
+    return queryset.filter(
         Q(title__icontains=search_query) |
         Q(content__icontains=search_query) |
         Q(category__name__icontains=search_query)
@@ -1,13 +1,25 @@
+from datetime import timedelta
+
 from django.shortcuts import render
 from django.views import View
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib import messages
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 from django.utils.text import slugify
-from .models import Post, Category, Comment
+from .models import Post, Comment
+from .cache import category_cache
+from . import live, sitemaps, trending
+from .stats import count_view
+from .tasks import optimize_cover_image
+from analytics import series
+from jobs.queue import enqueue
+from accounts.models import AuthorStats
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from .utils import search_posts
 from django.views.generic import TemplateView
+from django.http import FileResponse, Http404, StreamingHttpResponse
 
 
 
@@ -20,11 +32,12 @@ class AllPostsView(View):
     """
 
     template_name = "index.html"
+    paginate_by = 5
 
     def get(self, request, *args, **kwargs):
-        # Fetch all posts with related data for efficiency
+        # Fetch published posts with related data for efficiency
         posts_queryset = (
-            Post.objects.all()
+            Post.published.all()
             .select_related("author", "category")
         )
 
@@ -36,11 +49,11 @@ class AllPostsView(View):
 
         # Apply search filter if a query is present
         if search_query:
-            posts_queryset = search_posts(search_query)
+            posts_queryset = search_posts(search_query, posts_queryset)
 
         # Set up pagination
         page = request.GET.get("page", 1)
-        paginator = Paginator(posts_queryset, 5)  # 5 posts per page
+        paginator = Paginator(posts_queryset, self.paginate_by)
 
         try:
             posts = paginator.page(page)
@@ -54,6 +67,7 @@ class AllPostsView(View):
         context = {
             "posts": posts,
             "search_query": search_query,
+            "trending": trending.ranked(),
         }
 
         return render(request, self.template_name, context)
@@ -70,7 +84,8 @@ class PostListView(View):
         user = request.user
         author_profile = getattr(user, "authorprofile", None)
         posts = Post.objects.filter(author=author_profile).select_related("author", "category")
-        return render(request, self.template_name, {"posts": posts})
+        stats = AuthorStats.objects.filter(author=author_profile).first()
+        return render(request, self.template_name, {"posts": posts, "stats": stats})
 
 
 class PostDetailView(View):
@@ -80,25 +95,28 @@ class PostDetailView(View):
 
     template_name = "post.html"
 
+    def get_context_data(self, post):
+        """Template context for `post`; also used by `blogs.static_site`."""
+        category_cache.attach([post])
+        related_posts = list(Post.published.filter(category_id=post.category_id).exclude(id=post.id)[:4])
+        return {"post": post, "related_posts": related_posts}
+
     def get(self, request, slug, *args, **kwargs):
-        post = get_object_or_404(Post, slug=slug, status=Post.Status.PUBLISHED)
-        categories = Category.objects.all()
-        related_posts = Post.objects.filter(category=post.category).exclude(id=post.id).distinct()[:4]
+        post = get_object_or_404(Post.published, slug=slug)
 
         search_query = request.GET.get("query", "").strip()
         if search_query:
             return redirect(f"/?query={search_query}")
 
 
-        # Increment view counter
-        post.increment_views()
+        # Count the view in the background
+        count_view(post.slug)
 
-        return render(request, self.template_name, {"post": post, "categories": categories, "related_posts":related_posts})
+        return render(request, self.template_name, self.get_context_data(post))
     
     def post(self, request, slug, *args, **kwargs):
         """Handle new comment submissions."""
-        post = get_object_or_404(Post, slug=slug, status=Post.Status.PUBLISHED)
-        categories = Category.objects.all()
+        post = get_object_or_404(Post.published, slug=slug)
 
         content = request.POST.get("message", "").strip()
         parent_id = request.POST.get("parent_id")  # for reply comments
@@ -130,8 +148,7 @@ class PostCreateView(LoginRequiredMixin, View):
     template_name = "post-create.html"
 
     def get(self, request, *args, **kwargs):
-        categories = Category.objects.all()
-        return render(request, self.template_name, {"categories": categories,})
+        return render(request, self.template_name)
 
     def post(self, request, *args, **kwargs):
         user = request.user
@@ -151,7 +168,7 @@ class PostCreateView(LoginRequiredMixin, View):
         if not title or not content:
             return redirect("post-create")
 
-        category = Category.objects.filter(name=category_id).first()
+        category = category_cache.get(name=category_id)
 
         post = Post.objects.create(
             author=user.authorprofile,
@@ -162,8 +179,8 @@ class PostCreateView(LoginRequiredMixin, View):
             cover_image=cover_image,
             status=status,
         )
-
-
+        if cover_image:
+            enqueue(optimize_cover_image, post.pk)
 
         return redirect("post-list")
 
@@ -182,9 +199,7 @@ class PostUpdateView(LoginRequiredMixin, View):
         if post.author.user != request.user:
             return redirect("post-list")
 
-        categories = Category.objects.all()
-
-        return render(request, self.template_name, {"post": post, "categories": categories,})
+        return render(request, self.template_name, {"post": post,})
 
     def post(self, request, slug, *args, **kwargs):
         post = get_object_or_404(Post, slug=slug)
@@ -196,7 +211,7 @@ class PostUpdateView(LoginRequiredMixin, View):
         post.content = request.POST.get("content", "").strip()
         post.status = request.POST.get("status", Post.Status.DRAFT)
         category_name = request.POST.get("category") or None
-        category = Category.objects.filter(name=category_name).first()
+        category = category_cache.get(name=category_name)
         post.category = category
 
         cover_image = request.FILES.get("cover_image")
@@ -204,10 +219,59 @@ class PostUpdateView(LoginRequiredMixin, View):
             post.cover_image = cover_image
 
         post.save()
+        if cover_image:
+            enqueue(optimize_cover_image, post.pk)
 
         return redirect("post-list")
 
 
+class PostAnalyticsView(LoginRequiredMixin, View):
+    """
+    Chart the views of a post over time for its author.
+    """
+
+    template_name = "post-analytics.html"
+
+    @staticmethod
+    def get_date(value):
+        try:
+            return parse_date(value or "")
+        except ValueError:  # well formed but invalid, e.g. 2025-02-30
+            return None
+
+    def get(self, request, slug, *args, **kwargs):
+        post = get_object_or_404(Post.objects.only("pk", "slug", "title", "author"), slug=slug)
+
+        # Only author can see the analytics
+        if post.author.user_id != request.user.pk:
+            return redirect("post-list")
+
+        today = timezone.now().date()
+        end = self.get_date(request.GET.get("end")) or today
+        start = self.get_date(request.GET.get("start")) or end - timedelta(days=29)
+        resolution = "hour" if request.GET.get("resolution") == "hour" else "day"
+        try:
+            series.check_range(start, end, resolution)
+        except ValueError as error:
+            messages.error(request, str(error))
+            start, end, resolution = today - timedelta(days=29), today, "day"
+
+        points = series.views(post.pk, start, end, resolution)
+        peak = max((views for _, views in points), default=0)
+        bars = [
+            {"time": time, "views": views, "height": views * 100 / peak if peak else 0}
+            for time, views in points
+        ]
+        return render(request, self.template_name, {
+            "post": post,
+            "bars": bars,
+            "total": sum(views for _, views in points),
+            "start": start,
+            "end": end,
+            "resolution": resolution,
+        })
+
+
 class PostDeleteView(LoginRequiredMixin, View):
     """
     Allow authors to delete their own posts.
@@ -245,3 +309,40 @@ class ContactView(TemplateView):
     template_name = "contact.html"
 
 
+
+
+def sitemap_index(request):
+    """
+    Serve the precomputed sitemap index, building all sitemaps on first use.
+    """
+    path = sitemaps.root() / sitemaps.INDEX_FILE
+    if not path.exists():
+        sitemaps.build_all()
+    return FileResponse(open(path, "rb"), content_type="application/xml")
+
+
+def sitemap_section(request, name):
+    """Serve one precomputed child sitemap."""
+    try:
+        return FileResponse(open(sitemaps.root() / f"{name}.xml", "rb"), content_type="application/xml")
+    except FileNotFoundError:
+        raise Http404("Sitemap does not exist.")
+
+
+async def comment_stream(request, slug):
+    """
+    Live comments of a published post as server-sent events, see
+    `blogs.live`. Meant to be served by an ASGI server, where an idle
+    stream costs a coroutine instead of a worker thread.
+    """
+    post_id = await Post.published.filter(slug=slug).values_list("pk", flat=True).afirst()
+    if post_id is None:
+        raise Http404("Post does not exist.")
+
+    after = request.headers.get("Last-Event-ID") or request.GET.get("after")
+    after = int(after) if after and after.isdigit() else None
+
+    response = StreamingHttpResponse(live.stream(post_id, after), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # don't let nginx buffer the stream
+    return response
@@ -0,0 +1,35 @@
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Reset the cache between tests so throttle counters and cached
+    fragments never leak from one test into another.
+    """
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def author(django_user_model):
+    """An author with a profile, for tests that need posts."""
+    from accounts.models import AuthorProfile
+
+    user = django_user_model.objects.create_user(
+        username="author_user", email="author@example.com", password="testpass123", role="author"
+    )
+    return AuthorProfile.objects.create(user=user)
+
+
+@pytest.fixture
+def run_jobs():
+    """
+    Run the queued background jobs on the test's thread, as
+    `manage.py run_worker --burst` would.
+    """
+    from jobs.worker import Worker
+
+    return lambda: Worker().drain()
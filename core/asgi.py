@@ -11,6 +11,11 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+from core.startup import warm_up
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings.prod')
 
 application = get_asgi_application()
+
+# Before the server accepts traffic
+warm_up()
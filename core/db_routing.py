@@ -0,0 +1,204 @@
+import random
+import threading
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from monitoring.metrics import registry
+
+
+ROUTING_DECISIONS = registry.counter(
+    "codeshift_db_routing_total", "Database chosen for reads, by reason.", ["database", "reason"],
+)
+REPLICA_LAG = registry.gauge(
+    "codeshift_db_replica_lag_seconds", "Last measured replication lag per replica.", ["database"],
+    aggregate="max",
+)
+
+# Set by ReplicaRoutingMiddleware for safe-method requests that are not
+# pinned to the primary. Everything else (writes, management commands,
+# background work) reads from the primary.
+read_from_replica = ContextVar("read_from_replica", default=False)
+
+PIN_COOKIE = "db_pin"
+
+
+def pin_cache_key(user_id):
+    return f"replica-pin:{user_id}"
+
+
+class ReplicaHealth:
+    """
+    Per-process view of which replicas are fresh enough to read from.
+
+    Replication lag is measured at most every `REPLICA_LAG_CHECK_INTERVAL`
+    seconds. Replicas lagging more than `REPLICA_MAX_LAG_SECONDS`, or that
+    cannot be reached, are skipped until the next check.
+    """
+
+    def __init__(self):
+        self.healthy = []
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+
+    def replicas(self):
+        interval = getattr(settings, "REPLICA_LAG_CHECK_INTERVAL", 5)
+        if time.monotonic() - self.checked_at >= interval and self.lock.acquire(blocking=False):
+            try:
+                self.healthy = self.check()
+                self.checked_at = time.monotonic()
+            finally:
+                self.lock.release()
+        return self.healthy
+
+    def check(self):
+        max_lag = getattr(settings, "REPLICA_MAX_LAG_SECONDS", 10)
+        healthy = []
+        for alias in getattr(settings, "DATABASE_REPLICAS", []):
+            try:
+                lag = self.lag(alias)
+            except DatabaseError:
+                REPLICA_LAG.set(-1, database=alias)
+                continue
+            REPLICA_LAG.set(lag, database=alias)
+            if lag <= max_lag:
+                healthy.append(alias)
+        return healthy
+
+    def lag(self, alias):
+        """
+        Seconds the replica is behind. A replica that has replayed all WAL
+        it received is caught up: the age of its last replayed transaction
+        only says how long the primary has been idle.
+        """
+        connection = connections[alias]
+        if connection.vendor != "postgresql":
+            return 0
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT CASE "
+                "WHEN NOT pg_is_in_recovery() THEN 0 "
+                "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+                "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+            )
+            return float(cursor.fetchone()[0])
+
+
+health = ReplicaHealth()
+
+
+class ReplicaRouter:
+    """
+    Send reads of safe-method requests to a healthy read replica and
+    everything else to `default`.
+
+    Reads stay on the primary inside transactions, outside requests and
+    while the user is pinned after a write (see `ReplicaRoutingMiddleware`).
+    """
+
+    def db_for_read(self, model, **hints):
+        if not read_from_replica.get():
+            return "default"
+        if connections["default"].in_atomic_block:
+            ROUTING_DECISIONS.inc(database="default", reason="transaction")
+            return "default"
+
+        replicas = health.replicas()
+        if not replicas:
+            ROUTING_DECISIONS.inc(database="default", reason="no_healthy_replica")
+            return "default"
+
+        alias = random.choice(replicas)
+        ROUTING_DECISIONS.inc(database=alias, reason="replica")
+        return alias
+
+    def db_for_write(self, model, **hints):
+        # Later reads in the same request must see this write.
+        read_from_replica.set(False)
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas mirror the primary, so objects from any of them relate.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == "default"
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Enable replica reads for GET/HEAD/OPTIONS requests and pin users to the
+    primary for `REPLICA_PIN_SECONDS` after a write, so they read their own
+    changes (a new comment, an edited post) instead of stale replica data.
+
+    The pin is kept in the cache per user (API clients with JWT) and in a
+    short-lived cookie (browsers, anonymous users).
+    """
+
+    SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not getattr(settings, "DATABASE_REPLICAS", []):
+            return self.get_response(request)
+
+        safe = request.method in self.SAFE_METHODS
+        use_replica = safe and not self.is_pinned(request)
+        if safe and not use_replica:
+            ROUTING_DECISIONS.inc(database="default", reason="pinned")
+
+        token = read_from_replica.set(use_replica)
+        try:
+            response = self.get_response(request)
+        finally:
+            read_from_replica.reset(token)
+
+        if not safe and response.status_code < 400:
+            self.pin(request, response)
+        return response
+
+    def pin_seconds(self):
+        return getattr(settings, "REPLICA_PIN_SECONDS", 15)
+
+    def user_id(self, request):
+        """
+        Return the id of the requesting user without touching the database.
+
+        API views authenticate JWTs inside DRF, after middleware has run, so
+        the bearer token is validated here (signature and expiry only).
+        """
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            return user.pk
+
+        auth = JWTAuthentication()
+        header = auth.get_header(request)
+        raw_token = header and auth.get_raw_token(header)
+        if not raw_token:
+            return None
+        try:
+            token = auth.get_validated_token(raw_token)
+        except (InvalidToken, TokenError):
+            return None
+        return token.get(jwt_settings.USER_ID_CLAIM)
+
+    def is_pinned(self, request):
+        if PIN_COOKIE in request.COOKIES:
+            return True
+        user_id = self.user_id(request)
+        return user_id is not None and bool(cache.get(pin_cache_key(user_id)))
+
+    def pin(self, request, response):
+        seconds = self.pin_seconds()
+        user_id = self.user_id(request)
+        if user_id is not None:
+            cache.set(pin_cache_key(user_id), True, seconds)
+        response.set_cookie(PIN_COOKIE, "1", max_age=seconds, httponly=True, samesite="Lax")
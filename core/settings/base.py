@@ -47,11 +47,16 @@ INSTALLED_APPS = [
 APPS = [
     # local apps
     'accounts.apps.AccountsConfig',
-    'blogs.apps.BlogsConfig'
+    'blogs.apps.BlogsConfig',
+    'monitoring.apps.MonitoringConfig',
+    'jobs.apps.JobsConfig',
+    'newsletter.apps.NewsletterConfig',
+    'analytics.apps.AnalyticsConfig',
 ]
 
+# Dev-only apps (django_extensions) are added in dev.py, keeping them off
+# production startup.
 THIRD_PARTY_APPS = [
-    'django_extensions',
     'rest_framework',
     'rest_framework_simplejwt',
     'rest_framework_simplejwt.token_blacklist',
@@ -63,12 +68,18 @@ INSTALLED_APPS += APPS + THIRD_PARTY_APPS
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'monitoring.middleware.MetricsMiddleware',
+    'monitoring.middleware.QueryBudgetMiddleware',
+    'blogs.middleware.StaticPageMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'monitoring.profiler.ProfilerMiddleware',
+    'core.db_routing.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'api.v1.throttling.RateLimitHeadersMiddleware',
 ]
 
 ROOT_URLCONF = 'core.urls'
@@ -83,6 +94,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'blogs.context_processors.categories',
             ],
         },
     },
@@ -103,6 +115,27 @@ DATABASES = {
 
 
 
+# Read replicas, see core/db_routing.py. Environments with replicas list
+# their aliases in DATABASE_REPLICAS and enable ReplicaRouter. Users are
+# pinned to the primary for REPLICA_PIN_SECONDS after a write, and replicas
+# lagging more than REPLICA_MAX_LAG_SECONDS are skipped.
+DATABASE_REPLICAS = []
+REPLICA_PIN_SECONDS = 15
+REPLICA_MAX_LAG_SECONDS = 10
+REPLICA_LAG_CHECK_INTERVAL = 5
+
+
+# Cache
+# Backends from monitoring.cache count hits and misses for the metrics endpoint.
+# Per-process here; prod.py configures a cache shared by all processes.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'monitoring.cache.LocMemCache',
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -173,16 +206,187 @@ SIMPLE_JWT = {
 
 SWAGGER_SETTINGS = {
     'DEFAULT_AUTO_SCHEMA_CLASS': 'utils.swagger_schema.DynamicTaggingAutoSchema',
+    'DEFAULT_INFO': 'utils.swagger_schema.API_INFO',
+    # The docs pages load the precomputed schema, see api/schema.py
+    'SPEC_URL': ('schema-json', {'format': '.json'}),
 }
+REDOC_SETTINGS = {
+    'SPEC_URL': ('schema-json', {'format': '.json'}),
+}
+
+# core.wsgi and core.asgi import the URLconf and compile the project
+# templates before accepting traffic, see core/startup.py.
+WARM_UP_ON_STARTUP = True
+
+# Written at image build time by `manage.py generate_swagger`; without it
+# the schema is generated on first request, once per process.
+OPENAPI_SCHEMA_FILE = BASE_DIR / "openapi.json"
 
 
 REST_FRAMEWORK = {
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.UserRateThrottle',
-        'rest_framework.throttling.AnonRateThrottle',
+        'api.v1.throttling.UserSlidingWindowThrottle',
+        'api.v1.throttling.AnonSlidingWindowThrottle',
+        'api.v1.throttling.ScopedSlidingWindowThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
         'user': '100/hour',  
         'anon': '20/hour',   
+        # Per-endpoint scopes, see `throttle_scope` on the API views
+        'read': '600/hour',
+        'auth': '10/minute',
+        'comment': '30/hour',
     }
-}
\ No newline at end of file
+}
+
+
+# Per-request SQL budgets keyed by URL name, see monitoring/middleware.py.
+# Views over budget are logged to the "monitoring.queries" logger.
+QUERY_BUDGET = {
+    "default": {"queries": 30, "time_ms": 300},
+    "views": {
+        "home": {"queries": 10},
+        "post-detail": {"queries": 15},
+        "post-list": {"queries": 10},
+    },
+}
+QUERY_BUDGET_RAISE = False
+
+# Statements slower than this are aggregated by fingerprint into the
+# SlowQuery admin, with an EXPLAIN plan captured on a background thread,
+# see monitoring/slowlog.py. Set to None to disable.
+SLOW_QUERY_THRESHOLD_MS = 200
+SLOW_QUERY_ASYNC = True
+SLOW_QUERY_EXPLAIN_INTERVAL = 3600
+SLOW_QUERY_EXPLAIN_TIMEOUT_MS = 5000
+
+# Pre-rendered anonymous post and home pages, see blogs/static_site.py.
+# Edits queue a job regenerating up to STATIC_SITE_INLINE_LIMIT dependent
+# pages; `manage.py build_static_site` rebuilds everything.
+STATIC_SITE_ENABLED = os.getenv("STATIC_SITE_ENABLED", "false").lower() == "true"
+STATIC_SITE_ROOT = BASE_DIR / "static_site"
+STATIC_SITE_INLINE_LIMIT = 50
+
+# RSS/Atom feeds are rendered once per post change and kept this long,
+# see blogs/feeds.py.
+FEED_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Live comments on post pages (server-sent events), see blogs/live.py.
+# Each process polls for new comments every LIVE_COMMENTS_POLL_INTERVAL
+# seconds while streams are open; idle streams get a keepalive line every
+# LIVE_COMMENTS_KEEPALIVE seconds.
+LIVE_COMMENTS_POLL_INTERVAL = 2
+LIVE_COMMENTS_KEEPALIVE = 15
+
+# With Redis as the cache, post views are added up there and written by one
+# job per post, VIEW_FLUSH_DELAY seconds after the first view it collects.
+VIEW_FLUSH_DELAY = 10
+
+# Trending posts, see blogs/trending.py. Views and comments are counted in
+# hourly buckets; a job ranks posts by their activity over the last
+# TRENDING_WINDOW_HOURS, halving the weight of an hour every
+# TRENDING_HALF_LIFE_HOURS (a comment counts as TRENDING_COMMENT_WEIGHT
+# views), and stores the top TRENDING_SIZE posts. It runs every
+# TRENDING_REFRESH_INTERVAL seconds while there is recent activity.
+TRENDING_WINDOW_HOURS = 72
+TRENDING_HALF_LIFE_HOURS = 12
+TRENDING_COMMENT_WEIGHT = 5
+TRENDING_SIZE = 10
+TRENDING_REFRESH_INTERVAL = 5 * 60
+
+# Per-post view analytics, see analytics/series.py. Views are counted per
+# minute and compacted every ANALYTICS_COMPACT_INTERVAL seconds into one row
+# per post and day holding packed hourly counts. Hourly counts are kept for
+# ANALYTICS_HOURLY_RETENTION_DAYS, daily totals for ANALYTICS_RETENTION_DAYS
+# (None: forever). Charts show at most ANALYTICS_MAX_DAYS days, or
+# ANALYTICS_MAX_HOURLY_DAYS days by the hour.
+ANALYTICS_COMPACT_INTERVAL = 60
+ANALYTICS_HOURLY_RETENTION_DAYS = 90
+ANALYTICS_RETENTION_DAYS = 2 * 365
+ANALYTICS_MAX_DAYS = 731
+ANALYTICS_MAX_HOURLY_DAYS = 31
+
+# Admin changelists of large tables, see utils/admin.py. Unfiltered lists
+# of tables estimated above ADMIN_ESTIMATED_COUNT_THRESHOLD rows are
+# paginated with PostgreSQL's row estimate instead of COUNT(*); date
+# hierarchy buckets are cached for ADMIN_DATE_HIERARCHY_CACHE_TIMEOUT
+# seconds. Post change forms show the latest ADMIN_INLINE_COMMENTS comments.
+ADMIN_ESTIMATED_COUNT_THRESHOLD = 10_000
+ADMIN_DATE_HIERARCHY_CACHE_TIMEOUT = 10 * 60
+ADMIN_INLINE_COMMENTS = 20
+
+# Public base URL for absolute links in sitemaps.
+SITE_URL = os.getenv("SITE_URL", "http://localhost:8000")
+
+# Precomputed sitemap files, see blogs/sitemaps.py. Posts are split into
+# child sitemaps of at most SITEMAP_MAX_URLS primary keys each.
+SITEMAP_ROOT = BASE_DIR / "sitemaps"
+SITEMAP_MAX_URLS = 50_000
+
+# Background jobs stored in the database, see jobs/. `manage.py run_worker`
+# runs them on JOB_WORKER_CONCURRENCY threads, polling every
+# JOB_POLL_INTERVAL seconds when idle. Failing jobs are retried up to
+# JOB_MAX_ATTEMPTS times, JOB_RETRY_DELAY seconds later and doubling up to
+# JOB_RETRY_MAX_DELAY. Jobs locked for longer than JOB_LOCK_TIMEOUT are
+# assumed lost with their worker and retried.
+JOB_WORKER_CONCURRENCY = 4
+JOB_POLL_INTERVAL = 1.0
+JOB_MAX_ATTEMPTS = 5
+JOB_RETRY_DELAY = 10
+JOB_RETRY_MAX_DELAY = 60 * 60
+JOB_LOCK_TIMEOUT = 10 * 60
+
+# Uploaded cover and profile images are shrunk to fit these sizes by a
+# background job.
+COVER_IMAGE_MAX_SIZE = (1422, 800)
+PROFILE_IMAGE_MAX_SIZE = (400, 400)
+
+# Outgoing mail
+EMAIL_HOST = os.getenv("EMAIL_HOST", "localhost")
+EMAIL_PORT = int(os.getenv("EMAIL_PORT", "25"))
+EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER", "")
+EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD", "")
+EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "false").lower() == "true"
+EMAIL_TIMEOUT = 30
+DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "Xtra Blog <noreply@localhost>")
+
+# Newsletter mailed to subscribed readers when a post is first published,
+# see newsletter/delivery.py. Readers are mailed in batches of
+# NEWSLETTER_BATCH_SIZE over NEWSLETTER_CONCURRENCY reused SMTP
+# connections, at most NEWSLETTER_RATE_LIMIT messages per second (None for
+# no limit). Each job sends for NEWSLETTER_JOB_SECONDS, then queues the rest.
+NEWSLETTER_ENABLED = os.getenv("NEWSLETTER_ENABLED", "false").lower() == "true"
+NEWSLETTER_BATCH_SIZE = 500
+NEWSLETTER_CONCURRENCY = 4
+NEWSLETTER_RATE_LIMIT = 50
+NEWSLETTER_JOB_SECONDS = 60
+
+# Prometheus metrics served at /internal/metrics/, see monitoring/metrics.py.
+# Set METRICS_DIR to a directory shared by all worker processes of a host so
+# each worker can report the merged numbers.
+METRICS_DIR = os.getenv("METRICS_DIR")
+METRICS_FLUSH_INTERVAL = 10
+# Scrapers must send `Authorization: Bearer $METRICS_TOKEN`. Only addresses
+# listed in METRICS_ALLOWED_IPS (comma-separated) may scrape without it;
+# none by default, since behind a local reverse proxy every request comes
+# from 127.0.0.1.
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+METRICS_ALLOWED_IPS = [ip.strip() for ip in os.getenv("METRICS_ALLOWED_IPS", "").split(",") if ip.strip()]
+
+# On-demand profiling for staff (X-Profile header or ?_profile=1),
+# see monitoring/profiler.py. Profiles are browsable in the admin.
+PROFILER_ENABLED = True
+PROFILER_SAMPLE_INTERVAL = 0.001
+PROFILER_MAX_STORED = 200
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "monitoring": {"handlers": ["console"], "level": "INFO"},
+        "jobs": {"handlers": ["console"], "level": "INFO"},
+    },
+}
@@ -0,0 +1,33 @@
+# core/settings/bench.py
+# Settings for the benchmark suite (`python -m benchmarks`).
+
+from .base import *
+
+DEBUG = False
+ALLOWED_HOSTS = ["*"]
+SECRET_KEY = SECRET_KEY or "benchmark-only-secret-key"
+
+if os.getenv("DB_NAME"):
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.getenv("DB_NAME"),
+            "USER": os.getenv("DB_USER"),
+            "PASSWORD": os.getenv("DB_PASSWORD"),
+            "HOST": os.getenv("DB_HOST", "db"),
+            "PORT": os.getenv("DB_PORT", "5432"),
+        }
+    }
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": BASE_DIR / "bench.sqlite3",
+        }
+    }
+
+# Measure the views, not the rate limiter.
+REST_FRAMEWORK = {**REST_FRAMEWORK, "DEFAULT_THROTTLE_CLASSES": []}
+
+# Budgets are reported by the benchmark itself.
+LOGGING["loggers"]["monitoring"]["level"] = "ERROR"
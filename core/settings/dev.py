@@ -3,6 +3,8 @@ from .base import *
 DEBUG = True
 ALLOWED_HOSTS = ["*"]
 
+INSTALLED_APPS += ["django_extensions"]
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
@@ -11,6 +13,9 @@ DATABASES = {
 }
 
 
+# Local SMTP stand-in, e.g. `docker compose up mailpit`
+EMAIL_PORT = int(os.getenv("EMAIL_PORT", "1025"))
+
 SECURE_SSL_REDIRECT = False
 SESSION_COOKIE_SECURE = False
 CSRF_COOKIE_SECURE = False
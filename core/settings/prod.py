@@ -1,5 +1,7 @@
 # core/settings/prod.py
 
+from django.core.exceptions import ImproperlyConfigured
+
 from .base import *
 
 DEBUG = False
@@ -16,6 +18,35 @@ DATABASES = {
     }
 }
 
+# Comma-separated replica hosts, e.g. DB_REPLICA_HOSTS=db-replica-1,db-replica-2
+DATABASE_REPLICAS = []
+for index, host in enumerate(filter(None, os.getenv("DB_REPLICA_HOSTS", "").split(","))):
+    alias = f"replica_{index + 1}"
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "HOST": host.strip(),
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+if DATABASE_REPLICAS:
+    DATABASE_ROUTERS = ["core.db_routing.ReplicaRouter"]
+
+# Redis, shared by every web and worker process: the category and feed
+# version stamps and the replica pins only work if a bump in one process is
+# seen by all others, and the API throttles and the view counter rely on
+# its atomic `incr`. REDIS_URL is e.g. redis://redis:6379/0.
+if not os.getenv("REDIS_URL"):
+    raise ImproperlyConfigured("Set REDIS_URL to the Redis server used as the cache.")
+
+CACHES = {
+    "default": {
+        "BACKEND": "monitoring.cache.RedisCache",
+        "LOCATION": os.getenv("REDIS_URL"),
+    }
+}
+
+
 # USE_X_FORWARDED_HOST = True
 # SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
 
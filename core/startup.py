@@ -0,0 +1,40 @@
+import logging
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.template import TemplateSyntaxError, engines
+from django.urls import get_resolver
+
+
+logger = logging.getLogger("core.startup")
+
+
+def warm_up():
+    """
+    Do the work Django otherwise leaves to the first requests of a worker:
+    import the URLconf with every view it references, build the resolver's
+    reverse lookup tables, and compile the project templates into the
+    cached template loader. Called from `core.wsgi` and `core.asgi` before
+    the server accepts traffic; disabled with `WARM_UP_ON_STARTUP = False`.
+    """
+    if not getattr(settings, "WARM_UP_ON_STARTUP", True):
+        return
+    start = time.perf_counter()
+
+    resolver = get_resolver()
+    resolver.reverse_dict  # populates the reverse and namespace tables
+    resolver.resolve("/")
+
+    compiled = 0
+    for engine in engines.all():
+        for directory in map(Path, getattr(engine, "engine", engine).dirs):
+            for path in sorted(directory.rglob("*.html")):
+                try:
+                    engine.get_template(path.relative_to(directory).as_posix())
+                except TemplateSyntaxError:
+                    logger.exception("Template %s does not compile", path)
+                else:
+                    compiled += 1
+
+    logger.info("Warmed up URLs and %d templates in %.0f ms", compiled, (time.perf_counter() - start) * 1000)
@@ -0,0 +1,141 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db import DatabaseError, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.db_routing import (
+    PIN_COOKIE,
+    ReplicaHealth,
+    ReplicaRouter,
+    ReplicaRoutingMiddleware,
+    pin_cache_key,
+    read_from_replica,
+)
+
+
+User = get_user_model()
+
+
+@override_settings(DATABASE_REPLICAS=["replica_1"])
+class ReplicaRouterTests(SimpleTestCase):
+    databases = {"default"}
+
+    def setUp(self):
+        self.router = ReplicaRouter()
+        patcher = mock.patch("core.db_routing.health.replicas", return_value=["replica_1"])
+        self.replicas = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def read(self):
+        token = read_from_replica.set(True)
+        try:
+            return self.router.db_for_read(User)
+        finally:
+            read_from_replica.reset(token)
+
+    def test_reads_outside_requests_use_primary(self):
+        self.assertEqual(self.router.db_for_read(User), "default")
+
+    def test_safe_request_reads_use_replica(self):
+        self.assertEqual(self.read(), "replica_1")
+
+    def test_falls_back_to_primary_without_healthy_replica(self):
+        self.replicas.return_value = []
+        self.assertEqual(self.read(), "default")
+
+    def test_reads_inside_transaction_use_primary(self):
+        with transaction.atomic():
+            self.assertEqual(self.read(), "default")
+
+    def test_reads_after_write_use_primary(self):
+        token = read_from_replica.set(True)
+        try:
+            self.assertEqual(self.router.db_for_write(User), "default")
+            self.assertEqual(self.router.db_for_read(User), "default")
+        finally:
+            read_from_replica.reset(token)
+
+    def test_migrations_only_run_on_primary(self):
+        self.assertTrue(self.router.allow_migrate("default", "blogs"))
+        self.assertFalse(self.router.allow_migrate("replica_1", "blogs"))
+
+
+@override_settings(DATABASE_REPLICAS=["replica_1", "replica_2", "replica_3"], REPLICA_MAX_LAG_SECONDS=10)
+class ReplicaHealthTests(SimpleTestCase):
+    def test_skips_lagging_and_unreachable_replicas(self):
+        lags = {"replica_1": 0.5, "replica_2": 30, "replica_3": DatabaseError("down")}
+
+        def lag(alias):
+            if isinstance(lags[alias], Exception):
+                raise lags[alias]
+            return lags[alias]
+
+        health = ReplicaHealth()
+        with mock.patch.object(health, "lag", side_effect=lag):
+            self.assertEqual(health.replicas(), ["replica_1"])
+
+    @override_settings(REPLICA_LAG_CHECK_INTERVAL=60)
+    def test_lag_is_checked_once_per_interval(self):
+        health = ReplicaHealth()
+        with mock.patch.object(health, "lag", return_value=0) as lag:
+            health.replicas()
+            health.replicas()
+        self.assertEqual(lag.call_count, 3)
+
+
+@override_settings(DATABASE_REPLICAS=["replica_1"], REPLICA_PIN_SECONDS=15)
+class ReplicaRoutingMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.seen = []
+
+    def get_response(self, status=200):
+        def view(request):
+            self.seen.append(read_from_replica.get())
+            return HttpResponse(status=status)
+        return view
+
+    def call(self, request, status=200):
+        if not hasattr(request, "user"):
+            request.user = AnonymousUser()
+        return ReplicaRoutingMiddleware(self.get_response(status))(request)
+
+    def test_get_reads_from_replica(self):
+        self.call(self.factory.get("/"))
+        self.assertEqual(self.seen, [True])
+        self.assertFalse(read_from_replica.get())
+
+    def test_post_reads_from_primary_and_pins(self):
+        response = self.call(self.factory.post("/"))
+        self.assertEqual(self.seen, [False])
+        self.assertEqual(response.cookies[PIN_COOKIE]["max-age"], 15)
+
+    def test_failed_write_does_not_pin(self):
+        response = self.call(self.factory.post("/"), status=400)
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+    def test_pin_cookie_keeps_reads_on_primary(self):
+        request = self.factory.get("/")
+        request.COOKIES[PIN_COOKIE] = "1"
+        self.call(request)
+        self.assertEqual(self.seen, [False])
+
+    def test_jwt_user_is_pinned_across_clients(self):
+        token = AccessToken.for_user(User(id=42))
+        auth = {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+
+        self.call(self.factory.post("/", **auth))
+        self.assertTrue(cache.get(pin_cache_key(42)))
+
+        self.call(self.factory.get("/", **auth))
+        self.assertEqual(self.seen, [False, False])
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_no_replicas_configured(self):
+        response = self.call(self.factory.post("/"))
+        self.assertNotIn(PIN_COOKIE, response.cookies)
@@ -20,36 +20,20 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.views.static import serve 
 from django.urls import re_path 
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
-from rest_framework import permissions
-
-schema_view = get_schema_view(
-   openapi.Info(
-      title="Codeshift Blog API",
-      default_version='v1',
-      description="Api description",
-      terms_of_service="https://www.google.com/policies/terms/",
-      contact=openapi.Contact(email="contact@snippets.local"),
-      license=openapi.License(name="BSD License"),
-   ),
-   public=True,
-   permission_classes=(permissions.AllowAny,),
-)
-
+from api.schema import docs_view, schema_view
 
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/v1/', include('api.v1.urls')),
+    path('internal/', include('monitoring.urls')),
+    # Before the blogs catch-all `<slug>/`
+    path('swagger/', docs_view, {'ui': 'swagger'}, name='schema-swagger-ui'),
+    path('swagger<format>/', schema_view, name='schema-json'),
+    path('redoc/', docs_view, {'ui': 'redoc'}, name='schema-redoc'),
     path('', include('accounts.urls')),
     path('', include('blogs.urls')),
 
-
-    path('swagger<format>/', schema_view.without_ui(cache_timeout=0), name='schema-json'),
-    path('api/v1/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
-
 ]+ static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
 
 
@@ -1,17 +1,35 @@
 #!/bin/bash
 set -e
 
-echo "Running migrations..."
-python manage.py migrate
-
-echo "Collecting static files..."
-python manage.py collectstatic --noinput
-
-
+# SKIP_STARTUP_TASKS=1 (e.g. for the worker) starts the command right away;
+# the web container runs migrations and collects static files.
+if [ "${SKIP_STARTUP_TASKS:-0}" != "1" ]; then
+    echo "Running migrations..."
+    python manage.py migrate --noinput
+
+    echo "Rendering post content..."
+    python manage.py render_posts
+
+    # Only when the static sources, or the dependencies shipping static
+    # files, changed since the last collection.
+    STATIC_HASH=$( (find static -type f -print0 | sort -z | xargs -0 sha256sum; sha256sum poetry.lock) | sha256sum | cut -d' ' -f1)
+    if [ "$(cat staticfiles/.source-hash 2>/dev/null)" = "$STATIC_HASH" ]; then
+        echo "Static files unchanged, skipping collectstatic."
+    else
+        echo "Collecting static files..."
+        python manage.py collectstatic --noinput
+        echo "$STATIC_HASH" > staticfiles/.source-hash
+    fi
+fi
+
+# Default admin user and categories for local setups (CREATE_DEFAULT_DATA=1)
+if [ "${CREATE_DEFAULT_DATA:-0}" = "1" ]; then
 python manage.py shell <<EOF
 from django.contrib.auth import get_user_model
 from django.utils.text import slugify
 
+from blogs.models import Category
+
 User = get_user_model()
 username = 'admin'
 email = 'admin@admin.com'
@@ -22,14 +40,16 @@ if not User.objects.filter(username=username).exists():
 
 # Creating categories...
 categories_to_create = ['Tech', 'Life', 'Music', 'Nature', 'Cars']
-    
+
 for name in categories_to_create:
     if not Category.objects.filter(name=name).exists():
         Category.objects.create(
             name=name,
-            slug=slugify(name) 
+            slug=slugify(name)
         )
 
 EOF
+fi
+
 echo "Starting server..."
 exec "$@"
@@ -0,0 +1,40 @@
+from django.contrib import admin
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for background jobs.
+    Mostly useful to inspect failed jobs and send them back to the queue.
+    """
+
+    list_display = ("name", "queue", "status", "attempts", "max_attempts", "run_at", "locked_by", "created_at")
+    list_filter = ("status", "queue", "name")
+    search_fields = ("name", "dedupe_key")
+    readonly_fields = [field.name for field in Job._meta.fields]
+    actions = ["retry_jobs"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    @admin.action(description="Retry selected failed jobs now")
+    def retry_jobs(self, request, queryset):
+        retried = 0
+        for job in queryset.filter(status=Job.Status.FAILED):
+            try:
+                with transaction.atomic():
+                    Job.objects.filter(pk=job.pk).update(
+                        status=Job.Status.QUEUED, attempts=0, run_at=timezone.now(), locked_by="",
+                    )
+            except IntegrityError:
+                # The same work is already queued under this dedupe key.
+                job.delete()
+            retried += 1
+        self.message_user(request, f"{retried} jobs queued again.")
@@ -0,0 +1,40 @@
+import signal
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from jobs.worker import Worker
+from monitoring.metrics import timed
+
+
+class Command(BaseCommand):
+    """
+    Process background jobs from the database queue, see `jobs.queue`.
+
+    Runs until SIGINT/SIGTERM, letting jobs in progress finish. Any number
+    of workers can run side by side. With --burst the command exits once no
+    job is due, e.g. to run from cron or tests.
+    """
+
+    help = "Run queued background jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--queue", action="append", dest="queues", help="Only this queue (repeatable).")
+        parser.add_argument(
+            "--concurrency", type=int, default=getattr(settings, "JOB_WORKER_CONCURRENCY", 4),
+            help="Jobs to run at the same time.",
+        )
+        parser.add_argument("--burst", action="store_true", help="Exit when no job is due.")
+
+    @timed("command", "run_worker")
+    def handle(self, *args, **options):
+        worker = Worker(options["queues"], concurrency=options["concurrency"])
+        signal.signal(signal.SIGINT, worker.stop)
+        signal.signal(signal.SIGTERM, worker.stop)
+
+        started = time.perf_counter()
+        done = worker.run(burst=options["burst"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Ran {done} jobs in {time.perf_counter() - started:.1f}s"
+        ))
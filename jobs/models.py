@@ -0,0 +1,59 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    A unit of background work, run by `manage.py run_worker`.
+    See `jobs.queue`. Finished jobs are deleted; jobs that failed every
+    attempt stay in the table for inspection in the admin.
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        FAILED = "failed", "Failed"
+
+    name = models.CharField(max_length=200, help_text="Registered job name, see `jobs.queue.job`.")
+    queue = models.CharField(max_length=50, default="default")
+    args = models.JSONField(default=list, blank=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+    dedupe_key = models.CharField(
+        max_length=200, blank=True, null=True,
+        help_text="At most one queued job per key; enqueueing a duplicate is a no-op.",
+    )
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.QUEUED)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    locked_by = models.CharField(max_length=100, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["run_at"]
+        indexes = [
+            # Workers polling for due jobs: only the queued subset
+            models.Index(
+                fields=["queue", "run_at"],
+                condition=models.Q(status="queued"),
+                name="job_ready_idx",
+            ),
+            # Recovery of jobs held by lost workers
+            models.Index(
+                fields=["locked_at"],
+                condition=models.Q(status="running"),
+                name="job_running_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dedupe_key"],
+                condition=models.Q(status="queued"),
+                name="job_dedupe_unique",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.status})"
@@ -0,0 +1,171 @@
+import random
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, connections, router, transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from monitoring.metrics import registry
+from .models import Job
+
+
+JOBS = {}
+
+ENQUEUED = registry.counter(
+    "codeshift_jobs_enqueued_total", "Background jobs enqueued, including deduplicated ones.", ["name"],
+)
+PROCESSED = registry.counter(
+    "codeshift_jobs_processed_total", "Background job attempts by outcome (done, retried, failed).",
+    ["name", "outcome"],
+)
+QUEUE_DEPTH = registry.gauge(
+    "codeshift_job_queue_depth", "Background jobs due to run.", ["queue"], aggregate="max",
+)
+
+
+def job(name=None, queue="default", max_attempts=None):
+    """
+    Register the decorated function as a background job.
+
+    `name` (default `module.function`) is what gets stored in the queue, so
+    keep it stable across deploys. Jobs may run more than once (retries,
+    lost workers) and must be idempotent.
+    """
+
+    def decorator(func):
+        func.job_name = name or f"{func.__module__}.{func.__name__}"
+        func.job_queue = queue
+        func.job_max_attempts = max_attempts
+        JOBS[func.job_name] = func
+        return func
+
+    return decorator
+
+
+def enqueue(task, *args, dedupe_key=None, run_at=None, **kwargs):
+    """
+    Queue a call of the `@job` function `task` (or its name).
+
+    The row is written in the caller's transaction, so workers only see the
+    job once that commits, and never for rolled back changes. Arguments
+    must be JSON serializable. While a job with the same `dedupe_key` is
+    still queued, enqueueing another one is a no-op. `run_at` delays the
+    job until then.
+    """
+    func = JOBS[task] if isinstance(task, str) else task
+    new = Job(
+        name=func.job_name,
+        queue=func.job_queue,
+        args=list(args),
+        kwargs=kwargs,
+        dedupe_key=dedupe_key,
+        max_attempts=func.job_max_attempts or getattr(settings, "JOB_MAX_ATTEMPTS", 5),
+        run_at=run_at or timezone.now(),
+    )
+    if dedupe_key is None:
+        new.save()
+    else:
+        # ON CONFLICT DO NOTHING / INSERT OR IGNORE on job_dedupe_unique
+        Job.objects.bulk_create([new], ignore_conflicts=True)
+    ENQUEUED.inc(name=func.job_name)
+
+
+def claim(worker, queues=None, limit=1):
+    """
+    Lock up to `limit` due jobs for `worker` and return them.
+
+    On PostgreSQL, concurrent workers skip each other's locked rows with
+    `SELECT ... FOR UPDATE SKIP LOCKED`. SQLite has no row locks: each
+    candidate is claimed with a conditional UPDATE instead, and rows another
+    worker got first are skipped.
+    """
+    ready = Job.objects.filter(status=Job.Status.QUEUED, run_at__lte=timezone.now()).order_by("run_at", "pk")
+    if queues:
+        ready = ready.filter(queue__in=queues)
+    claimed = {
+        "status": Job.Status.RUNNING,
+        "locked_at": timezone.now(),
+        "locked_by": worker,
+        "attempts": F("attempts") + 1,
+    }
+
+    database = router.db_for_write(Job)
+    if connections[database].features.has_select_for_update_skip_locked:
+        with transaction.atomic(using=database):
+            pks = list(ready.select_for_update(skip_locked=True).values_list("pk", flat=True)[:limit])
+            Job.objects.filter(pk__in=pks).update(**claimed)
+    else:
+        pks = [
+            pk for pk in ready.values_list("pk", flat=True)[:limit]
+            if Job.objects.filter(pk=pk, status=Job.Status.QUEUED).update(**claimed)
+        ]
+    return list(Job.objects.filter(pk__in=pks).order_by("run_at", "pk"))
+
+
+def backoff(attempts):
+    """
+    Seconds to wait before retrying a job that failed `attempts` times:
+    JOB_RETRY_DELAY doubling per attempt up to JOB_RETRY_MAX_DELAY, with
+    jitter so jobs that failed together don't retry together.
+    """
+    delay = getattr(settings, "JOB_RETRY_DELAY", 10) * 2 ** (attempts - 1)
+    delay = min(delay, getattr(settings, "JOB_RETRY_MAX_DELAY", 3600))
+    return delay * random.uniform(0.5, 1)
+
+
+def complete(job):
+    Job.objects.filter(pk=job.pk).delete()
+    PROCESSED.inc(name=job.name, outcome="done")
+
+
+def fail(job, error):
+    """Retry `job` after a backoff, or mark it failed once it ran out of attempts."""
+    if job.attempts >= job.max_attempts:
+        Job.objects.filter(pk=job.pk).update(status=Job.Status.FAILED, locked_at=None, last_error=error)
+        PROCESSED.inc(name=job.name, outcome="failed")
+        return
+
+    retry = {
+        "status": Job.Status.QUEUED,
+        "run_at": timezone.now() + timedelta(seconds=backoff(job.attempts)),
+        "locked_at": None,
+        "locked_by": "",
+        "last_error": error,
+    }
+    try:
+        with transaction.atomic():
+            Job.objects.filter(pk=job.pk).update(**retry)
+    except IntegrityError:
+        # A duplicate was queued in the meantime and will do the same work.
+        Job.objects.filter(pk=job.pk).delete()
+    PROCESSED.inc(name=job.name, outcome="retried")
+
+
+def release_stale():
+    """
+    Retry jobs whose worker died: those locked for longer than
+    JOB_LOCK_TIMEOUT, which must exceed the longest job. Returns how many.
+    """
+    cutoff = timezone.now() - timedelta(seconds=getattr(settings, "JOB_LOCK_TIMEOUT", 600))
+    stale = list(Job.objects.filter(status=Job.Status.RUNNING, locked_at__lt=cutoff))
+    for lost in stale:
+        fail(lost, f"Lock held by {lost.locked_by} expired.")
+    return len(stale)
+
+
+def depth():
+    """Due jobs per queue, computed when the metrics are scraped."""
+    try:
+        rows = (
+            Job.objects.filter(status=Job.Status.QUEUED, run_at__lte=timezone.now())
+            .values_list("queue")
+            .annotate(n=Count("pk"))
+            .order_by()
+        )
+        return {("default",): 0, **{(queue,): n for queue, n in rows}}
+    except DatabaseError:
+        return {}
+
+
+QUEUE_DEPTH.set_function(depth)
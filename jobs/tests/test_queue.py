@@ -0,0 +1,99 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.queue import QUEUE_DEPTH, claim, enqueue, job, release_stale
+from jobs.worker import Worker
+
+
+calls = []
+
+
+@job("tests.record")
+def record(value, suffix=""):
+    calls.append(f"{value}{suffix}")
+
+
+@job("tests.explode", max_attempts=2)
+def explode():
+    raise RuntimeError("boom")
+
+
+@override_settings(JOB_RETRY_DELAY=60)
+class JobQueueTests(TestCase):
+    """
+    Tests for the database-backed job queue and its worker.
+    """
+
+    def setUp(self):
+        calls.clear()
+
+    def test_worker_runs_and_deletes_jobs(self):
+        enqueue(record, "a", suffix="!")
+        enqueue("tests.record", "b")
+
+        self.assertEqual(Worker().drain(), 2)
+        self.assertEqual(calls, ["a!", "b"])
+        self.assertFalse(Job.objects.exists())
+
+    def test_duplicates_of_queued_jobs_are_dropped(self):
+        enqueue(record, "a", dedupe_key="same")
+        enqueue(record, "a", dedupe_key="same")
+        self.assertEqual(Job.objects.count(), 1)
+
+        # Once a worker has claimed the job, later changes need a new run.
+        claim("test")
+        enqueue(record, "a", dedupe_key="same")
+        self.assertEqual(Job.objects.filter(status=Job.Status.QUEUED).count(), 1)
+
+    def test_failures_are_retried_with_backoff_then_given_up(self):
+        enqueue(explode)
+        Worker().drain()
+
+        failed = Job.objects.get()
+        self.assertEqual((failed.status, failed.attempts), (Job.Status.QUEUED, 1))
+        self.assertGreaterEqual(failed.run_at, timezone.now() + timedelta(seconds=29))
+        self.assertIn("RuntimeError: boom", failed.last_error)
+        self.assertEqual(claim("test"), [])  # not due yet
+
+        Job.objects.update(run_at=timezone.now())
+        Worker().drain()
+        self.assertEqual(Job.objects.get().status, Job.Status.FAILED)
+
+    def test_jobs_of_lost_workers_are_released(self):
+        enqueue(record, "a")
+        claim("lost")
+        Job.objects.update(locked_at=timezone.now() - timedelta(hours=1))
+
+        self.assertEqual(release_stale(), 1)
+        Job.objects.update(run_at=timezone.now())
+        Worker().drain()
+        self.assertEqual(calls, ["a"])
+
+    def test_queue_depth_gauge(self):
+        enqueue(record, "a")
+        enqueue(record, "b")
+        self.assertEqual(dict((tuple(key), value) for key, value in QUEUE_DEPTH.snapshot()), {("default",): 2})
+
+
+class RunWorkerTests(TransactionTestCase):
+    """
+    Tests for `manage.py run_worker`; jobs run on worker threads, which
+    only see committed rows.
+    """
+
+    def setUp(self):
+        calls.clear()
+
+    def test_run_worker_command(self):
+        for value in "abc":
+            enqueue(record, value)
+
+        out = StringIO()
+        call_command("run_worker", burst=True, concurrency=2, stdout=out)
+        self.assertEqual(sorted(calls), ["a", "b", "c"])
+        self.assertIn("Ran 3 jobs", out.getvalue())
@@ -0,0 +1,108 @@
+import logging
+import os
+import socket
+import threading
+import time
+import traceback
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, connections
+
+from monitoring.metrics import registry, timed
+from .queue import JOBS, claim, complete, fail, release_stale
+
+
+logger = logging.getLogger("jobs")
+
+
+class Worker:
+    """
+    Runs queued jobs on `concurrency` threads, each claiming and running
+    one job at a time. Jobs spend most of their time waiting on the
+    database, files or SMTP, so threads are enough to overlap them.
+    """
+
+    def __init__(self, queues=None, concurrency=1, poll_interval=None):
+        self.queues = queues
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval or getattr(settings, "JOB_POLL_INTERVAL", 1.0)
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self.stopping = threading.Event()
+        self.processed = 0
+        self.lock = threading.Lock()
+
+    def stop(self, *args):
+        """Finish the jobs in progress, then return from `run()`."""
+        self.stopping.set()
+
+    def execute(self, job):
+        func = JOBS.get(job.name)
+        try:
+            if func is None:
+                # Retried, as workers may not be deployed yet with new code.
+                raise LookupError(f"No job registered as {job.name!r}.")
+            timed("job", job.name)(func)(*job.args, **job.kwargs)
+        except Exception:
+            logger.exception("Job %s (%s) failed on attempt %d", job.pk, job.name, job.attempts)
+            fail(job, traceback.format_exc())
+        else:
+            complete(job)
+
+        with self.lock:
+            self.processed += 1
+
+    def run_once(self):
+        """Claim and run one due job; return whether there was one."""
+        close_old_connections()
+        jobs = claim(self.name, self.queues)
+        for job in jobs:
+            self.execute(job)
+        return bool(jobs)
+
+    def drain(self):
+        """Run due jobs on the calling thread until none is left; return how many ran."""
+        started = self.processed
+        while not self.stopping.is_set() and self.run_once():
+            pass
+        return self.processed - started
+
+    def loop(self, burst):
+        try:
+            while not self.stopping.is_set():
+                try:
+                    busy = self.run_once()
+                except DatabaseError:
+                    logger.exception("Could not claim jobs, retrying in %ss", self.poll_interval)
+                    busy = False
+                if not busy:
+                    if burst:
+                        return
+                    self.stopping.wait(self.poll_interval)
+        finally:
+            # Each thread has its own database connection.
+            connections.close_all()
+
+    def run(self, burst=False):
+        """
+        Process jobs until stopped, or with `burst` until none is due.
+        Returns how many jobs ran.
+        """
+        release_stale()
+        threads = [
+            threading.Thread(target=self.loop, args=(burst,), name=f"jobs-{index}", daemon=True)
+            for index in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+
+        check_interval = getattr(settings, "JOB_LOCK_TIMEOUT", 600) / 2
+        last_check = time.monotonic()
+        while threads:
+            # Short joins keep the main thread responsive to signals.
+            threads[0].join(0.5)
+            threads = [thread for thread in threads if thread.is_alive()]
+            if time.monotonic() - last_check > check_interval:
+                release_stale()
+                last_check = time.monotonic()
+            registry.maybe_flush()
+        return self.processed
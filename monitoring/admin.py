@@ -0,0 +1,88 @@
+from django.contrib import admin
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import path, reverse
+from django.utils.html import format_html
+
+from .models import RequestProfile, SlowQuery
+
+
+@admin.register(RequestProfile)
+class RequestProfileAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for on-demand request profiles.
+    Profiles are read-only; the raw output can be downloaded for
+    flamegraph.pl / speedscope (folded stacks) or snakeviz (cProfile).
+    """
+
+    list_display = ("created_at", "method", "path", "view_name", "user", "mode", "status_code",
+                    "duration_ms", "query_count", "db_ms", "download_link")
+    list_filter = ("mode", "view_name")
+    search_fields = ("path", "request_id")
+    list_select_related = ("user",)
+    readonly_fields = [field.name for field in RequestProfile._meta.fields if field.name != "raw_profile"]
+    exclude = ("raw_profile",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def download_link(self, obj):
+        """Link to the flamegraph-compatible output of the profile."""
+        url = reverse("admin:monitoring_requestprofile_download", args=[obj.pk])
+        label = "folded stacks" if obj.mode == RequestProfile.Mode.SAMPLING else "cProfile (.prof)"
+        return format_html('<a href="{}">{}</a>', url, label)
+
+    download_link.short_description = "Download"
+
+    def get_urls(self):
+        urls = [
+            path(
+                "<int:pk>/download/",
+                self.admin_site.admin_view(self.download_view),
+                name="monitoring_requestprofile_download",
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def download_view(self, request, pk):
+        # Profiles hold SQL with its parameters; staff status alone is not enough.
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+        profile = get_object_or_404(RequestProfile, pk=pk)
+        if profile.mode == RequestProfile.Mode.CPROFILE:
+            response = HttpResponse(bytes(profile.raw_profile or b""), content_type="application/octet-stream")
+            filename = f"{profile.request_id}.prof"
+        else:
+            response = HttpResponse(profile.folded_stacks, content_type="text/plain; charset=utf-8")
+            filename = f"{profile.request_id}.folded"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
+@admin.register(SlowQuery)
+class SlowQueryAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the slow-query log.
+    Sorted by total time so the ORM call sites most worth indexing come first.
+    """
+
+    list_display = ("short_sql", "view_name", "call_site", "calls", "total_ms", "mean_ms", "max_ms", "last_seen")
+    list_filter = ("database", "view_name")
+    search_fields = ("normalized_sql", "call_site", "view_name")
+    readonly_fields = [field.name for field in SlowQuery._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def short_sql(self, obj):
+        """Display a short preview of the normalized statement."""
+        return (obj.normalized_sql[:100] + "...") if len(obj.normalized_sql) > 100 else obj.normalized_sql
+
+    short_sql.short_description = "SQL"
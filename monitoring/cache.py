@@ -0,0 +1,62 @@
+from django.core.cache.backends import db, filebased, locmem, memcached, redis
+from django.core.cache.backends.base import BaseCache
+
+from .metrics import CACHE_REQUESTS
+
+
+MISSING = object()
+
+
+class MeteredCacheMixin:
+    """
+    Count cache hits and misses for the hit-ratio metrics.
+
+    Mix in front of a Django cache backend. The `METRICS_LABEL` entry of the
+    cache's settings names it in the metrics (defaults to "default").
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        params = args[-1] if args else kwargs.get("params", {})
+        self.metrics_label = params.get("METRICS_LABEL", "default")
+
+        # BaseCache.get_many() loops over get(), which is already counted.
+        mro = type(self).__mro__
+        backend = next(cls for cls in mro[mro.index(MeteredCacheMixin) + 1:] if "get_many" in vars(cls))
+        self.get_many_uses_get = backend is BaseCache
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, MISSING, version)
+        if value is MISSING:
+            CACHE_REQUESTS.inc(cache=self.metrics_label, result="miss")
+            return default
+        CACHE_REQUESTS.inc(cache=self.metrics_label, result="hit")
+        return value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        values = super().get_many(keys, version)
+        if not self.get_many_uses_get:
+            CACHE_REQUESTS.inc(len(values), cache=self.metrics_label, result="hit")
+            CACHE_REQUESTS.inc(len(keys) - len(values), cache=self.metrics_label, result="miss")
+        return values
+
+
+class LocMemCache(MeteredCacheMixin, locmem.LocMemCache):
+    pass
+
+
+class RedisCache(MeteredCacheMixin, redis.RedisCache):
+    pass
+
+
+class PyMemcacheCache(MeteredCacheMixin, memcached.PyMemcacheCache):
+    pass
+
+
+class FileBasedCache(MeteredCacheMixin, filebased.FileBasedCache):
+    pass
+
+
+class DatabaseCache(MeteredCacheMixin, db.DatabaseCache):
+    pass
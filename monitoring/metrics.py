@@ -0,0 +1,312 @@
+import atexit
+import bisect
+import json
+import os
+import threading
+import time
+from functools import wraps
+from pathlib import Path
+
+from django.conf import settings
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+class Metric:
+    """
+    Base class for in-process metrics.
+
+    Values are kept in a plain dict keyed by the tuple of label values, so
+    recording is a dict lookup and an addition under a lock. Rendering and
+    cross-process merging only happen when the metrics endpoint is scraped.
+    """
+
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def key(self, labels):
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def snapshot(self):
+        with self.lock:
+            return [[list(key), value] for key, value in self.values.items()]
+
+    def describe(self):
+        return {"type": self.kind, "help": self.documentation, "labels": list(self.labelnames)}
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self.key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    """
+    A value that can go up and down. `aggregate` says how values from
+    several processes are combined: "sum" (e.g. open connections) or "max"
+    (e.g. a shared queue depth every worker observes).
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=(), aggregate="sum"):
+        super().__init__(name, documentation, labelnames)
+        self.aggregate = aggregate
+        self.callback = None
+
+    def set(self, value, **labels):
+        key = self.key(labels)
+        with self.lock:
+            self.values[key] = value
+
+    def set_function(self, callback):
+        """Compute the gauge lazily at scrape time; `callback` returns `{labels: value}` or a number."""
+        self.callback = callback
+
+    def snapshot(self):
+        if self.callback is not None:
+            result = self.callback()
+            if not isinstance(result, dict):
+                result = {(): result}
+            with self.lock:
+                self.values = {tuple(key): value for key, value in result.items()}
+        return super().snapshot()
+
+    def describe(self):
+        return {**super().describe(), "aggregate": self.aggregate}
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        key = self.key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            state = self.values.get(key)
+            if state is None:
+                # Per-bucket counts (the last one is +Inf), then sum.
+                state = self.values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            state[index] += 1
+            state[-1] += value
+
+    def describe(self):
+        return {**super().describe(), "buckets": list(self.buckets)}
+
+
+class Registry:
+    """
+    Holds every metric of this process and shares them with sibling
+    worker processes.
+
+    When `settings.METRICS_DIR` is set, each process periodically writes its
+    snapshot to `<METRICS_DIR>/<pid>.json` (at most every
+    `METRICS_FLUSH_INTERVAL` seconds, and at exit). The metrics endpoint
+    merges all files, so any worker can answer a scrape for the whole
+    deployment. Without `METRICS_DIR` only the current process is reported.
+    """
+
+    def __init__(self):
+        self.metrics = {}
+        self.last_flush = 0.0
+        self.lock = threading.Lock()
+
+    def register(self, metric):
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=(), aggregate="sum"):
+        return self.register(Gauge(name, documentation, labelnames, aggregate))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def snapshot(self):
+        return {
+            "pid": os.getpid(),
+            "time": time.time(),
+            "metrics": {
+                name: {**metric.describe(), "values": metric.snapshot()}
+                for name, metric in self.metrics.items()
+            },
+        }
+
+    def directory(self):
+        path = getattr(settings, "METRICS_DIR", None)
+        return Path(path) if path else None
+
+    def maybe_flush(self):
+        """Flush if the flush interval has passed; cheap enough to call per request."""
+        interval = getattr(settings, "METRICS_FLUSH_INTERVAL", 10)
+        if time.monotonic() - self.last_flush >= interval:
+            self.flush()
+
+    def flush(self):
+        directory = self.directory()
+        if directory is None:
+            return
+        with self.lock:
+            self.last_flush = time.monotonic()
+            directory.mkdir(parents=True, exist_ok=True)
+            target = directory / f"{os.getpid()}.json"
+            tmp = directory / f".{os.getpid()}.json.tmp"
+            tmp.write_text(json.dumps(self.snapshot()))
+            os.replace(tmp, target)
+
+    def collect(self):
+        """Return the merged snapshot of every process."""
+        directory = self.directory()
+        if directory is None:
+            return [self.snapshot()]
+
+        self.flush()
+        snapshots = []
+        for path in directory.glob("*.json"):
+            try:
+                snapshots.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                continue
+        return snapshots
+
+    def render(self):
+        """Render all metrics in the Prometheus text exposition format."""
+        stale_after = getattr(settings, "METRICS_STALE_SECONDS", 300)
+        now = time.time()
+        merged = {}
+
+        for snapshot in self.collect():
+            # Counters of exited workers still count; their gauges do not.
+            stale = now - snapshot.get("time", 0) > stale_after
+            for name, data in snapshot["metrics"].items():
+                entry = merged.setdefault(name, {**data, "values": {}})
+                if data["type"] == "gauge" and stale:
+                    continue
+                for labels, value in data["values"]:
+                    key = tuple(labels)
+                    previous = entry["values"].get(key)
+                    entry["values"][key] = merge_value(data, previous, value)
+
+        lines = []
+        for name, data in sorted(merged.items()):
+            lines.append(f"# HELP {name} {data['help']}")
+            lines.append(f"# TYPE {name} {data['type']}")
+            for key, value in sorted(data["values"].items()):
+                labels = dict(zip(data["labels"], key))
+                if data["type"] == "histogram":
+                    lines.extend(render_histogram(name, labels, data["buckets"], value))
+                else:
+                    lines.append(f"{name}{format_labels(labels)} {format_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def merge_value(data, previous, value):
+    if previous is None:
+        return value
+    if data["type"] == "histogram":
+        return [a + b for a, b in zip(previous, value)]
+    if data["type"] == "gauge" and data.get("aggregate") == "max":
+        return max(previous, value)
+    return previous + value
+
+
+def format_number(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def render_histogram(name, labels, buckets, state):
+    counts, total_sum = state[:-1], state[-1]
+    cumulative = 0
+    for bound, count in zip(list(buckets) + ["+Inf"], counts):
+        cumulative += count
+        yield f"{name}_bucket{format_labels({**labels, 'le': bound})} {cumulative}"
+    yield f"{name}_sum{format_labels(labels)} {format_number(total_sum)}"
+    yield f"{name}_count{format_labels(labels)} {cumulative}"
+
+
+registry = Registry()
+atexit.register(registry.flush)
+
+
+REQUEST_LATENCY = registry.histogram(
+    "codeshift_request_duration_seconds", "Request latency by URL name.", ["view", "method"],
+)
+REQUESTS = registry.counter(
+    "codeshift_requests_total", "Requests by URL name and status class.", ["view", "status"],
+)
+DB_QUERIES = registry.histogram(
+    "codeshift_db_queries_per_request", "SQL queries per request by URL name.", ["view"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+DB_TIME = registry.histogram(
+    "codeshift_db_duration_seconds", "Total SQL time per request by URL name.", ["view"],
+)
+CACHE_REQUESTS = registry.counter(
+    "codeshift_cache_requests_total", "Cache lookups by cache alias and result.", ["cache", "result"],
+)
+THROTTLED = registry.counter(
+    "codeshift_throttle_rejections_total", "Requests rejected by API throttling.", ["scope"],
+)
+TASK_DURATION = registry.histogram(
+    "codeshift_task_duration_seconds", "Duration of signal handlers and management commands.",
+    ["kind", "name"],
+)
+TASK_FAILURES = registry.counter(
+    "codeshift_task_failures_total", "Signal handlers and management commands that raised.",
+    ["kind", "name"],
+)
+
+
+def timed(kind, name=None):
+    """
+    Decorator recording the duration (and failures) of a signal handler,
+    management command or other unit of work.
+    """
+
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                TASK_FAILURES.inc(kind=kind, name=label)
+                raise
+            finally:
+                TASK_DURATION.observe(time.perf_counter() - start, kind=kind, name=label)
+
+        return wrapper
+
+    return decorator
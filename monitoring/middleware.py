@@ -0,0 +1,113 @@
+import json
+import logging
+import time
+
+from django.conf import settings
+
+from . import metrics
+from .queries import QueryRecorder, record_queries
+from .slowlog import recorder_options
+
+
+logger = logging.getLogger("monitoring.queries")
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised when a view exceeds its query budget and `QUERY_BUDGET_RAISE` is on."""
+
+
+def get_budget(url_name):
+    """
+    Return the `(max_queries, max_time_ms)` budget for a URL name, falling
+    back to the default budget from `settings.QUERY_BUDGET`.
+    """
+    config = getattr(settings, "QUERY_BUDGET", {})
+    budget = {**config.get("default", {}), **config.get("views", {}).get(url_name, {})}
+    return budget.get("queries"), budget.get("time_ms")
+
+
+class QueryBudgetMiddleware:
+    """
+    Record per-request query count, DB time, duplicate statements and the
+    slowest queries.
+
+    Every response gets a `Server-Timing` header so the numbers show up in
+    the browser dev tools. When a view goes over its budget a structured
+    log line is emitted (or `QueryBudgetExceeded` is raised if
+    `QUERY_BUDGET_RAISE` is set, which is handy in tests).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        with record_queries(QueryRecorder(**recorder_options(request))) as recorder:
+            response = self.get_response(request)
+        total_ms = (time.perf_counter() - start) * 1000
+        db_ms = recorder.duration * 1000
+
+        request.query_recorder = recorder
+        response["Server-Timing"] = (
+            f'db;dur={db_ms:.1f};desc="{recorder.count} queries", app;dur={total_ms:.1f}'
+        )
+
+        match = getattr(request, "resolver_match", None)
+        url_name = match.view_name if match else None
+        max_queries, max_time_ms = get_budget(url_name)
+
+        over_count = max_queries is not None and recorder.count > max_queries
+        over_time = max_time_ms is not None and db_ms > max_time_ms
+        if over_count or over_time:
+            self.report(request, url_name, recorder, db_ms, max_queries, max_time_ms)
+
+        return response
+
+    def report(self, request, url_name, recorder, db_ms, max_queries, max_time_ms):
+        details = {
+            "event": "query_budget_exceeded",
+            "view": url_name,
+            "method": request.method,
+            "path": request.path,
+            "queries": recorder.count,
+            "db_ms": round(db_ms, 2),
+            "budget_queries": max_queries,
+            "budget_ms": max_time_ms,
+            "duplicates": recorder.duplicates(),
+            "slowest": recorder.slowest_statements(),
+        }
+
+        if getattr(settings, "QUERY_BUDGET_RAISE", False):
+            raise QueryBudgetExceeded(json.dumps(details, indent=2))
+
+        logger.warning(json.dumps(details))
+
+
+class MetricsMiddleware:
+    """
+    Record per-URL-name latency, status and SQL metrics.
+
+    Must sit before `QueryBudgetMiddleware` so the query recorder attached
+    to the request is available once the response comes back.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        match = getattr(request, "resolver_match", None)
+        view = match.view_name if match else "unmatched"
+        metrics.REQUEST_LATENCY.observe(duration, view=view, method=request.method)
+        metrics.REQUESTS.inc(view=view, status=f"{response.status_code // 100}xx")
+
+        recorder = getattr(request, "query_recorder", None)
+        if recorder is not None:
+            metrics.DB_QUERIES.observe(recorder.count, view=view)
+            metrics.DB_TIME.observe(recorder.duration, view=view)
+
+        metrics.registry.maybe_flush()
+        return response
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SlowQuery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fingerprint', models.CharField(help_text='SHA-1 of the normalized SQL.', max_length=40, unique=True)),
+                ('database', models.CharField(default='default', max_length=100)),
+                ('normalized_sql', models.TextField()),
+                ('sample_sql', models.TextField(help_text='Most recent slow statement with this fingerprint.')),
+                ('sample_params', models.TextField(blank=True)),
+                ('view_name', models.CharField(blank=True, max_length=200)),
+                ('call_site', models.CharField(blank=True, help_text='Innermost project frame that ran the query.', max_length=500)),
+                ('stack', models.TextField(blank=True)),
+                ('calls', models.PositiveIntegerField(default=0)),
+                ('total_ms', models.FloatField(default=0)),
+                ('max_ms', models.FloatField(default=0)),
+                ('plan', models.TextField(blank=True)),
+                ('plan_captured_at', models.DateTimeField(blank=True, null=True)),
+                ('first_seen', models.DateTimeField(auto_now_add=True)),
+                ('last_seen', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Slow queries',
+                'ordering': ['-total_ms'],
+            },
+        ),
+    ]
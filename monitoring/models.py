@@ -0,0 +1,71 @@
+import uuid
+
+from django.conf import settings
+from django.db import models
+
+
+class RequestProfile(models.Model):
+    """
+    A profile of one request, captured on demand by a staff member.
+    See `monitoring.profiler.ProfilerMiddleware`.
+    """
+
+    class Mode(models.TextChoices):
+        SAMPLING = "sampling", "Sampling"
+        CPROFILE = "cprofile", "cProfile"
+
+    request_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    mode = models.CharField(max_length=10, choices=Mode.choices, default=Mode.SAMPLING)
+    method = models.CharField(max_length=10)
+    path = models.CharField(max_length=500)
+    view_name = models.CharField(max_length=200, blank=True)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
+    status_code = models.PositiveSmallIntegerField(default=0)
+    duration_ms = models.FloatField(default=0)
+    query_count = models.PositiveIntegerField(default=0)
+    db_ms = models.FloatField(default=0)
+    folded_stacks = models.TextField(blank=True, help_text="Collapsed stacks, one `frame;frame;frame count` per line.")
+    stats = models.TextField(blank=True, help_text="Top functions by cumulative time.")
+    raw_profile = models.BinaryField(blank=True, null=True, help_text="cProfile/pstats dump.")
+    sql_timeline = models.JSONField(default=list, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.method} {self.path} ({self.duration_ms:.0f} ms)"
+
+
+class SlowQuery(models.Model):
+    """
+    Slow SQL statements aggregated by normalized fingerprint.
+    See `monitoring.slowlog`.
+    """
+
+    fingerprint = models.CharField(max_length=40, unique=True, help_text="SHA-1 of the normalized SQL.")
+    database = models.CharField(max_length=100, default="default")
+    normalized_sql = models.TextField()
+    sample_sql = models.TextField(help_text="Most recent slow statement with this fingerprint.")
+    sample_params = models.TextField(blank=True)
+    view_name = models.CharField(max_length=200, blank=True)
+    call_site = models.CharField(max_length=500, blank=True, help_text="Innermost project frame that ran the query.")
+    stack = models.TextField(blank=True)
+    calls = models.PositiveIntegerField(default=0)
+    total_ms = models.FloatField(default=0)
+    max_ms = models.FloatField(default=0)
+    plan = models.TextField(blank=True)
+    plan_captured_at = models.DateTimeField(null=True, blank=True)
+    first_seen = models.DateTimeField(auto_now_add=True)
+    last_seen = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-total_ms"]
+        verbose_name_plural = "Slow queries"
+
+    def __str__(self):
+        return self.normalized_sql[:80]
+
+    @property
+    def mean_ms(self):
+        return self.total_ms / self.calls if self.calls else 0
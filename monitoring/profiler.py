@@ -0,0 +1,151 @@
+import cProfile
+import io
+import marshal
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+
+from .models import RequestProfile
+from .queries import record_queries
+
+
+class StackSampler:
+    """
+    Sample the stack of one thread at a fixed interval and count identical
+    stacks, which is exactly the "folded" input flamegraph tools expect.
+    """
+
+    def __init__(self, thread_id, interval=0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stopped.set()
+        self.thread.join()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})".replace(";", ":"))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def folded(self):
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common())
+
+
+class TimelineRecorder:
+    """Execute wrapper recording when each query started and how long it took."""
+
+    def __init__(self, started):
+        self.started = started
+        self.entries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.entries.append({
+                "start_ms": round((start - self.started) * 1000, 3),
+                "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                "sql": sql,
+            })
+
+
+def profile_mode(request):
+    """
+    Return the requested profiling mode, or None when the request did not
+    ask to be profiled (the common case, kept to two dict lookups).
+    """
+    flag = request.headers.get("X-Profile") or request.GET.get("_profile")
+    if not flag:
+        return None
+    return RequestProfile.Mode.CPROFILE if flag == "cprofile" else RequestProfile.Mode.SAMPLING
+
+
+class ProfilerMiddleware:
+    """
+    Profile a single request on demand.
+
+    Staff users trigger it with an `X-Profile: 1` header or `?_profile=1`
+    (`cprofile` instead of `1` selects the deterministic profiler). The
+    profile and the SQL timeline are stored as a `RequestProfile`, browsable
+    in the admin, and its id is returned in the `X-Profile-Id` header.
+    Requests that do not ask for a profile pay nothing beyond the flag check.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        mode = profile_mode(request) if getattr(settings, "PROFILER_ENABLED", True) else None
+        if mode is None or not request.user.is_staff:
+            return self.get_response(request)
+
+        started = time.perf_counter()
+        timeline = TimelineRecorder(started)
+        profiler = sampler = None
+
+        with record_queries(timeline):
+            if mode == RequestProfile.Mode.CPROFILE:
+                profiler = cProfile.Profile()
+                response = profiler.runcall(self.get_response, request)
+            else:
+                interval = getattr(settings, "PROFILER_SAMPLE_INTERVAL", 0.001)
+                with StackSampler(threading.get_ident(), interval) as sampler:
+                    response = self.get_response(request)
+
+        duration_ms = (time.perf_counter() - started) * 1000
+        profile = self.save(request, response, mode, duration_ms, timeline, profiler, sampler)
+        response["X-Profile-Id"] = str(profile.request_id)
+        return response
+
+    def save(self, request, response, mode, duration_ms, timeline, profiler, sampler):
+        match = getattr(request, "resolver_match", None)
+        profile = RequestProfile(
+            mode=mode,
+            method=request.method,
+            path=request.get_full_path()[:500],
+            view_name=match.view_name if match else "",
+            user=request.user,
+            status_code=response.status_code,
+            duration_ms=duration_ms,
+            query_count=len(timeline.entries),
+            db_ms=sum(entry["duration_ms"] for entry in timeline.entries),
+            sql_timeline=timeline.entries,
+        )
+
+        if profiler is not None:
+            profiler.create_stats()
+            profile.raw_profile = marshal.dumps(profiler.stats)
+            output = io.StringIO()
+            pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(40)
+            profile.stats = output.getvalue()
+        else:
+            profile.folded_stacks = sampler.folded()
+
+        profile.save()
+        self.prune()
+        return profile
+
+    def prune(self):
+        """Keep only the newest `PROFILER_MAX_STORED` profiles."""
+        keep = getattr(settings, "PROFILER_MAX_STORED", 200)
+        stale = RequestProfile.objects.values_list("pk", flat=True)[keep:]
+        RequestProfile.objects.filter(pk__in=list(stale)).delete()
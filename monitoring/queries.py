@@ -0,0 +1,86 @@
+import heapq
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from django.db import connections
+
+
+IN_LIST_RE = re.compile(r"IN \((?:%s, )*%s\)")
+LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+
+
+def fingerprint(sql):
+    """
+    Normalize a SQL statement so that queries differing only in literal
+    values or the length of an `IN (...)` list share one fingerprint.
+    """
+    sql = IN_LIST_RE.sub("IN (...)", sql)
+    return LITERAL_RE.sub("?", sql)
+
+
+class QueryRecorder:
+    """
+    Database execute wrapper that records query statistics for one request.
+
+    Kept deliberately cheap: per query it takes two `perf_counter` readings,
+    bumps a dict counter keyed by the raw SQL (ORM SQL is already
+    parameterized) and maintains a small heap of the slowest statements.
+    Normalization into fingerprints only happens when a report is built.
+    """
+
+    def __init__(self, keep_slowest=5, slow_threshold=None, on_slow=None):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+        self.slowest = []
+        self.keep_slowest = keep_slowest
+        self.slow_threshold = slow_threshold
+        self.on_slow = on_slow
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.count += 1
+            self.duration += duration
+            self.statements[sql] += 1
+
+            entry = (duration, self.count, sql)
+            if len(self.slowest) < self.keep_slowest:
+                heapq.heappush(self.slowest, entry)
+            elif duration > self.slowest[0][0]:
+                heapq.heapreplace(self.slowest, entry)
+
+            if self.on_slow is not None and duration >= self.slow_threshold:
+                self.on_slow(sql, params, many, duration, context)
+
+    def duplicates(self, minimum=2):
+        """Return `{fingerprint: count}` for statements run more than once."""
+        fingerprints = Counter()
+        for sql, count in self.statements.items():
+            fingerprints[fingerprint(sql)] += count
+        return {sql: count for sql, count in fingerprints.most_common() if count >= minimum}
+
+    def slowest_statements(self):
+        """Return `(duration_ms, sql)` pairs, slowest first."""
+        return [
+            (round(duration * 1000, 2), sql)
+            for duration, _, sql in sorted(self.slowest, reverse=True)
+        ]
+
+
+@contextmanager
+def record_queries(recorder=None):
+    """
+    Install a `QueryRecorder` on every configured database connection for
+    the duration of the block.
+    """
+    recorder = recorder or QueryRecorder()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder))
+        yield recorder
@@ -0,0 +1,186 @@
+import hashlib
+import logging
+import os
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.db import close_old_connections, connections, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .queries import fingerprint
+
+
+logger = logging.getLogger("monitoring.slowlog")
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+state = threading.local()
+executor = None
+
+
+def get_executor():
+    global executor
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-log")
+    return executor
+
+
+def recorder_options(request=None):
+    """
+    Keyword arguments for `QueryRecorder` that feed queries slower than
+    `SLOW_QUERY_THRESHOLD_MS` into the slow-query log.
+    """
+    threshold_ms = getattr(settings, "SLOW_QUERY_THRESHOLD_MS", None)
+    if threshold_ms is None:
+        return {}
+    return {"slow_threshold": threshold_ms / 1000, "on_slow": partial(capture, request=request)}
+
+
+def call_site():
+    """
+    Return `(innermost project frame, formatted project stack)` for the
+    current call, skipping Django, third-party and monitoring frames.
+    """
+    root = str(settings.BASE_DIR)
+    frames = [
+        frame for frame in traceback.extract_stack()
+        if frame.filename.startswith(root)
+        and "site-packages" not in frame.filename
+        and os.path.dirname(frame.filename) != PACKAGE_DIR
+    ]
+    if not frames:
+        return "", ""
+    innermost = frames[-1]
+    location = f"{innermost.filename[len(root) + 1:]}:{innermost.lineno} in {innermost.name}"
+    return location, "".join(traceback.format_list(frames))
+
+
+def capture(sql, params, many, duration, context, request=None):
+    """
+    Called from the execute wrapper for a slow statement. Only gathers the
+    cheap, request-bound context here; storing and EXPLAIN happen on a
+    background thread unless `SLOW_QUERY_ASYNC` is off.
+    """
+    if getattr(state, "busy", False):
+        # Our own bookkeeping queries are never recorded.
+        return
+
+    match = getattr(request, "resolver_match", None) if request is not None else None
+    location, stack = call_site()
+    event = {
+        "sql": sql,
+        "params": params if not many else None,
+        "many": many,
+        "duration_ms": duration * 1000,
+        "database": context["connection"].alias,
+        "view_name": match.view_name if match else "",
+        "call_site": location,
+        "stack": stack,
+    }
+
+    if getattr(settings, "SLOW_QUERY_ASYNC", True):
+        get_executor().submit(store_in_background, event)
+    else:
+        store(event)
+
+
+def store_in_background(event):
+    close_old_connections()
+    try:
+        store(event)
+    except Exception:
+        logger.exception("Could not record slow query")
+
+
+def store(event):
+    state.busy = True
+    try:
+        aggregate(event)
+    finally:
+        state.busy = False
+
+
+def aggregate(event):
+    """Aggregate a slow statement into its fingerprint row and refresh the plan if due."""
+    from .models import SlowQuery
+
+    normalized = fingerprint(event["sql"])
+    digest = hashlib.sha1(normalized.encode()).hexdigest()
+    sample = {
+        "sample_sql": event["sql"],
+        "sample_params": repr(event["params"])[:2000],
+        "view_name": event["view_name"],
+        "call_site": event["call_site"][:500],
+        "stack": event["stack"],
+    }
+
+    updated = SlowQuery.objects.filter(fingerprint=digest).update(
+        calls=F("calls") + 1,
+        total_ms=F("total_ms") + event["duration_ms"],
+        max_ms=Greatest("max_ms", event["duration_ms"]),
+        last_seen=timezone.now(),
+        **sample,
+    )
+    if not updated:
+        SlowQuery.objects.get_or_create(
+            fingerprint=digest,
+            defaults={
+                "database": event["database"],
+                "normalized_sql": normalized,
+                "calls": 1,
+                "total_ms": event["duration_ms"],
+                "max_ms": event["duration_ms"],
+                **sample,
+            },
+        )
+
+    interval = timedelta(seconds=getattr(settings, "SLOW_QUERY_EXPLAIN_INTERVAL", 3600))
+    due = SlowQuery.objects.filter(fingerprint=digest).exclude(plan_captured_at__gte=timezone.now() - interval)
+    if event["many"] or not due.exists():
+        return
+
+    plan = explain(event["database"], event["sql"], event["params"])
+    if plan:
+        SlowQuery.objects.filter(fingerprint=digest).update(plan=plan, plan_captured_at=timezone.now())
+
+
+def explain(alias, sql, params):
+    """
+    Return the query plan: `EXPLAIN (ANALYZE, BUFFERS)` for reads on
+    PostgreSQL (with a statement timeout), `EXPLAIN QUERY PLAN` on SQLite.
+    Writes are never run under ANALYZE.
+    """
+    statement = sql.lstrip().upper()
+    if not statement.startswith(EXPLAINABLE):
+        return ""
+
+    connection = connections[alias]
+    if connection.vendor == "postgresql":
+        is_read = statement.startswith(("SELECT", "WITH"))
+        prefix = "EXPLAIN (ANALYZE, BUFFERS) " if is_read else "EXPLAIN "
+    elif connection.vendor == "sqlite":
+        prefix = "EXPLAIN QUERY PLAN "
+    else:
+        prefix = "EXPLAIN "
+
+    try:
+        with transaction.atomic(using=alias), connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                timeout_ms = int(getattr(settings, "SLOW_QUERY_EXPLAIN_TIMEOUT_MS", 5000))
+                cursor.execute(f"SET LOCAL statement_timeout = {timeout_ms}")
+            cursor.execute(prefix + sql, params)
+            rows = cursor.fetchall()
+    except Exception as exc:
+        return f"EXPLAIN failed: {exc}"
+
+    if connection.vendor == "sqlite":
+        # (id, parent, notused, detail)
+        return "\n".join(row[-1] for row in rows)
+    return "\n".join(" ".join(str(column) for column in row) for row in rows)
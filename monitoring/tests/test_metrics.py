@@ -0,0 +1,104 @@
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from monitoring.metrics import CACHE_REQUESTS, Registry, registry
+
+
+class RegistryTests(TestCase):
+    """
+    Tests for in-process aggregation and the Prometheus text format.
+    """
+
+    def test_renders_counters_and_histograms(self):
+        """Histograms are rendered with cumulative buckets, sum and count."""
+        local = Registry()
+        hits = local.counter("test_hits_total", "Hits.", ["view"])
+        latency = local.histogram("test_latency_seconds", "Latency.", ["view"], buckets=(0.1, 1))
+        hits.inc(view="home")
+        hits.inc(2, view="home")
+        latency.observe(0.05, view="home")
+        latency.observe(0.5, view="home")
+
+        output = local.render()
+
+        self.assertIn("# TYPE test_hits_total counter", output)
+        self.assertIn('test_hits_total{view="home"} 3', output)
+        self.assertIn('test_latency_seconds_bucket{view="home",le="0.1"} 1', output)
+        self.assertIn('test_latency_seconds_bucket{view="home",le="1"} 2', output)
+        self.assertIn('test_latency_seconds_bucket{view="home",le="+Inf"} 2', output)
+        self.assertIn('test_latency_seconds_count{view="home"} 2', output)
+
+    def test_merges_snapshots_of_other_processes(self):
+        """Counters written by sibling workers are summed; stale gauges are dropped."""
+        with tempfile.TemporaryDirectory() as directory, override_settings(METRICS_DIR=directory):
+            local = Registry()
+            hits = local.counter("test_hits_total", "Hits.")
+            depth = local.gauge("test_depth", "Depth.", aggregate="max")
+            hits.inc(5)
+            depth.set(3)
+
+            other = local.snapshot()
+            other["pid"] = 0
+            other["metrics"]["test_hits_total"]["values"] = [[[], 7]]
+            Path(directory, "0.json").write_text(json.dumps(other))
+
+            stale = local.snapshot()
+            stale["time"] = time.time() - 3600
+            stale["metrics"]["test_depth"]["values"] = [[[], 99]]
+            Path(directory, "1.json").write_text(json.dumps(stale))
+
+            output = local.render()
+
+        self.assertIn("test_hits_total 17", output)
+        self.assertIn("test_depth 3", output)
+
+
+class MetricsInstrumentationTests(TestCase):
+    """
+    Tests for the request and cache instrumentation and the endpoint.
+    """
+
+    @override_settings(METRICS_ALLOWED_IPS=["127.0.0.1"])
+    def test_endpoint_reports_request_metrics(self):
+        """Requests are recorded per URL name and exposed to local scrapers."""
+        self.client.get(reverse("home"))
+        response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(response.status_code, 200)
+        body = response.content.decode()
+        self.assertIn('codeshift_request_duration_seconds_count{view="home",method="GET"}', body)
+        self.assertIn('codeshift_db_queries_per_request_bucket{view="home"', body)
+
+    @override_settings(METRICS_ALLOWED_IPS=[], METRICS_TOKEN="secret")
+    def test_endpoint_requires_allowed_ip_or_token(self):
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 403)
+        response = self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer secret")
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_local_requests_need_the_token_by_default(self):
+        """A reverse proxy on the same host forwards every request from 127.0.0.1."""
+        response = self.client.get(reverse("metrics"), REMOTE_ADDR="127.0.0.1")
+        self.assertEqual(response.status_code, 403)
+
+    def test_cache_hits_and_misses_are_counted(self):
+        """The metered cache backend feeds the hit-ratio counters."""
+        before = dict(CACHE_REQUESTS.values)
+        cache.set("metrics-test", 1)
+        cache.get("metrics-test")
+        cache.get("metrics-test-missing")
+        cache.get_many(["metrics-test", "metrics-test-missing"])
+
+        def delta(result):
+            key = ("default", result)
+            return CACHE_REQUESTS.values.get(key, 0) - before.get(key, 0)
+
+        self.assertEqual(delta("hit"), 2)
+        self.assertEqual(delta("miss"), 2)
+        self.assertIn("codeshift_cache_requests_total", registry.render())
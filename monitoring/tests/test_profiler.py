@@ -0,0 +1,82 @@
+import marshal
+
+from django.test import TestCase
+from django.urls import reverse
+
+from accounts.models import User
+from monitoring.models import RequestProfile
+
+
+class ProfilerMiddlewareTests(TestCase):
+    """
+    Tests for on-demand request profiling.
+    """
+
+    def setUp(self):
+        self.staff = User.objects.create_user(
+            username="staff", email="staff@example.com", password="pass12345", is_staff=True, is_superuser=True
+        )
+        self.reader = User.objects.create_user(username="reader", email="reader@example.com", password="pass12345")
+
+    def test_untriggered_requests_are_not_profiled(self):
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse("home"))
+
+        self.assertNotIn("X-Profile-Id", response)
+        self.assertFalse(RequestProfile.objects.exists())
+
+    def test_non_staff_cannot_trigger_profiling(self):
+        self.client.force_login(self.reader)
+        response = self.client.get(reverse("home"), HTTP_X_PROFILE="1")
+
+        self.assertNotIn("X-Profile-Id", response)
+        self.assertFalse(RequestProfile.objects.exists())
+
+    def test_sampling_profile_with_sql_timeline(self):
+        """The header stores folded stacks and the SQL timeline under the request id."""
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse("home"), HTTP_X_PROFILE="1")
+
+        profile = RequestProfile.objects.get(request_id=response["X-Profile-Id"])
+        self.assertEqual(profile.mode, RequestProfile.Mode.SAMPLING)
+        self.assertEqual(profile.view_name, "home")
+        self.assertEqual(profile.user, self.staff)
+        self.assertGreater(profile.query_count, 0)
+        self.assertEqual(len(profile.sql_timeline), profile.query_count)
+        self.assertIn("sql", profile.sql_timeline[0])
+
+    def test_cprofile_mode_via_query_flag(self):
+        """`?_profile=cprofile` stores a pstats dump and a text summary."""
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse("home") + "?_profile=cprofile")
+
+        profile = RequestProfile.objects.get(request_id=response["X-Profile-Id"])
+        self.assertEqual(profile.mode, RequestProfile.Mode.CPROFILE)
+        self.assertIn("cumulative", profile.stats)
+        self.assertTrue(marshal.loads(bytes(profile.raw_profile)))
+
+    def test_admin_download(self):
+        """Staff can download the profile from the admin."""
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse("home"), HTTP_X_PROFILE="1")
+        profile = RequestProfile.objects.get(request_id=response["X-Profile-Id"])
+
+        download = self.client.get(reverse("admin:monitoring_requestprofile_download", args=[profile.pk]))
+        self.assertEqual(download.status_code, 200)
+        self.assertIn(".folded", download["Content-Disposition"])
+
+        changelist = self.client.get(reverse("admin:monitoring_requestprofile_changelist"))
+        self.assertEqual(changelist.status_code, 200)
+
+    def test_admin_download_requires_view_permission(self):
+        """Staff without permission on profiles cannot download their SQL."""
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse("home"), HTTP_X_PROFILE="1")
+        profile = RequestProfile.objects.get(request_id=response["X-Profile-Id"])
+
+        other_staff = User.objects.create_user(
+            username="editor", email="editor@example.com", password="pass12345", is_staff=True
+        )
+        self.client.force_login(other_staff)
+        download = self.client.get(reverse("admin:monitoring_requestprofile_download", args=[profile.pk]))
+        self.assertEqual(download.status_code, 403)
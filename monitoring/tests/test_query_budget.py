@@ -0,0 +1,62 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from blogs.models import Category
+from monitoring.middleware import QueryBudgetExceeded
+from monitoring.queries import fingerprint, record_queries
+
+
+class QueryRecorderTests(TestCase):
+    """
+    Tests for the execute wrapper that records per-request query statistics.
+    """
+
+    def test_counts_queries_and_duplicates(self):
+        """Repeated statements are grouped under one fingerprint."""
+        Category.objects.create(name="Tech")
+        with record_queries() as recorder:
+            for _ in range(3):
+                list(Category.objects.filter(name="Tech"))
+
+        self.assertEqual(recorder.count, 3)
+        self.assertEqual(list(recorder.duplicates().values()), [3])
+        self.assertEqual(len(recorder.slowest_statements()), 3)
+
+    def test_fingerprint_collapses_literals_and_in_lists(self):
+        """Literal values and IN-list lengths do not split fingerprints."""
+        self.assertEqual(
+            fingerprint("SELECT 1 FROM t WHERE id IN (%s, %s, %s) LIMIT 21"),
+            fingerprint("SELECT 1 FROM t WHERE id IN (%s) LIMIT 5"),
+        )
+
+
+class QueryBudgetMiddlewareTests(TestCase):
+    """
+    Tests for the middleware enforcing per-view query budgets.
+    """
+
+    def test_server_timing_header(self):
+        """Every response reports DB time and query count."""
+        response = self.client.get(reverse("home"))
+        self.assertIn("db;dur=", response["Server-Timing"])
+        self.assertIn("queries", response["Server-Timing"])
+
+    @override_settings(QUERY_BUDGET={"views": {"home": {"queries": 0}}})
+    def test_budget_exceeded_is_logged(self):
+        """Going over budget emits a structured warning."""
+        with self.assertLogs("monitoring.queries", level="WARNING") as logs:
+            self.client.get(reverse("home"))
+        self.assertIn('"event": "query_budget_exceeded"', logs.output[0])
+        self.assertIn('"view": "home"', logs.output[0])
+
+    @override_settings(QUERY_BUDGET={"views": {"home": {"queries": 0}}}, QUERY_BUDGET_RAISE=True)
+    def test_budget_exceeded_raises_when_configured(self):
+        """Tests can opt into a hard failure."""
+        with self.assertRaises(QueryBudgetExceeded):
+            self.client.get(reverse("home"))
+
+    @override_settings(QUERY_BUDGET={"views": {"home": {"queries": 100}}}, QUERY_BUDGET_RAISE=True)
+    def test_within_budget_passes(self):
+        """Views inside their budget are left alone."""
+        response = self.client.get(reverse("home"))
+        self.assertEqual(response.status_code, 200)
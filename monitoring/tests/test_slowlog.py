@@ -0,0 +1,52 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from accounts.models import User
+from blogs.models import Category
+from monitoring.models import SlowQuery
+from monitoring.queries import QueryRecorder, record_queries
+from monitoring.slowlog import recorder_options
+
+
+@override_settings(SLOW_QUERY_THRESHOLD_MS=0, SLOW_QUERY_ASYNC=False)
+class SlowQueryLogTests(TestCase):
+    """
+    Tests for the slow-query recorder and its EXPLAIN capture.
+    """
+
+    def test_slow_queries_are_aggregated_by_fingerprint(self):
+        """Statements differing only in parameters share one row."""
+        with record_queries(QueryRecorder(**recorder_options())):
+            list(Category.objects.filter(name="Tech"))
+            list(Category.objects.filter(name="Life"))
+
+        entry = SlowQuery.objects.get(normalized_sql__contains='"blogs_category"')
+        self.assertEqual(entry.calls, 2)
+        self.assertGreaterEqual(entry.total_ms, entry.max_ms)
+        self.assertIn("test_slowlog.py", entry.call_site)
+
+    def test_sqlite_plan_is_captured(self):
+        """On SQLite the plan comes from EXPLAIN QUERY PLAN."""
+        with record_queries(QueryRecorder(**recorder_options())):
+            list(Category.objects.filter(slug="tech"))
+
+        entry = SlowQuery.objects.get(normalized_sql__contains='"blogs_category"')
+        self.assertIn("USING INDEX", entry.plan)
+        self.assertIsNotNone(entry.plan_captured_at)
+
+    def test_view_name_is_recorded(self):
+        """Queries run by a view are attributed to its URL name."""
+        self.client.get(reverse("home"))
+        self.assertTrue(SlowQuery.objects.filter(view_name="home").exists())
+
+    @override_settings(SLOW_QUERY_THRESHOLD_MS=None)
+    def test_disabled_without_threshold(self):
+        with record_queries(QueryRecorder(**recorder_options())):
+            User.objects.count()
+        self.assertFalse(SlowQuery.objects.exists())
+
+    def test_admin_lists_slow_queries(self):
+        admin = User.objects.create_superuser("admin", "admin@example.com", "admin12345")
+        self.client.force_login(admin)
+        response = self.client.get(reverse("admin:monitoring_slowquery_changelist"))
+        self.assertEqual(response.status_code, 200)
@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.views import View
+
+from .metrics import registry
+
+
+class MetricsView(View):
+    """
+    Expose metrics in the Prometheus text format.
+
+    Requires the `Authorization: Bearer <METRICS_TOKEN>` header, unless
+    the request comes from an explicitly configured `METRICS_ALLOWED_IPS`.
+    Nothing is allowed by address by default: behind a local reverse proxy
+    every request arrives from 127.0.0.1.
+    """
+
+    def get(self, request, *args, **kwargs):
+        token = getattr(settings, "METRICS_TOKEN", None)
+        allowed_ips = getattr(settings, "METRICS_ALLOWED_IPS", [])
+
+        authorized = request.META.get("REMOTE_ADDR") in allowed_ips
+        if token and request.headers.get("Authorization") == f"Bearer {token}":
+            authorized = True
+        if not authorized:
+            return HttpResponseForbidden()
+
+        return HttpResponse(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,20 @@
+from django.contrib import admin
+
+from .models import Issue
+
+
+@admin.register(Issue)
+class IssueAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for newsletter issues.
+    Shows delivery progress; issues are created when posts are published.
+    """
+
+    list_display = ("post", "status", "sent_count", "failed_count", "started_at", "finished_at")
+    list_filter = ("status",)
+    search_fields = ("post__title",)
+    list_select_related = ("post",)
+    readonly_fields = [field.name for field in Issue._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
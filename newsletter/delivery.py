@@ -0,0 +1,199 @@
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db.models import F
+from django.template.loader import get_template
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.models import ReaderProfile
+from blogs.models import Post
+from jobs.queue import enqueue, job
+from monitoring.metrics import registry
+from .models import Issue
+
+
+MESSAGES = registry.counter(
+    "codeshift_newsletter_messages_total", "Newsletter messages by outcome (sent, refused).", ["outcome"],
+)
+
+
+def enabled():
+    return getattr(settings, "NEWSLETTER_ENABLED", False)
+
+
+def absolute(location):
+    return settings.SITE_URL.rstrip("/") + location
+
+
+class RateLimiter:
+    """
+    Spaces out sends across all threads to at most `rate` per second
+    (no limit when `rate` is None).
+    """
+
+    def __init__(self, rate):
+        self.interval = 1 / rate if rate else 0
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class Sender:
+    """
+    Sends messages on `concurrency` threads. Each thread opens one
+    connection to the mail server and reuses it for every message it sends,
+    instead of a connect/login/quit per message.
+    """
+
+    def __init__(self, concurrency=1, rate=None):
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(rate)
+        self.executor = ThreadPoolExecutor(concurrency, thread_name_prefix="newsletter")
+        self.local = threading.local()
+        self.connections = []
+        self.lock = threading.Lock()
+
+    def connection(self):
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = self.local.connection = get_connection()
+            connection.open()
+            with self.lock:
+                self.connections.append(connection)
+        return connection
+
+    def deliver(self, message):
+        connection = self.connection()
+        try:
+            return connection.send_messages([message])
+        except smtplib.SMTPServerDisconnected:
+            # Servers drop idle or long-lived connections; retry once on a new one.
+            connection.close()
+            connection.open()
+            return connection.send_messages([message])
+
+    def send_chunk(self, messages):
+        sent = refused = 0
+        for message in messages:
+            self.limiter.wait()
+            try:
+                sent += self.deliver(message)
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError):
+                refused += 1
+        return sent, refused
+
+    def send(self, messages):
+        """
+        Send `messages` and return how many were sent and refused. Any other
+        error (server down, bad credentials) is raised.
+        """
+        chunks = [messages[index::self.concurrency] for index in range(self.concurrency)]
+        results = list(self.executor.map(self.send_chunk, chunks))
+        sent, refused = sum(result[0] for result in results), sum(result[1] for result in results)
+        MESSAGES.inc(sent, outcome="sent")
+        MESSAGES.inc(refused, outcome="refused")
+        return sent, refused
+
+    def close(self):
+        self.executor.shutdown()
+        for connection in self.connections:
+            connection.close()
+
+
+def subscribers(after, limit):
+    """The next `limit` subscribed readers with an id above `after` (keyset pagination)."""
+    return list(
+        ReaderProfile.objects.filter(subscribed=True, pk__gt=after, user__is_active=True)
+        .exclude(user__email="")
+        .order_by("pk")
+        .values("pk", email=F("user__email"), username=F("user__username"), first_name=F("user__first_name"))
+        [:limit]
+    )
+
+
+def build_messages(templates, context, readers):
+    """One message per reader, rendered from templates compiled once per delivery."""
+    text, html = templates
+    subject = f"New post: {context['post'].title}"
+    messages = []
+    for reader in readers:
+        personal = {**context, "reader": reader}
+        message = EmailMultiAlternatives(subject, text.render(personal), to=[reader["email"]])
+        message.attach_alternative(html.render(personal), "text/html")
+        messages.append(message)
+    return messages
+
+
+def deliver(issue, deadline=None):
+    """
+    Mail `issue` to subscribed readers, resuming after `last_reader_id`.
+
+    Progress is saved after every batch of NEWSLETTER_BATCH_SIZE readers, so
+    after a crash at most one batch is mailed twice. Stops early once the
+    `time.monotonic()` `deadline` has passed; returns whether every reader
+    has been mailed.
+    """
+    if issue.status == Issue.Status.SENT:
+        return True
+    if issue.started_at is None:
+        issue.status, issue.started_at = Issue.Status.SENDING, timezone.now()
+        issue.save(update_fields=["status", "started_at"])
+
+    post = Post.objects.select_related("author__user").get(pk=issue.post_id)
+    templates = (get_template("newsletter/post.txt"), get_template("newsletter/post.html"))
+    context = {
+        "post": post,
+        "post_url": absolute(reverse("post-detail", kwargs={"slug": post.slug})),
+        "preferences_url": absolute(reverse("profile")),
+    }
+    batch_size = getattr(settings, "NEWSLETTER_BATCH_SIZE", 500)
+    sender = Sender(getattr(settings, "NEWSLETTER_CONCURRENCY", 4), getattr(settings, "NEWSLETTER_RATE_LIMIT", None))
+
+    try:
+        while readers := subscribers(issue.last_reader_id, batch_size):
+            sent, refused = sender.send(build_messages(templates, context, readers))
+            Issue.objects.filter(pk=issue.pk).update(
+                last_reader_id=readers[-1]["pk"],
+                sent_count=F("sent_count") + sent,
+                failed_count=F("failed_count") + refused,
+            )
+            issue.last_reader_id = readers[-1]["pk"]
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+    finally:
+        sender.close()
+
+    issue.status, issue.finished_at = Issue.Status.SENT, timezone.now()
+    issue.save(update_fields=["status", "finished_at"])
+    return True
+
+
+@job("newsletter.send_issue", queue="newsletter")
+def send_issue(issue_id):
+    """
+    Deliver an issue for up to NEWSLETTER_JOB_SECONDS, then queue the rest
+    as a new job, so no single job outlives the worker's lock timeout.
+    """
+    issue = Issue.objects.filter(pk=issue_id).first()
+    if issue is None:
+        return
+    if not deliver(issue, deadline=time.monotonic() + getattr(settings, "NEWSLETTER_JOB_SECONDS", 60)):
+        schedule(issue)
+
+
+def schedule(issue):
+    enqueue(send_issue, issue.pk, dedupe_key=f"newsletter:{issue.pk}")
@@ -0,0 +1,39 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from blogs.models import Post
+from monitoring.metrics import timed
+from newsletter.delivery import deliver
+from newsletter.models import Issue
+
+
+class Command(BaseCommand):
+    """
+    Mail the newsletter of a published post to subscribed readers, in this
+    process rather than a background job.
+
+    Issues are normally sent by the job queued on publish; use this to send
+    one for a post published before the newsletter existed, or to finish an
+    interrupted delivery. Readers already mailed are skipped.
+    """
+
+    help = "Send (or resume) the newsletter for a published post."
+
+    def add_arguments(self, parser):
+        parser.add_argument("slug", help="Slug of the published post.")
+
+    @timed("command", "send_newsletter")
+    def handle(self, *args, **options):
+        post = Post.published.filter(slug=options["slug"]).first()
+        if post is None:
+            raise CommandError(f"No published post with slug {options['slug']!r}.")
+
+        started = time.perf_counter()
+        issue, _ = Issue.objects.get_or_create(post=post)
+        deliver(issue)
+        issue.refresh_from_db()
+        self.stdout.write(self.style.SUCCESS(
+            f"Sent {issue.sent_count} newsletters ({issue.failed_count} refused) "
+            f"in {time.perf_counter() - started:.1f}s"
+        ))
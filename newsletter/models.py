@@ -0,0 +1,31 @@
+from django.db import models
+
+
+class Issue(models.Model):
+    """
+    The newsletter announcing one published post.
+
+    Readers are mailed in primary key order and `last_reader_id` is moved
+    forward after every batch, so an interrupted delivery resumes where it
+    stopped. See `newsletter.delivery`.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        SENDING = "sending", "Sending"
+        SENT = "sent", "Sent"
+
+    post = models.OneToOneField("blogs.Post", on_delete=models.CASCADE, related_name="newsletter_issue")
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    last_reader_id = models.PositiveBigIntegerField(default=0, help_text="Readers up to this id have been mailed.")
+    sent_count = models.PositiveIntegerField(default=0)
+    failed_count = models.PositiveIntegerField(default=0, help_text="Recipients the mail server refused.")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Newsletter: {self.post}"
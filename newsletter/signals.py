@@ -0,0 +1,36 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from blogs.models import Post
+from blogs.signals import is_view_increment, posts_published
+from monitoring.metrics import timed
+from . import delivery
+from .models import Issue
+
+
+@receiver(post_save, sender=Post)
+@timed("signal")
+def announce_published_post(sender, instance, update_fields=None, **kwargs):
+    """
+    Queue the newsletter for a post the first time it is published.
+    """
+    if not delivery.enabled() or instance.status != Post.Status.PUBLISHED or is_view_increment(update_fields):
+        return
+    issue, created = Issue.objects.get_or_create(post=instance)
+    if created:
+        delivery.schedule(issue)
+
+
+@receiver(posts_published)
+@timed("signal")
+def announce_bulk_published_posts(sender, posts, **kwargs):
+    """
+    `announce_published_post` for posts published in bulk: the issues
+    missing for the set are inserted at once, then queued.
+    """
+    if not delivery.enabled():
+        return
+    announced = set(Issue.objects.filter(post__in=posts).values_list("post_id", flat=True))
+    issues = Issue.objects.bulk_create([Issue(post=post) for post in posts if post.pk not in announced])
+    for issue in issues:
+        delivery.schedule(issue)
@@ -0,0 +1,99 @@
+from io import StringIO
+
+import pytest
+from django.core import mail
+from django.core.management import call_command
+
+from accounts.models import ReaderProfile
+from blogs import bulk
+from blogs.models import Post
+from jobs.models import Job
+from newsletter.models import Issue
+
+
+@pytest.mark.django_db
+class TestNewsletter:
+    """Test suite for batched newsletter delivery."""
+
+    @pytest.fixture(autouse=True)
+    def newsletter_settings(self, settings):
+        settings.NEWSLETTER_ENABLED = True
+        settings.NEWSLETTER_BATCH_SIZE = 2
+        settings.NEWSLETTER_CONCURRENCY = 2
+        settings.NEWSLETTER_RATE_LIMIT = None
+        settings.SITE_URL = "https://blog.example"
+
+    @pytest.fixture
+    def readers(self, django_user_model):
+        profiles = []
+        for index in range(5):
+            user = django_user_model.objects.create_user(
+                username=f"reader{index}", email=f"reader{index}@example.com", password="testpass123"
+            )
+            profiles.append(ReaderProfile.objects.create(user=user, subscribed=index != 2))
+        return profiles
+
+    def publish(self, author):
+        return Post.objects.create(author=author, title="Big News", content="Some **news**", status=Post.Status.PUBLISHED)
+
+    def test_publishing_mails_every_subscriber(self, author, readers, run_jobs):
+        post = self.publish(author)
+        post.save()  # later edits don't send it again
+        assert Job.objects.filter(name="newsletter.send_issue").count() == 1
+
+        run_jobs()
+        assert sorted(message.to[0] for message in mail.outbox) == [
+            "reader0@example.com", "reader1@example.com", "reader3@example.com", "reader4@example.com",
+        ]
+        message = mail.outbox[0]
+        assert message.subject == "New post: Big News"
+        assert f"https://blog.example/{post.slug}/" in message.body
+        assert "Hi reader" in message.alternatives[0][0]
+
+        issue = Issue.objects.get(post=post)
+        assert (issue.status, issue.sent_count) == (Issue.Status.SENT, 4)
+
+    def test_excerpt_is_escaped_once(self, author, readers, run_jobs):
+        Post.objects.create(
+            author=author, title="Cartoons", content='Tom & Jerry <3 "quoted"', status=Post.Status.PUBLISHED,
+        )
+        run_jobs()
+        message = mail.outbox[0]
+        assert 'Tom & Jerry <3 "quoted"' in message.body
+        assert "Tom &amp; Jerry &lt;3 &quot;quoted&quot;" in message.alternatives[0][0]
+
+    def test_bulk_publishing_mails_every_new_post(self, author, readers, run_jobs):
+        announced = self.publish(author)
+        for index in range(3):
+            Post.objects.create(author=author, title=f"Draft {index}", content="Text")
+        Post.objects.filter(pk=announced.pk).update(status=Post.Status.DRAFT)
+
+        assert bulk.publish(Post.objects.all()) == 4
+        assert Issue.objects.count() == 4
+        assert Job.objects.filter(name="newsletter.send_issue").count() == 4
+
+        run_jobs()
+        assert len(mail.outbox) == 4 * 4
+
+    def test_drafts_are_not_sent(self, author, readers, run_jobs):
+        Post.objects.create(author=author, title="Draft", content="Text")
+        run_jobs()
+        assert mail.outbox == []
+
+    def test_interrupted_delivery_resumes(self, author, readers, settings):
+        settings.NEWSLETTER_ENABLED = False
+        post = self.publish(author)
+        Issue.objects.create(post=post, status=Issue.Status.SENDING, last_reader_id=readers[1].pk, sent_count=2)
+
+        out = StringIO()
+        call_command("send_newsletter", post.slug, stdout=out)
+        assert sorted(message.to[0] for message in mail.outbox) == ["reader3@example.com", "reader4@example.com"]
+        assert "Sent 4 newsletters" in out.getvalue()
+
+    def test_jobs_stop_after_their_time_slice(self, author, readers, settings, run_jobs):
+        settings.NEWSLETTER_JOB_SECONDS = 0
+        post = self.publish(author)
+
+        run_jobs()  # each job sends one batch, then queues the next
+        assert len(mail.outbox) == 4
+        assert Issue.objects.get(post=post).status == Issue.Status.SENT
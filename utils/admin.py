@@ -0,0 +1,135 @@
+import hashlib
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.contrib.admin.templatetags.admin_list import date_hierarchy
+from django.contrib.postgres.search import SearchQuery
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+def estimated_count(queryset):
+    """
+    Rows in the table of an unfiltered `queryset` according to PostgreSQL's
+    planner statistics, or None when there is no usable estimate (filtered
+    queryset, other database, table never analyzed).
+    """
+    if queryset.query.where or queryset.query.distinct:
+        return None
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [queryset.model._meta.db_table])
+        row = cursor.fetchone()
+    return row[0] if row and row[0] >= 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Admin paginator that skips `COUNT(*)` on unfiltered lists of tables
+    estimated above ADMIN_ESTIMATED_COUNT_THRESHOLD rows, paginating with
+    the estimate instead. Filtered lists are counted exactly.
+    """
+
+    @cached_property
+    def count(self):
+        estimate = estimated_count(self.object_list)
+        if estimate is not None and estimate > getattr(settings, "ADMIN_ESTIMATED_COUNT_THRESHOLD", 10_000):
+            return estimate
+        return super().count
+
+
+# Set while `FullTextSearchMixin` searches the `search_fields` outside the
+# full-text document.
+full_text_search = ContextVar("full_text_search", default=False)
+
+
+class FullTextSearchMixin:
+    """
+    Admin search through a PostgreSQL full-text index. `search_vector` must
+    return exactly the expression the model's GIN index is built on, or the
+    index is not used; `full_text_fields` are the `search_fields` it covers.
+    The other `search_fields` (usernames, related titles) are still searched
+    as usual. Each search selects primary keys on its own, so the full-text
+    one can use the index, and the list is filtered by their union. Other
+    databases search all `search_fields` as usual.
+    """
+
+    search_vector = None
+    full_text_fields = ()
+
+    def get_search_fields(self, request):
+        fields = super().get_search_fields(request)
+        if full_text_search.get():
+            fields = [field for field in fields if field.lstrip("^=@") not in self.full_text_fields]
+        return fields
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term or connections[queryset.db].vendor != "postgresql":
+            return super().get_search_results(request, queryset, search_term)
+        query = SearchQuery(search_term, search_type="websearch", config="english")
+        matches = queryset.annotate(document=self.search_vector()).filter(document=query).order_by().values("pk")
+
+        token = full_text_search.set(True)
+        try:
+            if self.get_search_fields(request):
+                others, _ = super().get_search_results(request, queryset, search_term)
+                matches = matches.union(others.order_by().values("pk"))
+        finally:
+            full_text_search.reset(token)
+        return queryset.filter(pk__in=matches), False
+
+
+class CachedDates:
+    """
+    Stands in for `cl.queryset` in Django's `date_hierarchy`, answering its
+    first/last date aggregate and `dates()`/`datetimes()` bucket queries
+    from the cache. Each answer is keyed by the SQL of the list's queryset,
+    so filters and searches get their own buckets.
+    """
+
+    def __init__(self, queryset):
+        self.queryset = queryset
+        self.timeout = getattr(settings, "ADMIN_DATE_HIERARCHY_CACHE_TIMEOUT", 600)
+
+    def cached(self, name, compute, *args):
+        try:
+            sql = str(self.queryset.query)
+        except EmptyResultSet:
+            return compute()
+        digest = hashlib.sha1(repr((sql, name, args)).encode()).hexdigest()
+        key = f"admin:dates:{self.queryset.model._meta.label_lower}:{digest}"
+        result = cache.get(key)
+        if result is None:
+            result = compute()
+            cache.set(key, result, self.timeout)
+        return result
+
+    def aggregate(self, **aggregates):
+        return self.cached("aggregate", lambda: self.queryset.aggregate(**aggregates), sorted(aggregates))
+
+    def dates(self, field_name, kind):
+        return self.cached("dates", lambda: list(self.queryset.dates(field_name, kind)), field_name, kind)
+
+    def datetimes(self, field_name, kind):
+        return self.cached("datetimes", lambda: list(self.queryset.datetimes(field_name, kind)), field_name, kind)
+
+
+class CachedDatesChangeList:
+    """A changelist whose `queryset` is wrapped in `CachedDates`."""
+
+    def __init__(self, changelist):
+        self.changelist = changelist
+        self.queryset = CachedDates(changelist.queryset)
+
+    def __getattr__(self, name):
+        return getattr(self.changelist, name)
+
+
+def cached_date_hierarchy(cl):
+    """Django's `date_hierarchy` with its bucket queries cached, see `CachedDates`."""
+    return date_hierarchy(CachedDatesChangeList(cl))
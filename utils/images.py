@@ -0,0 +1,25 @@
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from PIL import Image
+
+
+def downscale(field_file, max_size):
+    """
+    Shrink the image stored in `field_file` to fit within `max_size`
+    (width, height), keeping its format and aspect ratio.
+
+    Returns the new storage name (storages may pick a different one), or
+    None if the image already fits.
+    """
+    with field_file.open("rb"), Image.open(field_file) as image:
+        if image.width <= max_size[0] and image.height <= max_size[1]:
+            return None
+        image_format = image.format
+        image.thumbnail(max_size)
+        buffer = BytesIO()
+        image.save(buffer, format=image_format)
+
+    storage, name = field_file.storage, field_file.name
+    storage.delete(name)
+    return storage.save(name, ContentFile(buffer.getvalue()))
@@ -0,0 +1,154 @@
+from django.contrib.postgres.indexes import PostgresIndex
+from django.db.migrations.operations import AddField, AddIndex, RemoveIndex
+from django.db.migrations.operations.base import Operation
+from django.db.models import Index
+
+
+class AddIndexConcurrently(AddIndex):
+    """
+    `AddIndex` that builds the index with `CREATE INDEX CONCURRENTLY` on
+    PostgreSQL, so it can be applied to a live table without blocking
+    writes. Falls back to a plain `AddIndex` on other databases.
+
+    PostgreSQL cannot build indexes concurrently inside a transaction, so
+    the migration using it must set `atomic = False`.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.add_index(model, self.index, concurrently=True)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.remove_index(model, self.index, concurrently=True)
+
+    def describe(self):
+        return f"{super().describe()} (concurrently on PostgreSQL)"
+
+
+class RemoveIndexConcurrently(RemoveIndex):
+    """
+    `RemoveIndex` counterpart of `AddIndexConcurrently`, using
+    `DROP INDEX CONCURRENTLY` on PostgreSQL.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            model_state = from_state.models[app_label, self.model_name_lower]
+            index = model_state.get_index_by_name(self.name)
+            schema_editor.remove_index(model, index, concurrently=True)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            model_state = to_state.models[app_label, self.model_name_lower]
+            index = model_state.get_index_by_name(self.name)
+            schema_editor.add_index(model, index, concurrently=True)
+
+    def describe(self):
+        return f"{super().describe()} (concurrently on PostgreSQL)"
+
+
+class AddPostgresIndexConcurrently(AddIndexConcurrently):
+    """
+    `AddIndexConcurrently` for indexes only PostgreSQL can build (GIN,
+    full-text). Other databases skip it; the index stays in the migration
+    state, so models can declare it for every database.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+    def describe(self):
+        return f"{AddIndex.describe(self)} (concurrently, PostgreSQL only)"
+
+
+class RemoveFieldIndexConcurrently(Operation):
+    """
+    Drop the single-column index Django creates for a field (`db_index`,
+    foreign keys), with `DROP INDEX CONCURRENTLY` on PostgreSQL.
+
+    Database-only: pair it with the `AlterField(db_index=False)` in
+    `SeparateDatabaseAndState`, since `AlterField` itself drops the index
+    with a blocking `DROP INDEX`. The migration must set `atomic = False`.
+    """
+
+    reduces_to_sql = False
+
+    def __init__(self, model_name, field_name):
+        self.model_name = model_name
+        self.field_name = field_name
+
+    def deconstruct(self):
+        return self.__class__.__name__, [self.model_name, self.field_name], {}
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def options(self, schema_editor):
+        return {"concurrently": True} if schema_editor.connection.vendor == "postgresql" else {}
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        column = model._meta.get_field(self.field_name).column
+        for name in schema_editor._constraint_names(model, [column], index=True, type_=Index.suffix):
+            schema_editor.execute(schema_editor._delete_index_sql(model, name, **self.options(schema_editor)))
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            field = model._meta.get_field(self.field_name)
+            schema_editor.execute(schema_editor._create_index_sql(model, fields=[field], **self.options(schema_editor)))
+
+    def describe(self):
+        return f"Remove index on {self.model_name}.{self.field_name} (concurrently on PostgreSQL)"
+
+
+class AddFieldWithoutPostgresIndexes(AddField):
+    """
+    `AddField` for models declaring indexes only PostgreSQL can build (see
+    `AddPostgresIndexConcurrently`). SQLite adds most columns by rebuilding
+    the table with all of the model's indexes; there the PostgreSQL ones are
+    left out, as they were never built.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            from_state = self.without_postgres_indexes(app_label, from_state)
+            to_state = self.without_postgres_indexes(app_label, to_state)
+        super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            from_state = self.without_postgres_indexes(app_label, from_state)
+            to_state = self.without_postgres_indexes(app_label, to_state)
+        super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+    def without_postgres_indexes(self, app_label, state):
+        state = state.clone()
+        options = state.models[app_label, self.model_name_lower].options
+        options["indexes"] = [index for index in options.get("indexes", []) if not isinstance(index, PostgresIndex)]
+        state.reload_model(app_label, self.model_name_lower, delay=True)
+        return state
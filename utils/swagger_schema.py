@@ -1,6 +1,29 @@
+from drf_yasg import openapi
 from drf_yasg.inspectors import SwaggerAutoSchema
 
+
+# SWAGGER_SETTINGS["DEFAULT_INFO"]
+API_INFO = openapi.Info(
+    title="Codeshift Blog API",
+    default_version='v1',
+    description="Api description",
+    terms_of_service="https://www.google.com/policies/terms/",
+    contact=openapi.Contact(email="contact@snippets.local"),
+    license=openapi.License(name="BSD License"),
+)
+
+
 class DynamicTaggingAutoSchema(SwaggerAutoSchema):
+    """
+    Tags operations by `swagger_tag` or model, and takes per-method
+    overrides from a view's `swagger_overrides` (e.g. `{"GET":
+    {"query_serializer": ...}}`), the same keys `@swagger_auto_schema`
+    accepts, so views need not import drf_yasg.
+    """
+
+    def __init__(self, view, path, method, components, request, overrides, operation_keys=None):
+        overrides = {**getattr(view, 'swagger_overrides', {}).get(method, {}), **overrides}
+        super().__init__(view, path, method, components, request, overrides, operation_keys)
 
     def get_tags(self, operation_keys=None):
         